@@ -0,0 +1,19 @@
+"""Gunicorn server hooks, see conf/systemd/production_gunicorn.service."""
+import os
+
+from prometheus_client import multiprocess
+
+
+def on_starting(server):  # pylint: disable=unused-argument
+    """Empty the metrics directory of the previous server's workers."""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not directory:
+        return
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+
+
+def child_exit(server, worker):  # pylint: disable=unused-argument
+    """Drop the live gauges of the exited worker from the metrics."""
+    multiprocess.mark_process_dead(worker.pid)
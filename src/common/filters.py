@@ -1,5 +1,7 @@
 """Project wide filters."""
 from django_filters import rest_framework as filters
+from rest_framework_json_api import filters as json_api_filters
+from rest_framework_json_api.django_filters import backends
 
 
 class ChoiceInFilter(filters.BaseInFilter, filters.ChoiceFilter):
@@ -8,3 +10,42 @@ class ChoiceInFilter(filters.BaseInFilter, filters.ChoiceFilter):
 
 class ModelChoiceInFilter(filters.BaseInFilter, filters.ModelChoiceFilter):
     """Validated model choice in filter."""
+
+
+class OrderingFilter(json_api_filters.OrderingFilter):
+    """Sort by the requested fields, breaking ties by primary key.
+
+    Without a unique last sort field, rows with equal values can move between
+    pages. The primary key follows the direction of the last field so an index
+    on `(<field>, id)` serves the sort in either direction.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        """Return the ordering, with the primary key as the final tie breaker."""
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering or not request.query_params.get(self.ordering_param):
+            return ordering
+        if any(field.lstrip("-") in ["pk", "id"] for field in ordering):
+            return ordering
+        direction = "-" if ordering[-1].startswith("-") else ""
+        return [*ordering, f"{direction}pk"]
+
+
+class DjangoFilterBackend(backends.DjangoFilterBackend):
+    """Filter with the FilterSet returned by the view's `get_filterset_class`.
+
+    Views can then pick the FilterSet of the queryset they read per request.
+    The schema documents the view's `filterset_class`, as do the views without
+    the method.
+    """
+
+    def get_filterset(self, request, queryset, view):
+        """Return the view's FilterSet for the request, bound to its filters."""
+        if not hasattr(view, "get_filterset_class"):
+            return super().get_filterset(request, queryset, view)
+        filterset_class = view.get_filterset_class()
+        kwargs = self.get_filterset_kwargs(request, queryset, view)
+        self._validate_filter(kwargs.pop("filter_keys"), filterset_class)
+        if filterset_class is None:
+            return None
+        return filterset_class(**kwargs)
@@ -0,0 +1,116 @@
+"""Prometheus metrics of the requests served by every worker.
+
+When PROMETHEUS_MULTIPROC_DIR is set, each worker process writes its metrics
+to files in that directory and the metrics endpoint aggregates the files of
+every worker, so any worker can serve the scrape. The directory must be
+emptied before the workers start, which the `on_starting` hook of
+conf/gunicorn.conf.py does.
+
+The collectors of METRICS_COLLECTORS are collected by the worker serving
+the scrape, so they should read shared state, e.g. the database.
+"""
+import os
+import time
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "Requests served, by view and status code.",
+    ["method", "view", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent serving requests, by view.",
+    ["method", "view"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Requests being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Size of the response bodies which are not streamed, by view.",
+    ["method", "view"],
+    buckets=[2 ** power for power in range(8, 26, 2)],
+)
+DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in database queries per request, by view.",
+    ["method", "view"],
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10],
+)
+
+
+def get_view_name(request) -> str:
+    """Return the name of the view the request was routed to."""
+    resolver_match = getattr(request, "resolver_match", None)
+    if resolver_match is None:
+        return "unmatched"
+    return resolver_match.view_name
+
+
+class MetricsMiddleware:
+    """Record the latency, status, size and database time of each request.
+
+    The database time is that measured by QueryTimingMiddleware, which must
+    come after this middleware.
+    """
+
+    def __init__(self, get_response):
+        """Keep the next handler."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Record the request's metrics."""
+        in_flight = REQUESTS_IN_FLIGHT.labels(request.method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            in_flight.dec()
+        duration = time.perf_counter() - start
+        view = get_view_name(request)
+        REQUESTS.labels(request.method, view, response.status_code).inc()
+        REQUEST_DURATION.labels(request.method, view).observe(duration)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(request.method, view).observe(len(response.content))
+        query_duration = getattr(response, "query_duration", None)
+        if query_duration is not None:
+            DB_DURATION.labels(request.method, view).observe(query_duration)
+        return response
+
+
+def get_registry() -> CollectorRegistry:
+    """Return a registry of the workers' metrics and METRICS_COLLECTORS."""
+    registry = CollectorRegistry()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry.register(REGISTRY)
+    for collector in settings.METRICS_COLLECTORS:
+        registry.register(import_string(collector)())
+    return registry
+
+
+def metrics_view(request):
+    """Serve the metrics in the Prometheus text format."""
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
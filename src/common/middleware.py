@@ -0,0 +1,132 @@
+"""Middleware shared by the project's apps."""
+import logging
+import time
+from contextlib import ExitStack
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connections
+
+from common import slow_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRecorder:
+    """Count and time the queries executed through a connection's wrapper.
+
+    The queries taking at least SLOW_QUERY_THRESHOLD seconds are kept in
+    `slow_queries` with their plan, see common.slow_queries.
+    """
+
+    def __init__(self):
+        """Start with no queries."""
+        self.count = 0
+        self.duration = 0.0
+        self.slow_queries: List[dict] = []
+
+    # the signature is Django's, see `connection.execute_wrapper`
+    def __call__(  # pylint: disable=too-many-arguments
+        self, execute, sql, params, many, context
+    ):
+        """Execute and record the query."""
+        start = time.perf_counter()
+        try:
+            result = execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.count += 1
+            self.duration += duration
+        if not many and duration >= settings.SLOW_QUERY_THRESHOLD:
+            connection = context["connection"]
+            self.slow_queries.append(
+                {
+                    "sql": slow_queries.normalize_sql(sql),
+                    "duration": duration,
+                    "database": connection.alias,
+                    "plan": slow_queries.explain(connection, sql, params),
+                }
+            )
+        return result
+
+
+def get_query_budget(view_func, request) -> Optional[int]:
+    """Return the query budget the view declares for the request, if any.
+
+    Views declare `query_budget` as the most queries a request may issue, or
+    as a dict of them by viewset action.
+    """
+    view_class = getattr(view_func, "cls", None)
+    budget = getattr(view_class, "query_budget", None)
+    if isinstance(budget, dict):
+        actions = getattr(view_func, "actions", None) or {}
+        method = request.method.lower()
+        action = actions.get("get" if method == "head" else method)
+        return budget.get(action)
+    return budget
+
+
+class QueryTimingMiddleware:
+    """Report the number and duration of the queries of each request.
+
+    They are sent in the Server-Timing header and logged, the requests
+    exceeding their view's budget (see get_query_budget) as warnings. The
+    response's `query_count` and `query_budget` let the tests assert the
+    budgets, and its `query_duration` is exported by common.metrics. The slow
+    queries are captured by common.slow_queries. The rows of streamed
+    responses, read after the view returns, are not counted.
+    """
+
+    def __init__(self, get_response):
+        """Keep the next handler."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Record the queries of the request."""
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+        slow_queries.capture(request, recorder.slow_queries)
+        budget = getattr(request, "query_budget", None)
+        response.query_count = recorder.count
+        response.query_duration = recorder.duration
+        response.query_budget = budget
+        response["Server-Timing"] = (
+            f'db;dur={recorder.duration * 1000:.1f};desc="{recorder.count} queries", '
+            f"total;dur={duration * 1000:.1f}"
+        )
+        resolver_match = getattr(request, "resolver_match", None)
+        extra = {
+            "method": request.method,
+            "path": request.path,
+            "view": resolver_match.view_name if resolver_match else None,
+            "status_code": response.status_code,
+            "query_count": recorder.count,
+            "query_budget": budget,
+            "db_time": round(recorder.duration * 1000, 1),
+            "duration": round(duration * 1000, 1),
+        }
+        if budget is not None and recorder.count > budget:
+            logger.warning(
+                "%(method)s %(path)s issued %(query_count)d queries, exceeding "
+                "its budget of %(query_budget)d",
+                extra,
+                extra=extra,
+            )
+        else:
+            logger.info(
+                "%(method)s %(path)s issued %(query_count)d queries in %(db_time)sms",
+                extra,
+                extra=extra,
+            )
+        return response
+
+    def process_view(  # pylint: disable=no-self-use,unused-argument
+        self, request, view_func, view_args, view_kwargs
+    ):
+        """Keep the query budget of the view handling the request."""
+        request.query_budget = get_query_budget(view_func, request)
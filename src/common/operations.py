@@ -0,0 +1,129 @@
+"""Project wide migration operations.
+
+These are backports of the PostgreSQL operations added in Django 3.0
+(`django.contrib.postgres.operations.AddIndexConcurrently` and
+`RemoveIndexConcurrently`). Migrations using them must set `atomic = False`
+since PostgreSQL cannot build indexes concurrently inside a transaction.
+"""
+from django.db import NotSupportedError
+from django.db.migrations import AddIndex, RemoveIndex
+from django.db.migrations.operations.base import Operation
+
+
+class NotInTransactionMixin:
+    """Ensure the operation is not run inside of a transaction."""
+
+    def _ensure_not_in_transaction(self, schema_editor):
+        if schema_editor.connection.in_atomic_block:
+            raise NotSupportedError(
+                f"The {self.__class__.__name__} operation cannot be executed "
+                "inside a transaction (set atomic = False on the migration)."
+            )
+
+
+def _concurrently(statement):
+    """Return the index statement altered to run concurrently."""
+    statement.template = statement.template.replace(
+        "CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1
+    ).replace("DROP INDEX", "DROP INDEX CONCURRENTLY", 1)
+    return statement
+
+
+class AddIndexConcurrently(NotInTransactionMixin, AddIndex):
+    """Create an index using PostgreSQL's CREATE INDEX CONCURRENTLY syntax."""
+
+    atomic = False
+
+    def describe(self):
+        """Describe the operation."""
+        return (
+            f"Concurrently create index {self.index.name} on field(s) "
+            f"{', '.join(self.index.fields)} of model {self.model_name}"
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        """Create the index without locking the table."""
+        self._ensure_not_in_transaction(schema_editor)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.execute(
+                _concurrently(self.index.create_sql(model, schema_editor))
+            )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        """Drop the index without locking the table."""
+        self._ensure_not_in_transaction(schema_editor)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            schema_editor.execute(
+                _concurrently(self.index.remove_sql(model, schema_editor))
+            )
+
+
+class RemoveIndexConcurrently(NotInTransactionMixin, RemoveIndex):
+    """Remove an index using PostgreSQL's DROP INDEX CONCURRENTLY syntax."""
+
+    atomic = False
+
+    def describe(self):
+        """Describe the operation."""
+        return f"Concurrently remove index {self.name} from {self.model_name}"
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        """Drop the index without locking the table."""
+        self._ensure_not_in_transaction(schema_editor)
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            from_model_state = from_state.models[app_label, self.model_name_lower]
+            index = from_model_state.get_index_by_name(self.name)
+            schema_editor.execute(_concurrently(index.remove_sql(model, schema_editor)))
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        """Create the index without locking the table."""
+        self._ensure_not_in_transaction(schema_editor)
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            to_model_state = to_state.models[app_label, self.model_name_lower]
+            index = to_model_state.get_index_by_name(self.name)
+            schema_editor.execute(_concurrently(index.create_sql(model, schema_editor)))
+
+
+class RunSQLConcurrently(NotInTransactionMixin, Operation):
+    """Run index SQL which Django cannot express (e.g. expression indexes).
+
+    The SQL must be written with CONCURRENTLY and be idempotent
+    (`IF NOT EXISTS` / `IF EXISTS`), so a failed build can simply be re-run.
+    """
+
+    reversible = True
+    atomic = False
+
+    def __init__(self, sql, reverse_sql):
+        """Store the forward and reverse sql."""
+        self.sql = sql
+        self.reverse_sql = reverse_sql
+
+    def deconstruct(self):
+        """Deconstruct the operation."""
+        return (
+            self.__class__.__qualname__,
+            [],
+            {"sql": self.sql, "reverse_sql": self.reverse_sql},
+        )
+
+    def state_forwards(self, app_label, state):
+        """Expression indexes are not tracked in the model state."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        """Run the forward sql."""
+        self._ensure_not_in_transaction(schema_editor)
+        schema_editor.execute(self.sql)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        """Run the reverse sql."""
+        self._ensure_not_in_transaction(schema_editor)
+        schema_editor.execute(self.reverse_sql)
+
+    def describe(self):
+        """Describe the operation."""
+        return "Concurrently run SQL"
@@ -0,0 +1,169 @@
+"""Profile live requests with a sampling profiler.
+
+A request is profiled when it sets the `X-Profile` header or the `profile`
+query parameter (removed before the view sees it) and its user is staff with
+the `users.profile_requests` permission. The value `return` replaces the
+response with the profile, any other value stores the profile in the private
+storage and returns its key in the `X-Profile` response header.
+
+Independently, PROFILE_SAMPLE_RATE of all the requests are profiled and
+their profiles stored when they take at least PROFILE_SLOW_THRESHOLD
+seconds, so the slowest requests are captured without anyone asking.
+
+The profiles are in the folded stack format read by flamegraph.pl,
+speedscope and most flame graph viewers. The rows of streamed responses, read
+after the view returns, are not profiled.
+"""
+import logging
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from common.metrics import get_view_name
+from webapp.storage import PrivateS3
+
+logger = logging.getLogger(__name__)
+
+HEADER = "HTTP_X_PROFILE"
+RESPONSE_HEADER = "X-Profile"
+QUERY_PARAM = "profile"
+RETURN_MODE = "return"
+PERMISSION = "users.profile_requests"
+CONTENT_TYPE = "text/plain; charset=utf-8"
+
+
+def get_stack(frame) -> str:
+    """Return the folded stack of the frame, outermost call first."""
+    names = []
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "?")
+        names.append(f"{module}:{frame.f_code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class Sampler(threading.Thread):
+    """Count the stacks of a thread, sampled at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float):
+        """Sample the thread every interval seconds once started."""
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.stopped = threading.Event()
+
+    def run(self):
+        """Sample the thread until stopped."""
+        while not self.stopped.wait(self.interval):
+            # pylint: disable=protected-access
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[get_stack(frame)] += 1
+
+    def stop(self):
+        """Stop sampling."""
+        self.stopped.set()
+        self.join()
+
+    def get_profile(self) -> str:
+        """Return the sampled stacks in the folded stack format."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+def get_storage() -> Storage:
+    """Return the storage the profiles are saved to, which is not public."""
+    return PrivateS3()
+
+
+def save_profile(request, profile: str) -> str:
+    """Save the request's profile, returning its key."""
+    now = timezone.now()
+    view = get_view_name(request).replace(":", "-")
+    name = f"{now:%H%M%S}-{view}-{uuid.uuid4().hex[:8]}"
+    key = f"profiles/{now:%Y-%m-%d}/{name}.folded"
+    return get_storage().save(key, ContentFile(profile.encode()))
+
+
+def get_requested_mode(request) -> Optional[str]:
+    """Return the profile mode the request asks for, removing the query param."""
+    mode = request.META.get(HEADER)
+    if QUERY_PARAM in request.GET:
+        query = request.GET.copy()
+        mode = query.pop(QUERY_PARAM)[-1]
+        request.GET = query
+        request.META["QUERY_STRING"] = query.urlencode()
+    return mode or None
+
+
+def can_profile(user) -> bool:
+    """Return whether the user may profile requests."""
+    return bool(user and user.is_staff and user.has_perm(PERMISSION))
+
+
+def get_user(request):
+    """Return the request's session user, or else the user of its token."""
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return user
+    try:
+        authenticated = TokenAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    return authenticated and authenticated[0]
+
+
+class ProfilingMiddleware:
+    """Run the requested and randomly sampled requests under the sampler.
+
+    The users authenticated by a token are only known once the view ran, so
+    the token is checked before the sampler starts. Requests sending other
+    credentials are not profiled on demand.
+    """
+
+    def __init__(self, get_response):
+        """Keep the next handler."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Profile the request if requested or sampled."""
+        mode = get_requested_mode(request)
+        if mode is not None and not can_profile(get_user(request)):
+            mode = None
+        sampled = random.random() < settings.PROFILE_SAMPLE_RATE
+        if mode is None and not sampled:
+            return self.get_response(request)
+        sampler = Sampler(threading.get_ident(), settings.PROFILE_INTERVAL)
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            sampler.stop()
+        duration = time.perf_counter() - start
+        if mode is not None:
+            if mode == RETURN_MODE:
+                return HttpResponse(sampler.get_profile(), content_type=CONTENT_TYPE)
+            response[RESPONSE_HEADER] = save_profile(request, sampler.get_profile())
+        elif sampled and duration >= settings.PROFILE_SLOW_THRESHOLD:
+            key = save_profile(request, sampler.get_profile())
+            logger.info(
+                "%s %s took %.3fs, profiled to %s",
+                request.method,
+                request.path,
+                duration,
+                key,
+            )
+        return response
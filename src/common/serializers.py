@@ -0,0 +1,194 @@
+"""Project wide serializer helpers."""
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from rest_framework import ISO_8601, relations, serializers
+from rest_framework.settings import api_settings
+
+# fields whose `to_representation` returns the database value unchanged
+_IDENTITY_FIELDS = {
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.IntegerField,
+    serializers.SlugField,
+    serializers.URLField,
+}
+
+Converter = Optional[Callable[[Any], Any]]
+# the serializer class, resource name and field names a plan is built for
+PlanKey = Tuple[Type[serializers.Serializer], str, Tuple[str, ...]]
+
+
+def _get_choice_converter(field: serializers.ChoiceField) -> Callable[[Any], Any]:
+    """Return a converter matching `ChoiceField.to_representation`."""
+    mapping = field.choice_strings_to_values
+
+    def convert(value):
+        if value in ("", None):
+            return value
+        return mapping.get(str(value), value)
+
+    return convert
+
+
+def _get_converter(field: serializers.Field) -> Tuple[bool, Converter]:
+    """Return whether the field is supported and the converter for its values.
+
+    A converter of `None` means the database value is used as is.
+    """
+    field_class = type(field)
+    if field_class in _IDENTITY_FIELDS:
+        return True, None
+    if field_class is serializers.ChoiceField:
+        return True, _get_choice_converter(field)  # type: ignore
+    if field_class is serializers.DateField:
+        output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+        if output_format is None:
+            return True, None
+        if output_format.lower() == ISO_8601:
+            return True, date.isoformat
+        return True, lambda value: value.strftime(output_format)
+    return False, None
+
+
+def get_model_columns(
+    serializer: serializers.Serializer, model: Type[Model]
+) -> Optional[List[str]]:
+    """Return the model fields the serializer's fields read from the database.
+
+    None is returned if any field reads something other than a concrete model
+    field (e.g. a property, a method or the whole instance), as the columns it
+    needs cannot be known.
+    """
+    columns = []
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if field.source == "*":
+            return None
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            return None
+        # set on model fields by Django, but not declared by the stubs
+        if not getattr(model_field, "concrete", False) or model_field.many_to_many:
+            return None
+        columns.append(model_field.name)
+    return columns
+
+
+class FieldPlan:
+    """Precomputed plan mapping `values_list` rows to JSON:API resource objects.
+
+    Rendering a page through a ModelSerializer builds a model instance, an
+    OrderedDict per row and calls `to_representation` on every field, only for
+    the renderer to copy it all again into the resource object. A plan is
+    built once for a set of serializer fields and then maps each database row
+    straight to the resource object, producing the same document.
+
+    Only serializers of plain model fields are supported, see `FieldPlan.build`.
+    """
+
+    def __init__(
+        self,
+        resource_name: str,
+        names: List[str],
+        columns: List[str],
+        converters: List[Converter],
+    ):
+        """Store the plan."""
+        self.resource_name = resource_name
+        self.names = names
+        # the primary key is always the first column
+        self.columns = ["pk", *columns]
+        self.conversions = [
+            (index, converter)
+            for index, converter in enumerate(converters, start=1)
+            if converter is not None
+        ]
+
+    @classmethod
+    def build(
+        cls, serializer: serializers.Serializer, resource_name: str
+    ) -> Optional["FieldPlan"]:
+        """Return the plan for the serializer's fields.
+
+        None is returned if the serializer customises its representation or
+        any of the fields is not supported (relationships, self links, dotted
+        sources or fields with custom representations).
+        """
+        return cls._build((type(serializer), resource_name, tuple(serializer.fields)))
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _build(cls, key: PlanKey) -> Optional["FieldPlan"]:
+        serializer_class, resource_name, field_names = key
+        customised = (
+            serializer_class.to_representation
+            is not serializers.Serializer.to_representation
+            or hasattr(serializer_class, "get_root_meta")
+            or getattr(getattr(serializer_class, "Meta", None), "meta_fields", None)
+        )
+        if customised:
+            return None
+        fields = serializer_class().fields
+        names, columns, converters = [], [], []
+        for field_name in field_names:
+            field = fields[field_name]
+            # the renderer leaves the id and write only fields out of attributes
+            if field.write_only or field_name == "id":
+                continue
+            if isinstance(field, (relations.RelatedField, relations.ManyRelatedField)):
+                return None
+            if field_name == api_settings.URL_FIELD_NAME:
+                return None
+            if len(field.source_attrs) != 1:
+                return None
+            supported, converter = _get_converter(field)
+            if not supported:
+                return None
+            names.append(field.field_name)
+            columns.append(field.source)
+            converters.append(converter)
+        return cls(resource_name, names, columns, converters)
+
+    def values_list(self, queryset: QuerySet) -> QuerySet:
+        """Return the queryset of rows this plan maps."""
+        return queryset.values_list(*self.columns)  # type: ignore
+
+    def iter_values(self, rows: Iterable[Tuple[Any, ...]]) -> Iterator[List[Any]]:
+        """Yield the primary key followed by the represented values of each row."""
+        conversions = self.conversions
+        for row in rows:
+            values = list(row)
+            for index, converter in conversions:
+                value = values[index]
+                if value is not None:
+                    values[index] = converter(value)
+            yield values
+
+    def iter_resources(
+        self, rows: Iterable[Tuple[Any, ...]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the JSON:API resource object of each row."""
+        return self.iter_values_resources(self.iter_values(rows))
+
+    def iter_values_resources(
+        self, values_list: Iterable[List[Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the JSON:API resource object of the values of each row."""
+        resource_name, names = self.resource_name, self.names
+        for values in values_list:
+            yield {
+                "type": resource_name,
+                "id": str(values[0]),
+                "attributes": dict(zip(names, values[1:])),
+            }
+
+    def to_resources(self, rows: Iterable[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        """Return the JSON:API resource objects for the rows."""
+        return list(self.iter_resources(rows))
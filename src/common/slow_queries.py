@@ -0,0 +1,139 @@
+"""Capture the slow queries of the requests with their plans.
+
+QueryTimingMiddleware hands the queries taking at least SLOW_QUERY_THRESHOLD
+seconds to `explain`, which asks the database for their plan (without
+running them again) on the same connection, so the plan sees the same
+transaction. Once the request is served, `capture` logs them with the view
+and query parameters of the request, replacing by `?` the values users
+filter on except those of KEPT_PARAMS, and keeps the last
+SLOW_QUERY_BUFFER_SIZE in a ring buffer, served to staff by the slow-queries
+endpoint.
+
+Each worker process has its own buffer, so the endpoint only returns the
+captures of the worker serving it; the logs have those of every worker.
+"""
+import itertools
+import logging
+import re
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import permissions, viewsets
+
+from common.metrics import get_view_name
+from webapp import renderers
+
+logger = logging.getLogger(__name__)
+
+# statements EXPLAIN accepts, which it plans without running
+EXPLAINED = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+SAVEPOINT = "slow_query_plan"
+
+STRING = re.compile(r"'(?:[^']|'')*'")
+NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDER = re.compile(r"%s|\$\d+")
+IN_LIST = re.compile(r"\(\?(?:, \?)+\)")
+WHITESPACE = re.compile(r"\s+")
+# the query parameters whose values are kept, which don't identify anyone
+KEPT_PARAMS = re.compile(
+    r"sort|page\[\w+\]|fields\[[\w-]+\]|filter\[(?:rating|st_dev|last_played"
+    r"|country|sport|gender|age_category|deceased|active|status)(?:__\w+)?\]"
+)
+
+captures: Deque[dict] = deque(maxlen=settings.SLOW_QUERY_BUFFER_SIZE)
+ids = itertools.count(1)
+
+
+def normalize_sql(sql: str) -> str:
+    """Return the SQL without its values, so queries differing by them match.
+
+    The literals and placeholders are replaced by `?` and the lists of them,
+    e.g. of `IN`, by `(...)`.
+    """
+    sql = STRING.sub("?", sql)
+    sql = PLACEHOLDER.sub("?", sql)
+    sql = NUMBER.sub("?", sql)
+    sql = WHITESPACE.sub(" ", sql).strip()
+    return IN_LIST.sub("(...)", sql)
+
+
+def explain(connection, sql: str, params) -> Optional[str]:
+    """Return the plan of the query, if the database can plan it.
+
+    The plan is queried through the driver's cursor so it is not recorded
+    itself. Inside a transaction, it is queried in a savepoint so a failure
+    does not abort the transaction. The string values of its conditions are
+    replaced by `?`, like those of the normalized SQL.
+    """
+    if not sql.lstrip().upper().startswith(EXPLAINED):
+        return None
+    atomic = connection.in_atomic_block
+    with connection.connection.cursor() as cursor:
+        if atomic:
+            cursor.execute(f"SAVEPOINT {SAVEPOINT}")
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE off) {sql}", params)
+            plan = STRING.sub("?", "\n".join(row[0] for row in cursor.fetchall()))
+        except connection.Database.Error:
+            logger.exception("Could not explain the slow query %s", sql)
+            if atomic:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT}")
+            return None
+        if atomic:
+            cursor.execute(f"RELEASE SAVEPOINT {SAVEPOINT}")
+    return plan
+
+
+def get_params(request) -> Dict[str, str]:
+    """Return the request's query parameters, `?` replacing the values not kept."""
+    return {
+        name: request.GET[name] if KEPT_PARAMS.fullmatch(name) else "?"
+        for name in sorted(request.GET)
+    }
+
+
+def capture(request, queries: List[dict]):
+    """Log the request's slow queries and add them to the ring buffer."""
+    for query in queries:
+        slow_query = {
+            "id": str(next(ids)),
+            "captured": timezone.now().isoformat(),
+            "view": get_view_name(request),
+            "method": request.method,
+            "path": request.path,
+            "params": get_params(request),
+            **query,
+        }
+        logger.warning(
+            "%(method)s %(path)s issued a query taking %(duration).3fs: %(sql)s",
+            slow_query,
+            extra=slow_query,
+        )
+        captures.append(slow_query)
+
+
+class SlowQueryView(viewsets.ViewSet):
+    """slow-queries endpoint.
+
+    Lists the slow queries captured by the worker, newest first. The plans
+    show which indexes are missing, so only staff can read them.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+    resource_name = "slow-queries"
+
+    def list(self, request):
+        """Return the captured slow queries."""
+        data = [
+            {
+                "type": self.resource_name,
+                "id": slow_query["id"],
+                "attributes": {
+                    name: value for name, value in slow_query.items() if name != "id"
+                },
+            }
+            for slow_query in reversed(captures)
+        ]
+        return renderers.DocumentResponse({"data": data})
@@ -1,4 +1,5 @@
 """Project wide base test class."""
+import tempfile
 from typing import Any, Dict, Optional, Tuple, Type
 
 from django.core.management import call_command
@@ -26,6 +27,9 @@ class BaseTestCase(test.APITestCase):
     """Add helper methods."""
 
     client_class = APIClient
+    # fail the requests issuing more queries than their view's budget, see
+    # common.middleware.QueryTimingMiddleware
+    enforce_query_budgets = True
 
     ERRORS = {
         "401": "Authentication credentials were not provided.",
@@ -78,6 +82,12 @@ class BaseTestCase(test.APITestCase):
         super().setUpClass()
         call_command("setup_skeletons", verbosity=0)
 
+    def get_temporary_directory(self) -> str:
+        """Return the path of a directory removed once the test ran."""
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        return directory.name
+
     def auth(self, user: Optional[User], token: Optional[str] = None):
         """Authenticate as the given user."""
         self.current_user = user
@@ -99,6 +109,15 @@ class BaseTestCase(test.APITestCase):
             self.assertEqual(response.status_code, asserted_status, msg)
         if asserted_schema is not None:
             self.assertThat(response.json(), asserted_schema)
+        if self.enforce_query_budgets:
+            self.assertWithinQueryBudget(response)
+
+    def assertWithinQueryBudget(self, response):  # pylint: disable=invalid-name
+        """Assert the request issued no more queries than its view's budget."""
+        budget = getattr(response, "query_budget", None)
+        if budget is not None:
+            msg = f"{response.query_count} queries exceed the budget of {budget}"
+            self.assertLessEqual(response.query_count, budget, msg)
 
     def get(
         self,
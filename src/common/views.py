@@ -0,0 +1,183 @@
+"""Project wide view mixins."""
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework_json_api import utils
+
+from common.serializers import FieldPlan, get_model_columns
+from webapp import renderers
+
+
+def batched(lines: Iterable[bytes], size: int) -> Iterator[bytes]:
+    """Yield the lines joined in batches of `size` lines."""
+    iterator = iter(lines)
+    while True:
+        batch = b"".join(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class FastReadMixin:
+    """Serve `list` straight from `values_list` rows through a FieldPlan.
+
+    The response is byte-identical to the one the serializer would produce.
+    The regular path is used whenever the plan does not support the
+    serializer or the request is not rendered as JSON:API.
+
+    Pages of at least `stream_page_size` rows are streamed, reading and
+    rendering `stream_chunk_size` rows at a time, so memory is bounded by the
+    chunk size rather than the page size.
+    """
+
+    fast_read = True
+    stream_page_size: Optional[int] = 1000
+    stream_chunk_size = 500
+    # provided by GenericAPIView
+    request: Request
+    paginator: Any
+    get_serializer: Callable[..., Any]
+    get_paginated_response: Callable[..., Response]
+
+    def get_field_plan(self) -> Optional[FieldPlan]:
+        """Return the field plan for this request, or None if unsupported."""
+        if not self.fast_read:
+            return None
+        if not isinstance(self.request.accepted_renderer, renderers.JSONRenderer):
+            return None
+        resource_name = utils.get_resource_name({"view": self})
+        return FieldPlan.build(self.get_serializer(), resource_name)
+
+    def list(self, request, *args, **kwargs):
+        """Map the page's rows straight to resource objects."""
+        plan = self.get_field_plan()
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+        rows = plan.values_list(self.filter_queryset(self.get_queryset()))
+        if self.should_stream():
+            return self.stream_list(plan, rows)
+        page = self.paginate_queryset(rows)
+        resources = plan.to_resources(rows if page is None else page)
+        paginated = {} if page is None else self.get_paginated_response(resources).data
+        # keep the member order the JSON:API renderer uses
+        document = {}
+        if paginated.get("links"):
+            document["links"] = paginated["links"]
+        document["data"] = resources
+        if paginated.get("meta"):
+            document["meta"] = paginated["meta"]
+        return renderers.DocumentResponse(document)
+
+    def should_stream(self) -> bool:
+        """Return whether the list should be streamed."""
+        if self.stream_page_size is None:
+            return False
+        if not hasattr(self.request.accepted_renderer, "render_stream"):
+            return False
+        if self.paginator is None:
+            return True
+        if not hasattr(self.paginator, "paginate_queryset_lazily"):
+            return False
+        page_size = self.paginator.get_page_size(self.request)
+        return not page_size or page_size >= self.stream_page_size
+
+    def stream_list(self, plan: FieldPlan, rows) -> StreamingHttpResponse:
+        """Stream the page's resource objects as they are read."""
+        page = None
+        if self.paginator is not None:
+            page = self.paginator.paginate_queryset_lazily(rows, self.request)
+        paginated = {} if page is None else self.get_paginated_response([]).data
+        rows = rows if page is None else page
+        resources = plan.iter_resources(
+            rows.iterator(chunk_size=self.stream_chunk_size)
+        )
+        renderer = self.request.accepted_renderer
+        return StreamingHttpResponse(
+            renderer.render_stream(
+                resources,
+                links=paginated.get("links"),
+                meta=paginated.get("meta"),
+                chunk_size=self.stream_chunk_size,
+            ),
+            content_type=renderer.media_type,
+        )
+
+
+class SparseColumnsMixin:
+    """Only select the columns of the fields being rendered.
+
+    The serializer drops the fields left out of a sparse fieldset
+    (`fields[<type>]=...`), so reading them from the database is wasted work.
+    """
+
+    sparse_columns_actions = ["list", "retrieve"]
+
+    def get_queryset(self):
+        """Defer the columns the serializer does not render."""
+        queryset = super().get_queryset()
+        if self.action not in self.sparse_columns_actions:
+            return queryset
+        if queryset.query.select_related:
+            # deferred fields cannot be traversed by select_related
+            return queryset
+        columns = get_model_columns(self.get_serializer(), queryset.model)
+        if columns is None:
+            return queryset
+        return queryset.only(*columns)
+
+
+class ExportMixin:
+    """Stream every filtered row as NDJSON or CSV.
+
+    The rows are read through a server-side cursor and written as they are
+    read, so memory stays constant whatever the number of rows. The format is
+    negotiated from the `Accept` header or the `.ndjson`/`.csv` suffix.
+    """
+
+    export_chunk_size = 2000
+
+    def get_export_rows(self, queryset, serializer):
+        """Return the header and an iterator of the rows' values."""
+        plan = FieldPlan.build(serializer, utils.get_resource_name({"view": self}))
+        if plan is not None:
+            rows = plan.values_list(queryset).iterator(
+                chunk_size=self.export_chunk_size
+            )
+            return ["id", *plan.names], plan.iter_values(rows)
+        names = [
+            name
+            for name, field in serializer.fields.items()
+            if name != "id" and not field.write_only
+        ]
+        instances = queryset.iterator(chunk_size=self.export_chunk_size)
+        rows = (
+            [instance.pk, *map(serializer.to_representation(instance).get, names)]
+            for instance in instances
+        )
+        return ["id", *names], rows
+
+    @action(
+        detail=False,
+        renderer_classes=[renderers.NDJSONRenderer, renderers.CSVRenderer],
+    )
+    def export(self, request, *args, **kwargs):
+        """Stream the filtered rows in the accepted format."""
+        queryset = self.filter_queryset(self.get_queryset())
+        header, rows = self.get_export_rows(queryset, self.get_serializer())
+        renderer = request.accepted_renderer
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        response = StreamingHttpResponse(
+            batched(renderer.render_rows(header, rows), self.export_chunk_size),
+            content_type=content_type,
+        )
+        filename = f"{utils.get_resource_name({'view': self})}.{renderer.format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        # send each batch as it is written rather than buffering in the proxy
+        response["X-Accel-Buffering"] = "no"
+        return response
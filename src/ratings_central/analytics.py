@@ -0,0 +1,108 @@
+"""Export the player and club lists as typed, columnar Parquet files."""
+import tempfile
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Type
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.core.files.storage import Storage
+from django.db import models as django_models
+from rest_framework.serializers import ModelSerializer
+from rest_framework_json_api import utils
+
+from common.serializers import FieldPlan
+from ratings_central import models, snapshots
+
+ROW_GROUP_SIZE = 50000
+COMPRESSION = "zstd"
+CONTENT_TYPE = "application/vnd.apache.parquet"
+
+# the Arrow type of each model field class, checked in order
+FIELD_TYPES: List[Tuple[Type[django_models.Field], pa.DataType]] = [
+    (django_models.BooleanField, pa.bool_()),
+    (django_models.DateField, pa.date32()),
+    (django_models.AutoField, pa.int32()),
+    (django_models.IntegerField, pa.int32()),
+    (django_models.CharField, pa.string()),
+]
+
+
+def get_type(field: django_models.Field) -> pa.DataType:
+    """Return the Arrow type of the model field's values."""
+    for field_class, data_type in FIELD_TYPES:
+        if isinstance(field, field_class):
+            return data_type
+    raise ValueError(f"{field.name} has no Arrow type.")
+
+
+def get_schema(model: Type[django_models.Model], columns: List[str]) -> pa.Schema:
+    """Return the schema of the columns, dictionary-encoding text with choices.
+
+    Parquet only restores the dictionary type of text columns when read. The
+    pages of integer columns with choices (e.g. sport) are dictionary-encoded
+    by the writer all the same.
+    """
+    schema_fields = []
+    for column in columns:
+        field = model._meta.pk if column == "pk" else model._meta.get_field(column)
+        # the columns are the model's concrete fields, not its relations
+        assert isinstance(field, django_models.Field), f"{column} is not a field"
+        data_type = get_type(field)
+        if field.choices and pa.types.is_string(data_type):
+            data_type = pa.dictionary(pa.int32(), data_type)
+        schema_fields.append(pa.field(field.name, data_type, nullable=field.null))
+    return pa.schema(schema_fields)
+
+
+def iter_tables(
+    rows: Iterable[Tuple[Any, ...]], schema: pa.Schema
+) -> Iterator[pa.Table]:
+    """Yield the rows as tables of at most ROW_GROUP_SIZE rows."""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, ROW_GROUP_SIZE))
+        if not chunk:
+            return
+        arrays = []
+        for values, field in zip(zip(*chunk), schema):
+            if pa.types.is_dictionary(field.type):
+                array = pa.array(values, type=field.type.value_type)
+                arrays.append(array.dictionary_encode())
+            else:
+                arrays.append(pa.array(values, type=field.type))
+        yield pa.Table.from_arrays(arrays, schema=schema)
+
+
+def publish_parquet(
+    storage: Storage,
+    dataset_version: models.DatasetVersion,
+    serializer_class: Type[ModelSerializer],
+) -> Dict[str, Any]:
+    """Publish the Parquet file of a list and return its details.
+
+    The columns are those of the list's resources, with the id first. Each
+    row group is built from a chunk of rows read through a server-side
+    cursor, so memory is bounded by the row group size.
+    """
+    resource_name = utils.get_resource_type_from_serializer(serializer_class)
+    plan = FieldPlan.build(serializer_class(), resource_name)
+    if plan is None:
+        raise ValueError(f"{serializer_class.__name__} cannot be exported.")
+    model = serializer_class.Meta.model
+    schema = get_schema(model, plan.columns)
+    rows = plan.values_list(model.objects.order_by("pk")).iterator(
+        chunk_size=snapshots.CHUNK_SIZE
+    )
+    count = 0
+    with tempfile.TemporaryFile() as temp:
+        with pq.ParquetWriter(temp, schema, compression=COMPRESSION) as writer:
+            for table in iter_tables(rows, schema):
+                writer.write_table(table)
+                count += table.num_rows
+        details = snapshots.save_file(
+            storage,
+            snapshots.get_key(dataset_version, f"{resource_name}.parquet"),
+            temp,
+            CONTENT_TYPE,
+        )
+    return {"resource": resource_name, "format": "parquet", "count": count, **details}
@@ -6,3 +6,8 @@ class RatingsCentralConfig(AppConfig):
     """Config for the ratings_central application."""
 
     name = "ratings_central"
+
+    def ready(self):
+        """Import signals."""
+        # noqa pylint: disable=unused-import,import-outside-toplevel
+        from ratings_central import signals
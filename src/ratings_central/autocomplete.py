@@ -0,0 +1,342 @@
+"""Memory-mapped prefix indexes of the player and club names.
+
+Each import writes a name map per resource. A name is normalized (accents
+removed, case folded, punctuation collapsed to spaces) and indexed once from
+the start of each of its words, so "smi" completes "Jon Smith". The keys are
+sorted, so the keys starting with a prefix are a binary searched range.
+
+Short prefixes match most of the names, so the best records of every prefix
+of up to TOP_PREFIX_LENGTH characters are ranked when the map is written.
+Longer prefixes rank the few records of their range when looked up.
+
+The maps are shared by every worker like the player maps, see
+ratings_central.player_maps.
+"""
+import heapq
+import mmap
+import os
+import re
+import struct
+import tempfile
+import unicodedata
+from array import array
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db.models import Count, Q
+
+from ratings_central import models, player_maps
+
+MAGIC = b"RCNM"
+FORMAT_VERSION = 1
+# magic, format version and dataset version
+HEADER = struct.Struct("=4sIQ")
+# the offset and size of each section
+SECTION = struct.Struct("=QQ")
+SECTIONS = [
+    # the records: their primary key, score and name
+    ("ids", "i"),
+    ("scores", "i"),
+    ("name_offsets", "I"),
+    ("names", "B"),
+    # the sorted keys and the record each indexes
+    ("key_records", "I"),
+    ("key_offsets", "I"),
+    ("keys", "B"),
+    # the sorted short prefixes and their ranked records
+    ("prefix_offsets", "I"),
+    ("prefixes", "B"),
+    ("top_offsets", "I"),
+    ("tops", "I"),
+]
+# the sections of strings and their offsets
+PACKED = {"names": "name_offsets", "keys": "key_offsets", "prefixes": "prefix_offsets"}
+TOP_PREFIX_LENGTH = 3
+MAX_LIMIT = 20
+# the shortest prefix completed from the database, see get_matches
+MIN_MATCH_LENGTH = 3
+# sorts after every UTF-8 encoded key starting with a prefix
+PREFIX_END = b"\xff"
+# the attribute holding each resource's score
+SCORE_NAMES = {"players": "rating", "clubs": "active_players"}
+
+Record = Tuple[int, str, int]
+
+
+def normalize(name: str) -> str:
+    """Return the name without accents, case folded and with single spaces."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(re.findall(r"\w+", stripped.casefold()))
+
+
+def get_keys(name: str) -> List[str]:
+    """Return the normalized name from the start of each of its words."""
+    normalized = normalize(name)
+    return [normalized[match.start() :] for match in re.finditer(r"\w+", normalized)]
+
+
+# the dataset version only keys the cache
+@lru_cache(maxsize=1)
+def get_active_players(  # pylint: disable=unused-argument
+    dataset_version_pk: Optional[int],
+) -> Dict[int, int]:
+    """Return the number of active players of each club by its rc_id.
+
+    The active players only change with the imports, so the counts are
+    computed once per dataset version.
+    """
+    return dict(
+        models.Player.objects.active()
+        .order_by()
+        .values_list("rc_primary_club_id")
+        .annotate(count=Count("pk"))
+    )
+
+
+def get_records(resource: str, dataset_version_pk: Optional[int]) -> Iterable[Record]:
+    """Return the primary key, name and score of the resource's records.
+
+    Players are scored by rating, the deceased are left out. Clubs are scored
+    by the number of active players whose primary club they are.
+    """
+    if resource == "players":
+        return (
+            models.Player.objects.filter(deceased=False)
+            .order_by("pk")
+            .values_list("pk", "name", "rating")
+            .iterator(chunk_size=2000)
+        )
+    active_players = get_active_players(dataset_version_pk)
+    return (
+        (primary_key, name, active_players.get(rc_id, 0))
+        for primary_key, name, rc_id in models.Club.objects.order_by("pk").values_list(
+            "pk", "name", "rc_id"
+        )
+    )
+
+
+def rank(records: Iterable[int], scores: Any, ids: Any, limit: int) -> List[int]:
+    """Return the indexes of the best scored records, ties broken by id."""
+    return heapq.nsmallest(
+        limit, set(records), key=lambda index: (-scores[index], ids[index])
+    )
+
+
+def get_file_name(resource: str, dataset_version_pk: int) -> str:
+    """Return the file name of a dataset version's name map."""
+    return f"names-{resource}-{dataset_version_pk}.map"
+
+
+def get_pointer_name(resource: str) -> str:
+    """Return the name of the pointer to the resource's current name map."""
+    return f"names-{resource}.map"
+
+
+def pack_strings(strings: Iterable[bytes]) -> Tuple[array, bytearray]:
+    """Return the offsets and heap of the strings."""
+    offsets, heap = array("I", [0]), bytearray()
+    for string in strings:
+        heap += string
+        offsets.append(len(heap))
+    return offsets, heap
+
+
+def collect_keys(
+    records: Iterable[Record],
+) -> Tuple[array, array, List[bytes], List[Tuple[bytes, int]], Dict[bytes, Set[int]]]:
+    """Return the records' ids, scores and names, their keys and short prefixes.
+
+    Each key is paired with the index of its record, and each prefix of up to
+    TOP_PREFIX_LENGTH characters maps to the indexes of the records it starts.
+    """
+    ids, scores, names = array("i"), array("i"), []
+    keys: List[Tuple[bytes, int]] = []
+    prefixed: Dict[bytes, Set[int]] = defaultdict(set)
+    for index, (primary_key, name, score) in enumerate(records):
+        ids.append(primary_key)
+        scores.append(score)
+        names.append(name.encode())
+        for key in get_keys(name):
+            keys.append((key.encode(), index))
+            for length in range(1, min(len(key), TOP_PREFIX_LENGTH) + 1):
+                prefixed[key[:length].encode()].add(index)
+    return ids, scores, names, keys, prefixed
+
+
+def rank_prefixes(
+    prefixed: Dict[bytes, Set[int]], scores: array, ids: array
+) -> Tuple[List[bytes], array, array]:
+    """Return the sorted short prefixes with the offsets of their ranked records."""
+    prefixes = sorted(prefixed)
+    top_offsets, tops = array("I", [0]), array("I")
+    for prefix in prefixes:
+        tops.extend(rank(prefixed[prefix], scores, ids, MAX_LIMIT))
+        top_offsets.append(len(tops))
+    return prefixes, top_offsets, tops
+
+
+def get_sections(records: Iterable[Record]) -> Dict[str, Any]:
+    """Return the content of each section of the records' name map."""
+    ids, scores, names, keys, prefixed = collect_keys(records)
+    keys.sort()
+    prefixes, top_offsets, tops = rank_prefixes(prefixed, scores, ids)
+    sections: Dict[str, Any] = {
+        "ids": ids,
+        "scores": scores,
+        "key_records": array("I", [index for _, index in keys]),
+        "top_offsets": top_offsets,
+        "tops": tops,
+    }
+    for name, strings in [
+        ("names", names),
+        ("keys", [key for key, _ in keys]),
+        ("prefixes", prefixes),
+    ]:
+        sections[PACKED[name]], sections[name] = pack_strings(strings)
+    return sections
+
+
+def write_sections(
+    directory: str, dataset_version_pk: int, sections: Dict[str, Any]
+) -> str:
+    """Write the sections to a temporary file in the directory, returning its path."""
+    contents = [bytes(sections[name]) for name, _ in SECTIONS]
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as temp:
+        temp.write(HEADER.pack(MAGIC, FORMAT_VERSION, dataset_version_pk))
+        offset = player_maps.align(HEADER.size + SECTION.size * len(SECTIONS))
+        offsets = []
+        for content in contents:
+            temp.write(SECTION.pack(offset, len(content)))
+            offsets.append(offset)
+            offset = player_maps.align(offset + len(content))
+        for section_offset, content in zip(offsets, contents):
+            temp.seek(section_offset)
+            temp.write(content)
+        temp.flush()
+        os.fsync(temp.fileno())
+    return temp.name
+
+
+def write_name_map(
+    dataset_version: models.DatasetVersion,
+    resource: str,
+    directory: Optional[str] = None,
+) -> str:
+    """Write the resource's name map of the dataset version and make it current."""
+    directory = directory or player_maps.get_directory()
+    os.makedirs(directory, exist_ok=True)
+    temp_path = write_sections(
+        directory,
+        dataset_version.pk,
+        get_sections(get_records(resource, dataset_version.pk)),
+    )
+    return player_maps.install(
+        directory,
+        temp_path,
+        get_file_name(resource, dataset_version.pk),
+        get_pointer_name(resource),
+    )
+
+
+class NameMap:
+    """A read-only, memory-mapped name map."""
+
+    def __init__(self, path: str):
+        """Map the file and view its sections without copying them."""
+        self.path = path
+        with open(path, "rb") as fyl:
+            self.mmap = mmap.mmap(fyl.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, format_version, self.dataset_version = HEADER.unpack_from(self.mmap)
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a name map.")
+        view = memoryview(self.mmap)
+        self.sections = {}
+        for index, (name, typecode) in enumerate(SECTIONS):
+            offset, size = SECTION.unpack_from(
+                self.mmap, HEADER.size + SECTION.size * index
+            )
+            self.sections[name] = view[offset : offset + size].cast(typecode)
+
+    def get_string(self, name: str, index: int) -> bytes:
+        """Return the string at the index of a packed section."""
+        offsets = self.sections[PACKED[name]]
+        return bytes(self.sections[name][offsets[index] : offsets[index + 1]])
+
+    def bisect(self, name: str, value: bytes) -> int:
+        """Return the index of the first string of the section not below the value."""
+        low, high = 0, len(self.sections[PACKED[name]]) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_string(name, middle) < value:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def lookup(self, prefix: str, limit: int) -> List[Record]:
+        """Return the best scored records with a key starting with the prefix."""
+        normalized = normalize(prefix)
+        if not normalized:
+            return []
+        encoded = normalized.encode()
+        ids, scores = self.sections["ids"], self.sections["scores"]
+        if len(normalized) <= TOP_PREFIX_LENGTH:
+            index = self.bisect("prefixes", encoded)
+            if (
+                index == len(self.sections["prefix_offsets"]) - 1
+                or self.get_string("prefixes", index) != encoded
+            ):
+                return []
+            top_offsets = self.sections["top_offsets"]
+            tops = self.sections["tops"][top_offsets[index] : top_offsets[index + 1]]
+            indexes = list(tops[:limit])
+        else:
+            start = self.bisect("keys", encoded)
+            end = self.bisect("keys", encoded + PREFIX_END)
+            indexes = rank(self.sections["key_records"][start:end], scores, ids, limit)
+        return [
+            (ids[index], self.get_string("names", index).decode(), scores[index])
+            for index in indexes
+        ]
+
+
+def get_name_map(resource: str) -> Optional[NameMap]:
+    """Return the resource's current name map, or None if none was written."""
+    return player_maps.load(get_pointer_name(resource), NameMap)
+
+
+def get_matches(resource: str, prefix: str, limit: int) -> List[Record]:
+    """Return the same records as NameMap.lookup, from the database.
+
+    Only names with a word starting with the prefix as typed are matched, so
+    accented names are only completed by prefixes typed with their accents.
+    Prefixes shorter than MIN_MATCH_LENGTH complete nothing, the trigram
+    indexes of the names can't narrow them down.
+    """
+    if len(normalize(prefix)) < MIN_MATCH_LENGTH:
+        return []
+    typed = prefix.strip()
+    # icontains is served by the trigram index, the regex keeps the word starts
+    names = Q(name__icontains=typed, name__iregex=rf"\m{re.escape(typed)}")
+    if resource == "players":
+        return list(
+            models.Player.objects.filter(names, deceased=False)
+            .order_by("-rating", "pk")
+            .values_list("pk", "name", "rating")[:limit]
+        )
+    latest = (
+        models.DatasetVersion.objects.completed()
+        .order_by("-pk")
+        .values_list("pk", flat=True)
+        .first()
+    )
+    active_players = get_active_players(latest)
+    records = [
+        (primary_key, name, active_players.get(rc_id, 0))
+        for primary_key, name, rc_id in models.Club.objects.filter(names).values_list(
+            "pk", "name", "rc_id"
+        )
+    ]
+    return heapq.nsmallest(limit, records, key=lambda record: (-record[2], record[0]))
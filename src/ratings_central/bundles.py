@@ -0,0 +1,137 @@
+"""Bundle the player and club lists into one SQLite database for offline use.
+
+The bundle holds a table per list with the same columns as its resources,
+indexes for the usual lookups and an FTS5 index of the names, so clients can
+search it without the API. It is gzipped and published next to the other
+snapshots of the dataset version.
+"""
+import os
+import sqlite3
+import tempfile
+from typing import Any, Dict, List, Tuple, Type
+
+from django.core.files.storage import Storage
+from django.db import models as django_models
+from rest_framework.serializers import ModelSerializer
+from rest_framework_json_api import utils
+
+from common.serializers import FieldPlan
+from ratings_central import models, snapshots
+
+FORMAT_VERSION = 1
+FILE_NAME = "ratings.sqlite3.gz"
+CONTENT_TYPE = "application/vnd.sqlite3"
+# the indexed columns of each table, in addition to the id
+INDEXES: Dict[str, List[Tuple[str, ...]]] = {
+    "players": [("rc_id",), ("name",), ("rating",), ("country", "rating")],
+    "clubs": [("rc_id",), ("name",), ("country", "name")],
+}
+# the columns of each table searched by its full-text index
+SEARCH_COLUMNS: Dict[str, List[str]] = {
+    "players": ["name"],
+    "clubs": ["name", "nickname", "city"],
+}
+# names match with or without their diacritics, e.g. "zoe" matches "Zoë"
+TOKENIZER = "unicode61 remove_diacritics 2"
+
+
+def get_column_type(field: django_models.Field) -> str:
+    """Return the SQLite column definition of the model field."""
+    column_type = (
+        "INTEGER"
+        if isinstance(
+            field,
+            (django_models.IntegerField, django_models.BooleanField),
+        )
+        else "TEXT"
+    )
+    return column_type if field.null else f"{column_type} NOT NULL"
+
+
+def write_table(
+    connection: sqlite3.Connection, serializer_class: Type[ModelSerializer]
+) -> Tuple[str, int]:
+    """Write the list's table and its indexes, returning its name and row count.
+
+    The values are those of the list's resources, so dates are ISO 8601 text.
+    """
+    table = utils.get_resource_type_from_serializer(serializer_class)
+    plan = FieldPlan.build(serializer_class(), table)
+    if plan is None:
+        raise ValueError(f"{serializer_class.__name__} cannot be bundled.")
+    model = serializer_class.Meta.model
+    definitions = ", ".join(
+        f"{name} {get_column_type(model._meta.get_field(column))}"
+        for name, column in zip(plan.names, plan.columns[1:])
+    )
+    connection.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, {definitions})")
+    rows = plan.values_list(model.objects.order_by("pk")).iterator(
+        chunk_size=snapshots.CHUNK_SIZE
+    )
+    placeholders = ", ".join("?" * len(plan.columns))
+    counter = snapshots.RowCounter()
+    connection.executemany(
+        f"INSERT INTO {table} VALUES ({placeholders})",
+        counter(plan.iter_values(rows)),
+    )
+    for columns in INDEXES[table]:
+        connection.execute(
+            f"CREATE INDEX {table}_{'_'.join(columns)}_idx "
+            f"ON {table} ({', '.join(columns)})"
+        )
+    # an external content table, the names are only stored once
+    connection.execute(
+        f"CREATE VIRTUAL TABLE {table}_search USING fts5("
+        f"{', '.join(SEARCH_COLUMNS[table])}, content='{table}', "
+        f"content_rowid='id', tokenize='{TOKENIZER}')"
+    )
+    connection.execute(
+        f"INSERT INTO {table}_search ({table}_search) VALUES ('rebuild')"
+    )
+    return table, counter.count
+
+
+def publish_bundle(
+    storage: Storage,
+    dataset_version: models.DatasetVersion,
+    serializer_classes: List[Type[ModelSerializer]],
+) -> Dict[str, Any]:
+    """Publish the SQLite bundle of the lists and return its details.
+
+    The database is built in a temporary directory, analyzed and vacuumed, then
+    gzipped. The dataset version is stored in the `meta` table and the format
+    version in `PRAGMA user_version`.
+    """
+    completed = dataset_version.get_completed()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "ratings.sqlite3")
+        connection = sqlite3.connect(path)
+        try:
+            with connection:
+                connection.execute(f"PRAGMA user_version = {FORMAT_VERSION}")
+                connection.execute(
+                    "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+                )
+                connection.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [
+                        ("dataset_version", str(dataset_version.pk)),
+                        ("completed", completed.isoformat()),
+                    ],
+                )
+                counts = dict(
+                    write_table(connection, serializer_class)
+                    for serializer_class in serializer_classes
+                )
+            connection.execute("ANALYZE")
+            connection.execute("VACUUM")
+        finally:
+            connection.close()
+        with open(path, "rb") as fyl:
+            details = snapshots.save_gzipped(
+                storage,
+                snapshots.get_key(dataset_version, FILE_NAME),
+                iter(lambda: fyl.read(1024 * 1024), b""),
+                CONTENT_TYPE,
+            )
+    return {"resource": "bundle", "format": "sqlite", "counts": counts, **details}
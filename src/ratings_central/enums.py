@@ -26,6 +26,24 @@ class Sport(IntegerChoices):
     SANDPAPER = 4, _("Sandpaper Table Tennis")
 
 
+class AgeCategory(TextChoices):
+    """Age categories, by the age players reach in the reference year.
+
+    The categories are open ended ranges, e.g. U15 is under 15 and O40 is 40
+    and over, see ratings_central.leaderboards.
+    """
+
+    U11 = "U11", _("Under 11")
+    U13 = "U13", _("Under 13")
+    U15 = "U15", _("Under 15")
+    U18 = "U18", _("Under 18")
+    U21 = "U21", _("Under 21")
+    SENIOR = "SEN", _("Senior")
+    O30 = "O30", _("Over 30")
+    O40 = "O40", _("Over 40")
+    O50 = "O50", _("Over 50")
+
+
 class Country(TextChoices):
     """Country choices offered by ratings central."""
 
@@ -1,34 +1,128 @@
 """Filters for ratings_central app."""
+from django.utils import timezone
 from django_filters import rest_framework as filters
 
-from ratings_central import models
+from ratings_central import enums, leaderboards, models
 
 
 class PlayerFilter(filters.FilterSet):
-    """FilterSet for players endpoint."""
+    """FilterSet for players endpoint.
+
+    The age category is a range of the age players reach in the year of
+    `age_reference` (today by default), e.g. O40 is 40 and over, served by
+    the birth year index.
+    """
+
+    # the rows created or changed by the imports after a dataset version
+    since = filters.NumberFilter(field_name="updated_in", lookup_expr="gt")
+    age_category = filters.ChoiceFilter(
+        choices=enums.AgeCategory.choices, method="filter_age_category"
+    )
+    # only read by filter_age_category, see filter_queryset
+    age_reference = filters.DateFilter()
 
     class Meta:
         """FilterSet Meta information."""
 
         model = models.Player
         fields = {
-            "rc_id": ["exact"],
+            "rc_id": ["exact", "in"],
             "email": ["exact"],
             "name": ["exact", "icontains"],
+            "rating": ["gte", "lte"],
+            "st_dev": ["gte", "lte"],
+            "last_played": ["gte", "lte"],
+            "birth": ["gte", "lte"],
+            "birth_year": ["exact", "gte", "lte"],
             "deceased": ["exact"],
+            "active": ["exact"],
+            "usatt_id": ["exact", "in"],
+            "tta_id": ["exact", "in"],
+            "ittf_id": ["exact", "in"],
         }
 
+    def filter_queryset(self, queryset):
+        """Filter the queryset by every filter but age_reference."""
+        for name, value in self.form.cleaned_data.items():
+            if name != "age_reference":
+                queryset = self.filters[name].filter(queryset, value)
+        return queryset
+
+    def filter_age_category(  # pylint: disable=unused-argument
+        self, queryset, name, value
+    ):
+        """Filter the players to the birth years of the age category's range."""
+        reference = self.form.cleaned_data.get("age_reference") or timezone.localdate()
+        first, last = leaderboards.get_range_birth_years(value, reference.year)
+        if first is not None:
+            queryset = queryset.filter(birth_year__gte=first)
+        if last is not None:
+            queryset = queryset.filter(birth_year__lte=last)
+        return queryset
+
+
+class RetainedPlayerFilter(PlayerFilter):
+    """FilterSet for the players of the retained dataset version."""
+
+    class Meta:
+        """FilterSet Meta information."""
+
+        model = models.RetainedPlayer
+        fields = PlayerFilter.Meta.fields
+
 
 class ClubFilter(filters.FilterSet):
     """FilterSet for clubs endpoint."""
 
+    since = filters.NumberFilter(field_name="updated_in", lookup_expr="gt")
+
     class Meta:
         """FilterSet Meta information."""
 
         model = models.Club
         fields = {
-            "rc_id": ["exact"],
+            "rc_id": ["exact", "in"],
             "email": ["exact"],
             "name": ["exact", "icontains"],
             "status": ["exact"],
         }
+
+
+class RetainedClubFilter(ClubFilter):
+    """FilterSet for the clubs of the retained dataset version."""
+
+    class Meta:
+        """FilterSet Meta information."""
+
+        model = models.RetainedClub
+        fields = ClubFilter.Meta.fields
+
+
+class RankingFilter(filters.FilterSet):
+    """FilterSet for rankings endpoint.
+
+    The country, gender and age category left out of the filters select the
+    leaderboard ranking every player regardless of them.
+    """
+
+    scopes = ["country", "gender", "age_category"]
+
+    class Meta:
+        """FilterSet Meta information."""
+
+        model = models.Ranking
+        fields = {
+            "player": ["exact"],
+            "sport": ["exact"],
+            "country": ["exact"],
+            "gender": ["exact"],
+            "age_category": ["exact"],
+        }
+
+    def filter_queryset(self, queryset):
+        """Select the overall leaderboard of the scopes not filtered on."""
+        queryset = super().filter_queryset(queryset)
+        for name in self.scopes:
+            if self.form.cleaned_data.get(name) in [None, ""]:
+                queryset = queryset.filter(**{f"{name}__isnull": True})
+        return queryset
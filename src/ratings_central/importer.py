@@ -2,13 +2,42 @@
 import csv
 import zipfile
 from io import BytesIO, StringIO
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import requests
-from django.db.models import Model
+from django.conf import settings
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 
-from ratings_central import models
+from ratings_central import models, retention, signals
+
+CLUB_LIST_NAME = "ClubList.csv"
+PLAYER_LIST_NAME = "RatingList.csv"
+# the column of the lists' ids and the field they are stored in
+ID_MAPPING = ("ID", "rc_id")
+
+ImportedModel = Union[Type[models.Player], Type[models.Club]]
+# a player or club, typing the instances bulk created by its model
+ImportedInstance = TypeVar("ImportedInstance", models.Player, models.Club)
+DefaultsMapping = Dict[str, Union[str, Tuple[str, Callable[[str], Any]]]]
+DerivedMapping = Dict[str, Callable[[Dict[str, Any]], Any]]
+
+
+class ImplausibleRemovals(Exception):
+    """A list is missing too many of the current rows to be imported."""
 
 
 def strip_whitespace(to_strip: str) -> str:
@@ -33,19 +62,56 @@ def download_rc_lists(director: models.Director) -> Dict[str, str]:
 def import_zipped_list(director: models.Director) -> None:
     """Download and import the zipped list."""
     data = download_rc_lists(director)
-    club_list_name = "ClubList.csv"
-    player_list_name = "RatingList.csv"
-    if club_list_name in data:
-        import_club_list(data[club_list_name])
-    if player_list_name in data:
-        import_player_list(data[player_list_name])
+    lists: List[Tuple[ImportedModel, str]] = [
+        (models.Club, CLUB_LIST_NAME),
+        (models.Player, PLAYER_LIST_NAME),
+    ]
+    for model, list_name in lists:
+        if list_name in data:
+            check_removals(model, data[list_name])
+    previous = models.DatasetVersion.objects.completed().order_by("-pk").first()
+    if previous is not None:
+        retention.retain(previous)
+    dataset_version = models.DatasetVersion.objects.create()
+    if CLUB_LIST_NAME in data:
+        import_club_list(data[CLUB_LIST_NAME], dataset_version)
+    if PLAYER_LIST_NAME in data:
+        import_player_list(data[PLAYER_LIST_NAME], dataset_version)
+    dataset_version.completed = timezone.now()
+    models.Player.objects.update_active(
+        dataset_version.completed.date(), dataset_version
+    )
+    dataset_version.save(update_fields=["completed"])
+    retention.extend(dataset_version.completed)
+    signals.import_completed.send(
+        sender=models.DatasetVersion, dataset_version=dataset_version
+    )
+
+
+def check_removals(model: ImportedModel, data: str) -> None:
+    """Raise ImplausibleRemovals if the list would remove too many rows.
+
+    A truncated or partial list would otherwise remove every row missing
+    from it. Empty lists remove nothing, so they are not checked.
+    """
+    id_key, model_rc_id = ID_MAPPING
+    rc_ids = {row[id_key] for row in csv.DictReader(StringIO(data)) if id_key in row}
+    if not rc_ids:
+        return
+    current = model.objects.count()
+    missing = model.objects.exclude(**{f"{model_rc_id}__in": rc_ids}).count()
+    if missing > current * settings.IMPORT_MAX_REMOVED_SHARE:
+        raise ImplausibleRemovals(
+            f"The {model.JSONAPIMeta.resource_name} list is missing {missing} of "
+            f"the {current} current rows, more than IMPORT_MAX_REMOVED_SHARE "
+            f"({settings.IMPORT_MAX_REMOVED_SHARE:.0%}) allows."
+        )
 
 
-def import_club_list(club_list: str) -> None:
+def import_club_list(club_list: str, dataset_version: models.DatasetVersion) -> None:
     """Import the list of clubs."""
     import_data_to_model(
         model=models.Club,
-        id_mapping=("ID", "rc_id"),
         defaults_mapping={
             "Name": "name",
             "Nickname": "nickname",
@@ -63,14 +129,16 @@ def import_club_list(club_list: str) -> None:
             "Status": "status",
         },
         data=club_list,
+        dataset_version=dataset_version,
     )
 
 
-def import_player_list(player_list: str) -> None:
+def import_player_list(
+    player_list: str, dataset_version: models.DatasetVersion
+) -> None:
     """Import the list of players."""
     import_data_to_model(
         model=models.Player,
-        id_mapping=("ID", "rc_id"),
         defaults_mapping={
             "Name": "name",
             "Rating": "rating",
@@ -93,23 +161,29 @@ def import_player_list(player_list: str) -> None:
             "ITTF": "ittf_id",
             "Deceased": ("deceased", lambda v: v == "D"),
         },
+        derived_mapping={"birth_year": get_birth_year},
         data=player_list,
+        dataset_version=dataset_version,
     )
 
 
-def import_data_to_model(
-    model: Type[Model],
-    id_mapping: Tuple[str, str],
-    defaults_mapping: Dict[str, Union[str, Tuple[str, Callable[[str], Any]]]],
+def get_birth_year(values: Dict[str, Any]) -> Optional[int]:
+    """Return the year of the player's birth, if known."""
+    birth = values.get("birth")
+    return None if birth is None else birth.year
+
+
+def map_rows(
     data: str,
-):
-    """Import the csv data to a model."""
-    id_key, model_rc_id = id_mapping
-    instances: Dict[str, Model] = {}
-    fields = [
-        field[0] if isinstance(field, tuple) else field
-        for field in defaults_mapping.values()
-    ]
+    defaults_mapping: DefaultsMapping,
+    derived_mapping: DerivedMapping,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the model values of each row of the csv data.
+
+    The fields of `derived_mapping` are computed from the mapped values of
+    each row.
+    """
+    id_key, model_rc_id = ID_MAPPING
     for row in csv.DictReader(StringIO(data)):
         if id_key not in row:
             continue
@@ -123,30 +197,109 @@ def import_data_to_model(
                 converter = mapped_key[1]  # type: ignore
                 mapped_key = mapped_key[0]
             mapped_values[mapped_key] = value if converter is None else converter(value)
-        instances[row[id_key]] = model(**mapped_values)
+        for field, derive in derived_mapping.items():
+            mapped_values[field] = derive(mapped_values)
+        yield mapped_values
+
+
+def import_data_to_model(
+    model: Type[ImportedInstance],
+    defaults_mapping: DefaultsMapping,
+    data: str,
+    dataset_version: models.DatasetVersion,
+    derived_mapping: Optional[DerivedMapping] = None,
+):
+    """Import the csv data to a model.
+
+    The rows missing from a non-empty list are removed.
+    """
+    model_rc_id = ID_MAPPING[1]
+    derived_mapping = derived_mapping or {}
+    instances: Dict[str, ImportedInstance] = {}
+    imported: Set[int] = set()
+    fields = [
+        field[0] if isinstance(field, tuple) else field
+        for field in defaults_mapping.values()
+    ] + list(derived_mapping)
+    for mapped_values in map_rows(data, defaults_mapping, derived_mapping):
+        instances[mapped_values[model_rc_id]] = model(**mapped_values)
         if len(instances) >= 1000:
-            bulk_update_or_create(model, instances, model_rc_id, fields)
+            imported |= bulk_update_or_create(
+                model, instances, model_rc_id, fields, dataset_version
+            )
             instances = {}
     if instances:
-        bulk_update_or_create(model, instances, model_rc_id, fields)
+        imported |= bulk_update_or_create(
+            model, instances, model_rc_id, fields, dataset_version
+        )
+    if imported:
+        remove_missing(model, imported, model_rc_id, dataset_version)
 
 
 def bulk_update_or_create(
-    model: Type[Model],
-    instances: Dict[str, Model],
+    model: Type[ImportedInstance],
+    instances: Dict[str, ImportedInstance],
     model_rc_id: str,
     fields: List[str],
-):
-    """Bulk update or create the instances."""
-    to_create = {**instances}
-    to_update = []
-    for primary_key, id_value in model.objects.filter(
+    dataset_version: models.DatasetVersion,
+) -> Set[int]:
+    """Bulk update or create the instances, returning their primary keys.
+
+    Only the rows whose values changed are updated, and the created or
+    changed rows are marked as updated in the dataset version. The removed
+    rows found in the list are restored.
+    """
+    to_create: Dict[str, ImportedInstance] = {**instances}
+    to_update: List[ImportedInstance] = []
+    model_fields = [model._meta.get_field(field) for field in fields]
+    primary_keys = set()
+    for primary_key, id_value, removed_in, *values in model.all_objects.filter(
         **{f"{model_rc_id}__in": instances.keys()}
-    ).values_list("pk", model_rc_id):
-        instance = to_create.pop(str(id_value), None)
-        if instance is None:
+    ).values_list("pk", model_rc_id, "removed_in", *fields):
+        if str(id_value) not in to_create:
             continue
+        instance = to_create.pop(str(id_value))
         instance.pk = primary_key
-        to_update.append(instance)
-    model.objects.bulk_create(to_create.values())
-    model.objects.bulk_update(to_update, fields=fields)
+        primary_keys.add(primary_key)
+        if removed_in is not None or any(
+            field.to_python(getattr(instance, field.attname)) != value
+            for field, value in zip(model_fields, values)
+        ):
+            to_update.append(instance)
+    updated_at = timezone.now()
+    for instance in chain(to_create.values(), to_update):
+        instance.updated_in = dataset_version
+        instance.updated_at = updated_at
+    primary_keys.update(
+        instance.pk for instance in model.objects.bulk_create(to_create.values())
+    )
+    # the removed rows being restored are only found by all_objects
+    model.all_objects.bulk_update(
+        to_update, fields=[*fields, "updated_in", "updated_at", "removed_in"]
+    )
+    return primary_keys
+
+
+def remove_missing(
+    model: ImportedModel,
+    imported: Set[int],
+    model_rc_id: str,
+    dataset_version: models.DatasetVersion,
+):
+    """Mark the rows which were not imported as removed, recording their removal.
+
+    The rows are kept as tombstones, hidden by the models' default manager,
+    so a list missing rows by mistake does not lose them: the next import
+    listing them restores them.
+    """
+    missing = model.objects.exclude(pk__in=imported)
+    models.Removal.objects.bulk_create(
+        models.Removal(
+            dataset_version=dataset_version,
+            resource=model.JSONAPIMeta.resource_name,
+            record_id=primary_key,
+            rc_id=id_value,
+        )
+        for primary_key, id_value in missing.values_list("pk", model_rc_id)
+    )
+    missing.update(removed_in=dataset_version)
@@ -0,0 +1,115 @@
+"""Compute the leaderboards of each sport after an import."""
+from itertools import product
+from typing import Any, List, Optional, Tuple
+
+from django.db import connection, transaction
+
+from ratings_central import enums, models
+
+# the minimum and the exclusive maximum age reached in the reference year of
+# each age category: U15 is under 15 and O40 is 40 and over
+AGE_RANGES = {
+    enums.AgeCategory.U11: (None, 11),
+    enums.AgeCategory.U13: (None, 13),
+    enums.AgeCategory.U15: (None, 15),
+    enums.AgeCategory.U18: (None, 18),
+    enums.AgeCategory.U21: (None, 21),
+    enums.AgeCategory.SENIOR: (21, None),
+    enums.AgeCategory.O30: (30, None),
+    enums.AgeCategory.O40: (40, None),
+    enums.AgeCategory.O50: (50, None),
+}
+
+# whether players are ranked by country, gender and age category
+SCOPES = list(product([False, True], repeat=3))
+
+
+def get_range_birth_years(
+    category: str, reference_year: int
+) -> Tuple[Optional[int], Optional[int]]:
+    """Return the first and last birth years of the age category's range.
+
+    The under categories have no last birth year and the others no first.
+    """
+    minimum_age, maximum_age = AGE_RANGES[enums.AgeCategory(category)]
+    first = None if maximum_age is None else reference_year - maximum_age + 1
+    last = None if minimum_age is None else reference_year - minimum_age
+    return first, last
+
+
+def get_age_categories_sql(reference_year: int) -> Tuple[str, List[Any]]:
+    """Return the SQL of the age categories and their range's birth years."""
+    rows, params = [], []
+    for category in AGE_RANGES:
+        rows.append("(%s, %s::integer, %s::integer)")
+        params.extend(
+            [category.value, *get_range_birth_years(category, reference_year)]
+        )
+    return f"(VALUES {', '.join(rows)})", params
+
+
+def compute_rankings(dataset_version: models.DatasetVersion) -> int:
+    """Replace the rankings with those of the dataset version.
+
+    Every living player is ranked within their sport in each combination of
+    country, gender and age category, the dimensions left out being null.
+    Players are ranked in every age category whose range covers their age,
+    as the players are filtered by them.
+    Ties share the best rank and the percentile is the share of the
+    leaderboard rated strictly lower. The rankings are replaced in a single
+    transaction, so readers never see a partial leaderboard.
+    """
+    age_categories, age_categories_params = get_age_categories_sql(
+        dataset_version.get_completed().year
+    )
+    scopes = ", ".join(["(%s, %s, %s)"] * len(SCOPES))
+    sql = f"""
+        INSERT INTO {models.Ranking._meta.db_table} (
+            player_id, sport, country, gender, age_category, rating, rank, percentile
+        )
+        SELECT
+            id,
+            sport,
+            country,
+            gender,
+            age_category,
+            rating,
+            RANK() OVER (leaderboard ORDER BY rating DESC),
+            100 * PERCENT_RANK() OVER (leaderboard ORDER BY rating)
+        FROM (
+            SELECT
+                player.id,
+                player.sport,
+                player.rating,
+                CASE WHEN scope.by_country THEN player.country END AS country,
+                CASE WHEN scope.by_gender THEN player.gender END AS gender,
+                category.value AS age_category
+            FROM {models.Player._meta.db_table} AS player
+            CROSS JOIN (VALUES {scopes}) AS scope (
+                by_country, by_gender, by_age_category
+            )
+            LEFT JOIN {age_categories} AS category (
+                value, first_birth_year, last_birth_year
+            ) ON scope.by_age_category
+            AND (
+                category.first_birth_year IS NULL
+                OR player.birth_year >= category.first_birth_year
+            )
+            AND (
+                category.last_birth_year IS NULL
+                OR player.birth_year <= category.last_birth_year
+            )
+            WHERE NOT player.deceased
+            AND player.removed_in_id IS NULL
+            AND (NOT scope.by_age_category OR category.value IS NOT NULL)
+        ) AS scoped
+        WINDOW leaderboard AS (PARTITION BY sport, country, gender, age_category)
+    """
+    params = [*[flag for scope in SCOPES for flag in scope], *age_categories_params]
+    with transaction.atomic():
+        models.Ranking.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            count = cursor.rowcount
+            cursor.execute(f"ANALYZE {models.Ranking._meta.db_table}")
+    return count
@@ -0,0 +1,49 @@
+"""Publish the snapshots of each dataset version and their manifest."""
+import json
+from typing import Any, Dict, Optional
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+
+from ratings_central import bundles, models, serializers, snapshots
+
+# the serializers of the lists which are snapshotted
+SERIALIZER_CLASSES = [serializers.PlayerSerializer, serializers.ClubSerializer]
+
+
+def publish_snapshots(
+    dataset_version: models.DatasetVersion, storage: Optional[Storage] = None
+) -> Dict[str, Any]:
+    """Publish the snapshots of the dataset version and return the manifest.
+
+    Each list is rendered once as a gzipped JSON:API document holding every
+    resource, once as gzipped CSV and once as a Parquet file for analytics.
+    Both lists are also bundled into a gzipped SQLite database for offline
+    clients. The rows are read through a server-side cursor and written to temporary
+    files, so memory stays constant.
+    """
+    # pyarrow is only loaded by the workers publishing snapshots
+    # pylint: disable=import-outside-toplevel
+    from ratings_central import analytics
+
+    completed = dataset_version.get_completed()
+    storage = storage or snapshots.get_storage()
+    files = []
+    for serializer_class in SERIALIZER_CLASSES:
+        files += snapshots.publish_list(storage, dataset_version, serializer_class)
+        files.append(
+            analytics.publish_parquet(storage, dataset_version, serializer_class)
+        )
+    files.append(bundles.publish_bundle(storage, dataset_version, SERIALIZER_CLASSES))
+    manifest = {
+        "dataset_version": dataset_version.pk,
+        "completed": completed.isoformat(),
+        "files": files,
+    }
+    storage.save(
+        snapshots.get_key(dataset_version, "manifest.json"),
+        ContentFile(json.dumps(manifest).encode()),
+    )
+    dataset_version.manifest = manifest
+    dataset_version.save(update_fields=["manifest"])
+    return manifest
@@ -0,0 +1,99 @@
+"""Match lists of names to the living players in a single query.
+
+The candidates of a name are the players whose upper cased name is similar
+to it by trigrams (served by player_name_upper_trgm_idx) or whose phonetic
+keys include all of its keys (served by player_name_keys_idx). The phonetic
+keys are the Double Metaphone codes of each word, computed by the
+`ratings_central_name_keys` function of migration 0011.
+
+Candidates are scored by their trigram similarity, with bonuses for matching
+phonetic keys and the hints given with the name. The candidates found by
+each index are flagged by a branch of a union, so the keys of a candidate
+are only computed by the index condition, not again for its score.
+"""
+from typing import Any, Dict, List
+
+from django.db import connection
+
+from ratings_central import models
+
+PHONETIC_BONUS = 0.2
+BIRTH_YEAR_BONUS = 0.3
+CLUB_BONUS = 0.2
+COUNTRY_BONUS = 0.1
+# the hints which can be given with a name
+HINTS = ["birth_year", "club", "country"]
+CANDIDATE_FIELDS = ["id", "rc_id", "name", "rating", "birth", "country", "club"]
+
+
+def match_players(
+    queries: List[Dict[str, Any]], limit: int
+) -> List[List[Dict[str, Any]]]:
+    """Return the best scored candidates of each name, best first.
+
+    Each query holds a name and optionally the hints of HINTS.
+    """
+    if not queries:
+        return []
+    table = models.Player._meta.db_table
+    columns = "id, rc_id, name, rating, birth, country, rc_primary_club_id"
+    living = "NOT deceased AND removed_in_id IS NULL"
+    values = ", ".join(["(%s, %s, %s::integer, %s::integer, %s)"] * len(queries))
+    sql = f"""
+        SELECT
+            query.position,
+            player.id,
+            player.rc_id,
+            player.name,
+            player.rating,
+            player.birth,
+            player.country,
+            player.rc_primary_club_id,
+            player.score
+        FROM (
+            SELECT *, ratings_central_name_keys(name) AS name_keys
+            FROM (VALUES {values}) AS query (position, name, birth_year, club, country)
+        ) AS query
+        CROSS JOIN LATERAL (
+            SELECT
+                candidate.*,
+                similarity(UPPER(candidate.name), UPPER(query.name))
+                + CASE WHEN candidate.phonetic THEN %s ELSE 0 END
+                + CASE WHEN EXTRACT(YEAR FROM candidate.birth) = query.birth_year
+                    THEN %s ELSE 0 END
+                + CASE WHEN candidate.rc_primary_club_id = query.club
+                    THEN %s ELSE 0 END
+                + CASE WHEN candidate.country = query.country
+                    THEN %s ELSE 0 END
+                AS score
+            FROM (
+                SELECT DISTINCT ON (id) *
+                FROM (
+                    SELECT {columns}, false AS phonetic
+                    FROM {table}
+                    WHERE {living} AND UPPER(name) %% UPPER(query.name)
+                    UNION ALL
+                    SELECT {columns}, true
+                    FROM {table}
+                    WHERE {living}
+                    AND cardinality(query.name_keys) > 0
+                    AND ratings_central_name_keys(name) @> query.name_keys
+                ) AS candidate
+                ORDER BY id, phonetic DESC
+            ) AS candidate
+            ORDER BY score DESC, candidate.id
+            LIMIT %s
+        ) AS player
+        ORDER BY query.position, player.score DESC, player.id
+    """
+    params: List[Any] = []
+    for position, query in enumerate(queries):
+        params += [position, query["name"], *[query.get(hint) for hint in HINTS]]
+    params += [PHONETIC_BONUS, BIRTH_YEAR_BONUS, CLUB_BONUS, COUNTRY_BONUS, limit]
+    matches: List[List[Dict[str, Any]]] = [[] for _ in queries]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for position, *values, score in cursor.fetchall():
+            candidate = dict(zip(CANDIDATE_FIELDS, values))
+            matches[position].append({**candidate, "score": round(score, 3)})
+    return matches
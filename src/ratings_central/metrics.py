@@ -0,0 +1,38 @@
+"""Prometheus metrics of the ratings, see common.metrics."""
+from django.utils import timezone
+from prometheus_client import Counter
+from prometheus_client.core import GaugeMetricFamily
+
+from ratings_central import models
+
+# lookups served by a memory-mapped map (hits) or the database (misses)
+MAP_LOOKUPS = Counter(
+    "ratings_central_map_lookups_total",
+    "Lookups of the memory-mapped player and name maps, by map and result.",
+    ["map", "result"],
+)
+
+
+class DatasetVersionCollector:
+    """Collect the latest completed dataset version and its age when scraped."""
+
+    def collect(self):  # pylint: disable=no-self-use
+        """Yield the dataset version and the seconds since its import completed."""
+        version = GaugeMetricFamily(
+            "ratings_central_dataset_version",
+            "The latest completed dataset version.",
+        )
+        age = GaugeMetricFamily(
+            "ratings_central_import_age_seconds",
+            "Seconds since the latest import completed.",
+        )
+        dataset_version = (
+            models.DatasetVersion.objects.completed().order_by("-pk").first()
+        )
+        if dataset_version is not None:
+            version.add_metric([], dataset_version.pk)
+            age.add_metric(
+                [], (timezone.now() - dataset_version.completed).total_seconds()
+            )
+        yield version
+        yield age
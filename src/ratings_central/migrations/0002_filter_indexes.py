@@ -0,0 +1,78 @@
+# Generated by Django 2.2.22 on 2026-10-19 09:12
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+import common.operations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are built concurrently, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("ratings_central", "0001_initial"),
+    ]
+
+    # NOTE: The trigram indexes are built with fastupdate off. Otherwise rows
+    # written by the importer sit in the GIN pending list until the next
+    # vacuum, and the planner (correctly) prefers a sequential scan over
+    # reading the pending list.
+    operations = [
+        TrigramExtension(),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["email"], name="player_email_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["name"], name="player_name_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                fields=["deceased", "id"], name="player_deceased_id_idx"
+            ),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                fields=["deceased", "name"], name="player_deceased_name_idx"
+            ),
+        ),
+        common.operations.RunSQLConcurrently(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS player_name_upper_trgm_idx "
+                'ON "ratings_central_player" '
+                'USING gin ((UPPER("name"::text)) gin_trgm_ops) '
+                "WITH (fastupdate = off)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS player_name_upper_trgm_idx",
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="club",
+            index=models.Index(fields=["email"], name="club_email_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="club",
+            index=models.Index(fields=["name"], name="club_name_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="club",
+            index=models.Index(fields=["status", "id"], name="club_status_id_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="club",
+            index=models.Index(fields=["status", "name"], name="club_status_name_idx"),
+        ),
+        common.operations.RunSQLConcurrently(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS club_name_upper_trgm_idx "
+                'ON "ratings_central_club" '
+                'USING gin ((UPPER("name"::text)) gin_trgm_ops) '
+                "WITH (fastupdate = off)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS club_name_upper_trgm_idx",
+        ),
+    ]
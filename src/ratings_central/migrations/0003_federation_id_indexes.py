@@ -0,0 +1,30 @@
+# Generated by Django 2.2.22 on 2026-10-19 10:03
+
+from django.db import migrations, models
+
+import common.operations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are built concurrently, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("ratings_central", "0002_filter_indexes"),
+    ]
+
+    operations = [
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["usatt_id"], name="player_usatt_id_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["tta_id"], name="player_tta_id_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["ittf_id"], name="player_ittf_id_idx"),
+        ),
+    ]
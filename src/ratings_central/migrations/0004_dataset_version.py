@@ -0,0 +1,31 @@
+# Generated by Django 2.2.22 on 2026-10-19 11:20
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ratings_central", "0003_federation_id_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DatasetVersion",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("started", models.DateTimeField(auto_now_add=True)),
+                ("completed", models.DateTimeField(null=True)),
+                ("manifest", django.contrib.postgres.fields.jsonb.JSONField(null=True)),
+            ],
+        ),
+    ]
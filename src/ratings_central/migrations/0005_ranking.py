@@ -0,0 +1,321 @@
+# Generated by Django 2.2.22 on 2026-10-19 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ratings_central", "0004_dataset_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Ranking",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sport",
+                    models.IntegerField(
+                        choices=[
+                            (1, "Table Tennis"),
+                            (3, "Hardbat Table Tennis"),
+                            (4, "Sandpaper Table Tennis"),
+                        ]
+                    ),
+                ),
+                (
+                    "country",
+                    models.CharField(
+                        choices=[
+                            ("AFG", "Afghanistan"),
+                            ("ALB", "Albania"),
+                            ("ALG", "Algeria"),
+                            ("ASA", "American Samoa"),
+                            ("AND", "Andorra"),
+                            ("ANG", "Angola"),
+                            ("ANT", "Antigua and Barbuda"),
+                            ("ARG", "Argentina"),
+                            ("ARM", "Armenia"),
+                            ("ARU", "Aruba"),
+                            ("AUS", "Australia"),
+                            ("AUT", "Austria"),
+                            ("AZE", "Azerbaijan"),
+                            ("BAH", "Bahamas"),
+                            ("BRN", "Bahrain"),
+                            ("BAN", "Bangladesh"),
+                            ("BAR", "Barbados"),
+                            ("BLR", "Belarus"),
+                            ("BEL", "Belgium"),
+                            ("BIZ", "Belize"),
+                            ("BEN", "Benin"),
+                            ("BER", "Bermuda"),
+                            ("BHU", "Bhutan"),
+                            ("BOL", "Bolivia"),
+                            ("BIH", "Bosnia and Herzegovina"),
+                            ("BOT", "Botswana"),
+                            ("BRA", "Brazil"),
+                            ("IVB", "British Virgin Islands"),
+                            ("BRU", "Brunei"),
+                            ("BUL", "Bulgaria"),
+                            ("BUR", "Burkina Faso"),
+                            ("BDI", "Burundi"),
+                            ("CAM", "Cambodia"),
+                            ("CMR", "Cameroon"),
+                            ("CAN", "Canada"),
+                            ("CPV", "Cape Verde"),
+                            ("CAY", "Cayman Islands"),
+                            ("CAF", "Central African Republic"),
+                            ("CHA", "Chad"),
+                            ("CHI", "Chile"),
+                            ("CHN", "China"),
+                            ("TPE", "Chinese Taipei"),
+                            ("COL", "Colombia"),
+                            ("COM", "Comoros"),
+                            ("COK", "Cook Islands"),
+                            ("CRC", "Costa Rica"),
+                            ("CRO", "Croatia"),
+                            ("CUB", "Cuba"),
+                            ("CUW", "Curaçao"),
+                            ("CYP", "Cyprus"),
+                            ("CZE", "Czech Republic"),
+                            ("TCH", "Czechoslovakia"),
+                            ("COD", "Democratic Republic of the Congo"),
+                            ("DEN", "Denmark"),
+                            ("DJI", "Djibouti"),
+                            ("DMA", "Dominica"),
+                            ("DOM", "Dominican Republic"),
+                            ("TLS", "East Timor"),
+                            ("ECU", "Ecuador"),
+                            ("EGY", "Egypt"),
+                            ("ESA", "El Salvador"),
+                            ("ENG", "England"),
+                            ("GEQ", "Equatorial Guinea"),
+                            ("ERI", "Eritrea"),
+                            ("EST", "Estonia"),
+                            ("SWZ", "Eswatini"),
+                            ("ETH", "Ethiopia"),
+                            ("FLK", "Falkland Islands"),
+                            ("FRO", "Faroe Islands"),
+                            ("FSM", "Federated States of Micronesia"),
+                            ("FIJ", "Fiji"),
+                            ("FIN", "Finland"),
+                            ("FRA", "France"),
+                            ("GAB", "Gabon"),
+                            ("GEO", "Georgia"),
+                            ("GER", "Germany"),
+                            ("GDR", "Germany D.R."),
+                            ("FRG", "Germany F.R."),
+                            ("GHA", "Ghana"),
+                            ("GIB", "Gibraltar"),
+                            ("GBR", "Great Britain"),
+                            ("GRE", "Greece"),
+                            ("GRN", "Grenada"),
+                            ("GUM", "Guam"),
+                            ("GUA", "Guatemala"),
+                            ("GGY", "Guernsey"),
+                            ("GUI", "Guinea"),
+                            ("GBS", "Guinea-Bissau"),
+                            ("GUY", "Guyana"),
+                            ("HAI", "Haiti"),
+                            ("HON", "Honduras"),
+                            ("HKG", "Hong Kong"),
+                            ("HUN", "Hungary"),
+                            ("ISL", "Iceland"),
+                            ("IND", "India"),
+                            ("INA", "Indonesia"),
+                            ("IRI", "Iran"),
+                            ("IRQ", "Iraq"),
+                            ("IRL", "Ireland"),
+                            ("IMN", "Isle of Man"),
+                            ("ISR", "Israel"),
+                            ("ITA", "Italy"),
+                            ("CIV", "Ivory Coast"),
+                            ("JAM", "Jamaica"),
+                            ("JPN", "Japan"),
+                            ("JEY", "Jersey"),
+                            ("JOR", "Jordan"),
+                            ("KAZ", "Kazakhstan"),
+                            ("KEN", "Kenya"),
+                            ("KIR", "Kiribati"),
+                            ("KOS", "Kosovo"),
+                            ("KUW", "Kuwait"),
+                            ("KGZ", "Kyrgyzstan"),
+                            ("LAO", "Laos"),
+                            ("LAT", "Latvia"),
+                            ("LBN", "Lebanon"),
+                            ("LES", "Lesotho"),
+                            ("LBR", "Liberia"),
+                            ("LBA", "Libya"),
+                            ("LIE", "Liechtenstein"),
+                            ("LTU", "Lithuania"),
+                            ("LUX", "Luxembourg"),
+                            ("MAC", "Macau"),
+                            ("MAD", "Madagascar"),
+                            ("MAW", "Malawi"),
+                            ("MAS", "Malaysia"),
+                            ("MDV", "Maldives"),
+                            ("MLI", "Mali"),
+                            ("MLT", "Malta"),
+                            ("MHL", "Marshall Islands"),
+                            ("MTN", "Mauritania"),
+                            ("MRI", "Mauritius"),
+                            ("MEX", "Mexico"),
+                            ("MDA", "Moldova"),
+                            ("MON", "Monaco"),
+                            ("MGL", "Mongolia"),
+                            ("MNE", "Montenegro"),
+                            ("MSR", "Montserrat"),
+                            ("MAR", "Morocco"),
+                            ("MOZ", "Mozambique"),
+                            ("MYA", "Myanmar"),
+                            ("NAM", "Namibia"),
+                            ("NRU", "Nauru"),
+                            ("NEP", "Nepal"),
+                            ("NED", "Netherlands"),
+                            ("AHO", "Netherlands Antilles"),
+                            ("NZL", "New Zealand"),
+                            ("NCA", "Nicaragua"),
+                            ("NIG", "Niger"),
+                            ("NGR", "Nigeria"),
+                            ("NIU", "Niue"),
+                            ("NFK", "Norfolk Island"),
+                            ("PRK", "North Korea"),
+                            ("MKD", "North Macedonia"),
+                            ("NIR", "Northern Ireland"),
+                            ("NOR", "Norway"),
+                            ("OMA", "Oman"),
+                            ("PAK", "Pakistan"),
+                            ("PLW", "Palau"),
+                            ("PLE", "Palestine"),
+                            ("PAN", "Panama"),
+                            ("PNG", "Papua New Guinea"),
+                            ("PAR", "Paraguay"),
+                            ("PER", "Peru"),
+                            ("PHI", "Philippines"),
+                            ("POL", "Poland"),
+                            ("POR", "Portugal"),
+                            ("PUR", "Puerto Rico"),
+                            ("QAT", "Qatar"),
+                            ("CGO", "Republic of the Congo"),
+                            ("ROU", "Romania"),
+                            ("RUS", "Russia"),
+                            ("RWA", "Rwanda"),
+                            ("SKN", "Saint Kitts and Nevis"),
+                            ("LCA", "Saint Lucia"),
+                            ("VIN", "Saint Vincent and the Grenadines"),
+                            ("SAM", "Samoa"),
+                            ("SMR", "San Marino"),
+                            ("STP", "São Tomé and Príncipe"),
+                            ("KSA", "Saudi Arabia"),
+                            ("SCO", "Scotland"),
+                            ("SEN", "Senegal"),
+                            ("SRB", "Serbia"),
+                            ("SCG", "Serbia and Montenegro"),
+                            ("SEY", "Seychelles"),
+                            ("SLE", "Sierra Leone"),
+                            ("SGP", "Singapore"),
+                            ("SVK", "Slovakia"),
+                            ("SLO", "Slovenia"),
+                            ("SOL", "Solomon Islands"),
+                            ("SOM", "Somalia"),
+                            ("RSA", "South Africa"),
+                            ("KOR", "South Korea"),
+                            ("SSD", "South Sudan"),
+                            ("ESP", "Spain"),
+                            ("SRI", "Sri Lanka"),
+                            ("SUD", "Sudan"),
+                            ("SUR", "Suriname"),
+                            ("SWE", "Sweden"),
+                            ("SUI", "Switzerland"),
+                            ("SYR", "Syria"),
+                            ("TJK", "Tajikistan"),
+                            ("TAN", "Tanzania"),
+                            ("THA", "Thailand"),
+                            ("GAM", "The Gambia"),
+                            ("TOG", "Togo"),
+                            ("TKL", "Tokelau"),
+                            ("TGA", "Tonga"),
+                            ("TTO", "Trinidad and Tobago"),
+                            ("TUN", "Tunisia"),
+                            ("TUR", "Turkey"),
+                            ("TKM", "Turkmenistan"),
+                            ("TCA", "Turks and Caicos"),
+                            ("TUV", "Tuvalu"),
+                            ("UGA", "Uganda"),
+                            ("UKR", "Ukraine"),
+                            ("UAE", "United Arab Emirates"),
+                            ("USA", "United States"),
+                            ("URU", "Uruguay"),
+                            ("URS", "USSR"),
+                            ("UZB", "Uzbekistan"),
+                            ("VAN", "Vanuatu"),
+                            ("VEN", "Venezuela"),
+                            ("VIE", "Vietnam"),
+                            ("ISV", "Virgin Islands"),
+                            ("WAL", "Wales"),
+                            ("YEM", "Yemen"),
+                            ("YUG", "Yugoslavia"),
+                            ("ZAM", "Zambia"),
+                            ("ZIM", "Zimbabwe"),
+                        ],
+                        max_length=3,
+                        null=True,
+                    ),
+                ),
+                (
+                    "gender",
+                    models.CharField(
+                        choices=[("M", "Male"), ("F", "Female")],
+                        max_length=1,
+                        null=True,
+                    ),
+                ),
+                (
+                    "age_category",
+                    models.CharField(
+                        choices=[
+                            ("U11", "Under 11"),
+                            ("U13", "Under 13"),
+                            ("U15", "Under 15"),
+                            ("U18", "Under 18"),
+                            ("U21", "Under 21"),
+                            ("SEN", "Senior"),
+                            ("O30", "Over 30"),
+                            ("O40", "Over 40"),
+                            ("O50", "Over 50"),
+                        ],
+                        max_length=3,
+                        null=True,
+                    ),
+                ),
+                ("rating", models.IntegerField()),
+                ("rank", models.IntegerField()),
+                ("percentile", models.FloatField()),
+                (
+                    "player",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rankings",
+                        to="ratings_central.Player",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="ranking",
+            index=models.Index(
+                fields=["sport", "country", "gender", "age_category", "rank", "player"],
+                name="ranking_leaderboard_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 2.2.22 on 2026-10-19 13:10
+
+import django.contrib.postgres.fields.jsonb
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ratings_central", "0005_ranking"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Statistics",
+            fields=[
+                (
+                    "dataset_version",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="statistics",
+                        serialize=False,
+                        to="ratings_central.DatasetVersion",
+                    ),
+                ),
+                ("ratings", django.contrib.postgres.fields.jsonb.JSONField()),
+                ("st_devs", django.contrib.postgres.fields.jsonb.JSONField()),
+                ("activity", django.contrib.postgres.fields.jsonb.JSONField()),
+                ("countries", django.contrib.postgres.fields.jsonb.JSONField()),
+                ("clubs", django.contrib.postgres.fields.jsonb.JSONField()),
+            ],
+            options={
+                "verbose_name_plural": "statistics",
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 2.2.22 on 2026-10-19 14:02
+
+from django.db import migrations, models
+
+import common.operations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are built concurrently, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("ratings_central", "0006_statistics"),
+    ]
+
+    operations = [
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["name", "id"], name="player_name_id_idx"),
+        ),
+        # superseded by player_name_id_idx, which serves name lookups as well
+        common.operations.RemoveIndexConcurrently(
+            model_name="player", name="player_name_idx"
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["rating", "id"], name="player_rating_id_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["st_dev", "id"], name="player_st_dev_id_idx"),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                fields=["last_played", "id"], name="player_last_played_id_idx"
+            ),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(fields=["birth"], name="player_birth_idx"),
+        ),
+    ]
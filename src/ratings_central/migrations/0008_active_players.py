@@ -0,0 +1,63 @@
+# Generated by Django 2.2.22 on 2026-10-19 14:48
+
+from django.db import migrations, models
+
+import common.operations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are built concurrently, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("ratings_central", "0007_sort_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="active",
+            field=models.BooleanField(default=False),
+        ),
+        # flag the active players until the next import recomputes them
+        migrations.RunSQL(
+            sql=(
+                'UPDATE "ratings_central_player" SET "active" = true '
+                'WHERE NOT "deceased" AND "last_played" > CURRENT_DATE - 365'
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                condition=models.Q(deceased=False),
+                fields=["rating", "id"],
+                name="player_living_rating_id_idx",
+            ),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                condition=models.Q(active=True),
+                fields=["id"],
+                name="player_active_id_idx",
+            ),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                condition=models.Q(active=True),
+                fields=["rating", "id"],
+                name="player_active_rating_id_idx",
+            ),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                condition=models.Q(active=True),
+                fields=["name", "id"],
+                name="player_active_name_id_idx",
+            ),
+        ),
+    ]
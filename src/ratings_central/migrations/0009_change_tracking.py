@@ -0,0 +1,96 @@
+# Generated by Django 2.2.22 on 2026-10-19 15:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import common.operations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are built concurrently, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("ratings_central", "0008_active_players"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Removal",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("resource", models.CharField(max_length=16)),
+                ("record_id", models.IntegerField()),
+                ("rc_id", models.IntegerField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="club",
+            name="updated_at",
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name="club",
+            name="updated_in",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ratings_central.DatasetVersion",
+            ),
+        ),
+        migrations.AddField(
+            model_name="player",
+            name="updated_at",
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name="player",
+            name="updated_in",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ratings_central.DatasetVersion",
+            ),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="club",
+            index=models.Index(
+                fields=["updated_in", "id"], name="club_updated_in_id_idx"
+            ),
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                fields=["updated_in", "id"], name="player_updated_in_id_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="removal",
+            name="dataset_version",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="removals",
+                to="ratings_central.DatasetVersion",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="removal",
+            index=models.Index(
+                fields=["resource", "dataset_version"],
+                name="removal_resource_version_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,761 @@
+# Generated by Django 2.2.22 on 2026-10-19 15:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ratings_central", "0009_change_tracking"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RetainedClub",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rc_id", models.IntegerField(db_index=True)),
+                ("name", models.CharField(max_length=50)),
+                ("nickname", models.CharField(max_length=15)),
+                ("address_one", models.CharField(max_length=50)),
+                ("address_two", models.CharField(max_length=50)),
+                ("city", models.CharField(max_length=30)),
+                (
+                    "na_state",
+                    models.CharField(
+                        choices=[
+                            ("AL", "Alabama"),
+                            ("AK", "Alaska"),
+                            ("AS", "American Samoa"),
+                            ("AZ", "Arizona"),
+                            ("AR", "Arkansas"),
+                            ("AE", "Armed Forces Europe"),
+                            ("AP", "Armed Forces Pacific"),
+                            ("AA", "Armed Forces the Americas"),
+                            ("CA", "California"),
+                            ("CO", "Colorado"),
+                            ("CT", "Connecticut"),
+                            ("DE", "Delaware"),
+                            ("DC", "District of Columbia"),
+                            ("FM", "Federated States of Micronesia"),
+                            ("FL", "Florida"),
+                            ("GA", "Georgia"),
+                            ("GU", "Guam"),
+                            ("HI", "Hawaii"),
+                            ("ID", "Idaho"),
+                            ("IL", "Illinois"),
+                            ("IN", "Indiana"),
+                            ("IA", "Iowa"),
+                            ("KS", "Kansas"),
+                            ("KY", "Kentucky"),
+                            ("LA", "Louisiana"),
+                            ("ME", "Maine"),
+                            ("MH", "Marshall Islands"),
+                            ("MD", "Maryland"),
+                            ("MA", "Massachusetts"),
+                            ("MI", "Michigan"),
+                            ("MN", "Minnesota"),
+                            ("MS", "Mississippi"),
+                            ("MO", "Missouri"),
+                            ("MT", "Montana"),
+                            ("NE", "Nebraska"),
+                            ("NV", "Nevada"),
+                            ("NH", "New Hampshire"),
+                            ("NJ", "New Jersey"),
+                            ("NM", "New Mexico"),
+                            ("NY", "New York"),
+                            ("NC", "North Carolina"),
+                            ("ND", "North Dakota"),
+                            ("MP", "Northern Mariana Islands"),
+                            ("OH", "Ohio"),
+                            ("OK", "Oklahoma"),
+                            ("OR", "Oregon"),
+                            ("PW", "Palau"),
+                            ("PA", "Pennsylvania"),
+                            ("PR", "Puerto Rico"),
+                            ("RI", "Rhode Island"),
+                            ("SC", "South Carolina"),
+                            ("SD", "South Dakota"),
+                            ("TN", "Tennessee"),
+                            ("TX", "Texas"),
+                            ("UT", "Utah"),
+                            ("VT", "Vermont"),
+                            ("VI", "Virgin Islands of the U.S."),
+                            ("VA", "Virginia"),
+                            ("WA", "Washington"),
+                            ("WV", "West Virginia"),
+                            ("WI", "Wisconsin"),
+                            ("WY", "Wyoming"),
+                            ("AB", "Alberta"),
+                            ("BC", "British Columbia"),
+                            ("MB", "Manitoba"),
+                            ("NB", "New Brunswick"),
+                            ("NL", "Newfoundland and Labrador"),
+                            ("NT", "Northwest Territories"),
+                            ("NS", "Nova Scotia"),
+                            ("NU", "Nunavut"),
+                            ("ON", "Ontario"),
+                            ("PE", "Prince Edward Island"),
+                            ("QC", "Quebec"),
+                            ("SK", "Saskatchewan"),
+                            ("YT", "Yukon"),
+                        ],
+                        max_length=2,
+                    ),
+                ),
+                ("world_province", models.CharField(max_length=25)),
+                ("postal_code", models.CharField(max_length=16)),
+                (
+                    "country",
+                    models.CharField(
+                        choices=[
+                            ("AFG", "Afghanistan"),
+                            ("ALB", "Albania"),
+                            ("ALG", "Algeria"),
+                            ("ASA", "American Samoa"),
+                            ("AND", "Andorra"),
+                            ("ANG", "Angola"),
+                            ("ANT", "Antigua and Barbuda"),
+                            ("ARG", "Argentina"),
+                            ("ARM", "Armenia"),
+                            ("ARU", "Aruba"),
+                            ("AUS", "Australia"),
+                            ("AUT", "Austria"),
+                            ("AZE", "Azerbaijan"),
+                            ("BAH", "Bahamas"),
+                            ("BRN", "Bahrain"),
+                            ("BAN", "Bangladesh"),
+                            ("BAR", "Barbados"),
+                            ("BLR", "Belarus"),
+                            ("BEL", "Belgium"),
+                            ("BIZ", "Belize"),
+                            ("BEN", "Benin"),
+                            ("BER", "Bermuda"),
+                            ("BHU", "Bhutan"),
+                            ("BOL", "Bolivia"),
+                            ("BIH", "Bosnia and Herzegovina"),
+                            ("BOT", "Botswana"),
+                            ("BRA", "Brazil"),
+                            ("IVB", "British Virgin Islands"),
+                            ("BRU", "Brunei"),
+                            ("BUL", "Bulgaria"),
+                            ("BUR", "Burkina Faso"),
+                            ("BDI", "Burundi"),
+                            ("CAM", "Cambodia"),
+                            ("CMR", "Cameroon"),
+                            ("CAN", "Canada"),
+                            ("CPV", "Cape Verde"),
+                            ("CAY", "Cayman Islands"),
+                            ("CAF", "Central African Republic"),
+                            ("CHA", "Chad"),
+                            ("CHI", "Chile"),
+                            ("CHN", "China"),
+                            ("TPE", "Chinese Taipei"),
+                            ("COL", "Colombia"),
+                            ("COM", "Comoros"),
+                            ("COK", "Cook Islands"),
+                            ("CRC", "Costa Rica"),
+                            ("CRO", "Croatia"),
+                            ("CUB", "Cuba"),
+                            ("CUW", "Curaçao"),
+                            ("CYP", "Cyprus"),
+                            ("CZE", "Czech Republic"),
+                            ("TCH", "Czechoslovakia"),
+                            ("COD", "Democratic Republic of the Congo"),
+                            ("DEN", "Denmark"),
+                            ("DJI", "Djibouti"),
+                            ("DMA", "Dominica"),
+                            ("DOM", "Dominican Republic"),
+                            ("TLS", "East Timor"),
+                            ("ECU", "Ecuador"),
+                            ("EGY", "Egypt"),
+                            ("ESA", "El Salvador"),
+                            ("ENG", "England"),
+                            ("GEQ", "Equatorial Guinea"),
+                            ("ERI", "Eritrea"),
+                            ("EST", "Estonia"),
+                            ("SWZ", "Eswatini"),
+                            ("ETH", "Ethiopia"),
+                            ("FLK", "Falkland Islands"),
+                            ("FRO", "Faroe Islands"),
+                            ("FSM", "Federated States of Micronesia"),
+                            ("FIJ", "Fiji"),
+                            ("FIN", "Finland"),
+                            ("FRA", "France"),
+                            ("GAB", "Gabon"),
+                            ("GEO", "Georgia"),
+                            ("GER", "Germany"),
+                            ("GDR", "Germany D.R."),
+                            ("FRG", "Germany F.R."),
+                            ("GHA", "Ghana"),
+                            ("GIB", "Gibraltar"),
+                            ("GBR", "Great Britain"),
+                            ("GRE", "Greece"),
+                            ("GRN", "Grenada"),
+                            ("GUM", "Guam"),
+                            ("GUA", "Guatemala"),
+                            ("GGY", "Guernsey"),
+                            ("GUI", "Guinea"),
+                            ("GBS", "Guinea-Bissau"),
+                            ("GUY", "Guyana"),
+                            ("HAI", "Haiti"),
+                            ("HON", "Honduras"),
+                            ("HKG", "Hong Kong"),
+                            ("HUN", "Hungary"),
+                            ("ISL", "Iceland"),
+                            ("IND", "India"),
+                            ("INA", "Indonesia"),
+                            ("IRI", "Iran"),
+                            ("IRQ", "Iraq"),
+                            ("IRL", "Ireland"),
+                            ("IMN", "Isle of Man"),
+                            ("ISR", "Israel"),
+                            ("ITA", "Italy"),
+                            ("CIV", "Ivory Coast"),
+                            ("JAM", "Jamaica"),
+                            ("JPN", "Japan"),
+                            ("JEY", "Jersey"),
+                            ("JOR", "Jordan"),
+                            ("KAZ", "Kazakhstan"),
+                            ("KEN", "Kenya"),
+                            ("KIR", "Kiribati"),
+                            ("KOS", "Kosovo"),
+                            ("KUW", "Kuwait"),
+                            ("KGZ", "Kyrgyzstan"),
+                            ("LAO", "Laos"),
+                            ("LAT", "Latvia"),
+                            ("LBN", "Lebanon"),
+                            ("LES", "Lesotho"),
+                            ("LBR", "Liberia"),
+                            ("LBA", "Libya"),
+                            ("LIE", "Liechtenstein"),
+                            ("LTU", "Lithuania"),
+                            ("LUX", "Luxembourg"),
+                            ("MAC", "Macau"),
+                            ("MAD", "Madagascar"),
+                            ("MAW", "Malawi"),
+                            ("MAS", "Malaysia"),
+                            ("MDV", "Maldives"),
+                            ("MLI", "Mali"),
+                            ("MLT", "Malta"),
+                            ("MHL", "Marshall Islands"),
+                            ("MTN", "Mauritania"),
+                            ("MRI", "Mauritius"),
+                            ("MEX", "Mexico"),
+                            ("MDA", "Moldova"),
+                            ("MON", "Monaco"),
+                            ("MGL", "Mongolia"),
+                            ("MNE", "Montenegro"),
+                            ("MSR", "Montserrat"),
+                            ("MAR", "Morocco"),
+                            ("MOZ", "Mozambique"),
+                            ("MYA", "Myanmar"),
+                            ("NAM", "Namibia"),
+                            ("NRU", "Nauru"),
+                            ("NEP", "Nepal"),
+                            ("NED", "Netherlands"),
+                            ("AHO", "Netherlands Antilles"),
+                            ("NZL", "New Zealand"),
+                            ("NCA", "Nicaragua"),
+                            ("NIG", "Niger"),
+                            ("NGR", "Nigeria"),
+                            ("NIU", "Niue"),
+                            ("NFK", "Norfolk Island"),
+                            ("PRK", "North Korea"),
+                            ("MKD", "North Macedonia"),
+                            ("NIR", "Northern Ireland"),
+                            ("NOR", "Norway"),
+                            ("OMA", "Oman"),
+                            ("PAK", "Pakistan"),
+                            ("PLW", "Palau"),
+                            ("PLE", "Palestine"),
+                            ("PAN", "Panama"),
+                            ("PNG", "Papua New Guinea"),
+                            ("PAR", "Paraguay"),
+                            ("PER", "Peru"),
+                            ("PHI", "Philippines"),
+                            ("POL", "Poland"),
+                            ("POR", "Portugal"),
+                            ("PUR", "Puerto Rico"),
+                            ("QAT", "Qatar"),
+                            ("CGO", "Republic of the Congo"),
+                            ("ROU", "Romania"),
+                            ("RUS", "Russia"),
+                            ("RWA", "Rwanda"),
+                            ("SKN", "Saint Kitts and Nevis"),
+                            ("LCA", "Saint Lucia"),
+                            ("VIN", "Saint Vincent and the Grenadines"),
+                            ("SAM", "Samoa"),
+                            ("SMR", "San Marino"),
+                            ("STP", "São Tomé and Príncipe"),
+                            ("KSA", "Saudi Arabia"),
+                            ("SCO", "Scotland"),
+                            ("SEN", "Senegal"),
+                            ("SRB", "Serbia"),
+                            ("SCG", "Serbia and Montenegro"),
+                            ("SEY", "Seychelles"),
+                            ("SLE", "Sierra Leone"),
+                            ("SGP", "Singapore"),
+                            ("SVK", "Slovakia"),
+                            ("SLO", "Slovenia"),
+                            ("SOL", "Solomon Islands"),
+                            ("SOM", "Somalia"),
+                            ("RSA", "South Africa"),
+                            ("KOR", "South Korea"),
+                            ("SSD", "South Sudan"),
+                            ("ESP", "Spain"),
+                            ("SRI", "Sri Lanka"),
+                            ("SUD", "Sudan"),
+                            ("SUR", "Suriname"),
+                            ("SWE", "Sweden"),
+                            ("SUI", "Switzerland"),
+                            ("SYR", "Syria"),
+                            ("TJK", "Tajikistan"),
+                            ("TAN", "Tanzania"),
+                            ("THA", "Thailand"),
+                            ("GAM", "The Gambia"),
+                            ("TOG", "Togo"),
+                            ("TKL", "Tokelau"),
+                            ("TGA", "Tonga"),
+                            ("TTO", "Trinidad and Tobago"),
+                            ("TUN", "Tunisia"),
+                            ("TUR", "Turkey"),
+                            ("TKM", "Turkmenistan"),
+                            ("TCA", "Turks and Caicos"),
+                            ("TUV", "Tuvalu"),
+                            ("UGA", "Uganda"),
+                            ("UKR", "Ukraine"),
+                            ("UAE", "United Arab Emirates"),
+                            ("USA", "United States"),
+                            ("URU", "Uruguay"),
+                            ("URS", "USSR"),
+                            ("UZB", "Uzbekistan"),
+                            ("VAN", "Vanuatu"),
+                            ("VEN", "Venezuela"),
+                            ("VIE", "Vietnam"),
+                            ("ISV", "Virgin Islands"),
+                            ("WAL", "Wales"),
+                            ("YEM", "Yemen"),
+                            ("YUG", "Yugoslavia"),
+                            ("ZAM", "Zambia"),
+                            ("ZIM", "Zimbabwe"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                ("email", models.EmailField(max_length=254)),
+                ("website", models.CharField(max_length=80)),
+                ("phone", models.CharField(max_length=25)),
+                (
+                    "sport",
+                    models.IntegerField(
+                        choices=[
+                            (1, "Table Tennis"),
+                            (3, "Hardbat Table Tennis"),
+                            (4, "Sandpaper Table Tennis"),
+                        ]
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("Active", "Active"), ("Inactive", "Inactive")],
+                        max_length=8,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(null=True)),
+            ],
+            options={
+                "db_table": "ratings_central_club_retained",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="RetainedPlayer",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rc_id", models.IntegerField(db_index=True)),
+                ("rating", models.IntegerField()),
+                ("st_dev", models.IntegerField()),
+                ("last_played", models.DateField()),
+                ("rc_primary_club_id", models.IntegerField()),
+                ("name", models.CharField(max_length=50)),
+                ("address_one", models.CharField(max_length=50)),
+                ("address_two", models.CharField(max_length=50)),
+                ("city", models.CharField(max_length=30)),
+                (
+                    "na_state",
+                    models.CharField(
+                        choices=[
+                            ("AL", "Alabama"),
+                            ("AK", "Alaska"),
+                            ("AS", "American Samoa"),
+                            ("AZ", "Arizona"),
+                            ("AR", "Arkansas"),
+                            ("AE", "Armed Forces Europe"),
+                            ("AP", "Armed Forces Pacific"),
+                            ("AA", "Armed Forces the Americas"),
+                            ("CA", "California"),
+                            ("CO", "Colorado"),
+                            ("CT", "Connecticut"),
+                            ("DE", "Delaware"),
+                            ("DC", "District of Columbia"),
+                            ("FM", "Federated States of Micronesia"),
+                            ("FL", "Florida"),
+                            ("GA", "Georgia"),
+                            ("GU", "Guam"),
+                            ("HI", "Hawaii"),
+                            ("ID", "Idaho"),
+                            ("IL", "Illinois"),
+                            ("IN", "Indiana"),
+                            ("IA", "Iowa"),
+                            ("KS", "Kansas"),
+                            ("KY", "Kentucky"),
+                            ("LA", "Louisiana"),
+                            ("ME", "Maine"),
+                            ("MH", "Marshall Islands"),
+                            ("MD", "Maryland"),
+                            ("MA", "Massachusetts"),
+                            ("MI", "Michigan"),
+                            ("MN", "Minnesota"),
+                            ("MS", "Mississippi"),
+                            ("MO", "Missouri"),
+                            ("MT", "Montana"),
+                            ("NE", "Nebraska"),
+                            ("NV", "Nevada"),
+                            ("NH", "New Hampshire"),
+                            ("NJ", "New Jersey"),
+                            ("NM", "New Mexico"),
+                            ("NY", "New York"),
+                            ("NC", "North Carolina"),
+                            ("ND", "North Dakota"),
+                            ("MP", "Northern Mariana Islands"),
+                            ("OH", "Ohio"),
+                            ("OK", "Oklahoma"),
+                            ("OR", "Oregon"),
+                            ("PW", "Palau"),
+                            ("PA", "Pennsylvania"),
+                            ("PR", "Puerto Rico"),
+                            ("RI", "Rhode Island"),
+                            ("SC", "South Carolina"),
+                            ("SD", "South Dakota"),
+                            ("TN", "Tennessee"),
+                            ("TX", "Texas"),
+                            ("UT", "Utah"),
+                            ("VT", "Vermont"),
+                            ("VI", "Virgin Islands of the U.S."),
+                            ("VA", "Virginia"),
+                            ("WA", "Washington"),
+                            ("WV", "West Virginia"),
+                            ("WI", "Wisconsin"),
+                            ("WY", "Wyoming"),
+                            ("AB", "Alberta"),
+                            ("BC", "British Columbia"),
+                            ("MB", "Manitoba"),
+                            ("NB", "New Brunswick"),
+                            ("NL", "Newfoundland and Labrador"),
+                            ("NT", "Northwest Territories"),
+                            ("NS", "Nova Scotia"),
+                            ("NU", "Nunavut"),
+                            ("ON", "Ontario"),
+                            ("PE", "Prince Edward Island"),
+                            ("QC", "Quebec"),
+                            ("SK", "Saskatchewan"),
+                            ("YT", "Yukon"),
+                        ],
+                        max_length=2,
+                    ),
+                ),
+                ("world_province", models.CharField(max_length=25)),
+                ("postal_code", models.CharField(max_length=16)),
+                (
+                    "country",
+                    models.CharField(
+                        choices=[
+                            ("AFG", "Afghanistan"),
+                            ("ALB", "Albania"),
+                            ("ALG", "Algeria"),
+                            ("ASA", "American Samoa"),
+                            ("AND", "Andorra"),
+                            ("ANG", "Angola"),
+                            ("ANT", "Antigua and Barbuda"),
+                            ("ARG", "Argentina"),
+                            ("ARM", "Armenia"),
+                            ("ARU", "Aruba"),
+                            ("AUS", "Australia"),
+                            ("AUT", "Austria"),
+                            ("AZE", "Azerbaijan"),
+                            ("BAH", "Bahamas"),
+                            ("BRN", "Bahrain"),
+                            ("BAN", "Bangladesh"),
+                            ("BAR", "Barbados"),
+                            ("BLR", "Belarus"),
+                            ("BEL", "Belgium"),
+                            ("BIZ", "Belize"),
+                            ("BEN", "Benin"),
+                            ("BER", "Bermuda"),
+                            ("BHU", "Bhutan"),
+                            ("BOL", "Bolivia"),
+                            ("BIH", "Bosnia and Herzegovina"),
+                            ("BOT", "Botswana"),
+                            ("BRA", "Brazil"),
+                            ("IVB", "British Virgin Islands"),
+                            ("BRU", "Brunei"),
+                            ("BUL", "Bulgaria"),
+                            ("BUR", "Burkina Faso"),
+                            ("BDI", "Burundi"),
+                            ("CAM", "Cambodia"),
+                            ("CMR", "Cameroon"),
+                            ("CAN", "Canada"),
+                            ("CPV", "Cape Verde"),
+                            ("CAY", "Cayman Islands"),
+                            ("CAF", "Central African Republic"),
+                            ("CHA", "Chad"),
+                            ("CHI", "Chile"),
+                            ("CHN", "China"),
+                            ("TPE", "Chinese Taipei"),
+                            ("COL", "Colombia"),
+                            ("COM", "Comoros"),
+                            ("COK", "Cook Islands"),
+                            ("CRC", "Costa Rica"),
+                            ("CRO", "Croatia"),
+                            ("CUB", "Cuba"),
+                            ("CUW", "Curaçao"),
+                            ("CYP", "Cyprus"),
+                            ("CZE", "Czech Republic"),
+                            ("TCH", "Czechoslovakia"),
+                            ("COD", "Democratic Republic of the Congo"),
+                            ("DEN", "Denmark"),
+                            ("DJI", "Djibouti"),
+                            ("DMA", "Dominica"),
+                            ("DOM", "Dominican Republic"),
+                            ("TLS", "East Timor"),
+                            ("ECU", "Ecuador"),
+                            ("EGY", "Egypt"),
+                            ("ESA", "El Salvador"),
+                            ("ENG", "England"),
+                            ("GEQ", "Equatorial Guinea"),
+                            ("ERI", "Eritrea"),
+                            ("EST", "Estonia"),
+                            ("SWZ", "Eswatini"),
+                            ("ETH", "Ethiopia"),
+                            ("FLK", "Falkland Islands"),
+                            ("FRO", "Faroe Islands"),
+                            ("FSM", "Federated States of Micronesia"),
+                            ("FIJ", "Fiji"),
+                            ("FIN", "Finland"),
+                            ("FRA", "France"),
+                            ("GAB", "Gabon"),
+                            ("GEO", "Georgia"),
+                            ("GER", "Germany"),
+                            ("GDR", "Germany D.R."),
+                            ("FRG", "Germany F.R."),
+                            ("GHA", "Ghana"),
+                            ("GIB", "Gibraltar"),
+                            ("GBR", "Great Britain"),
+                            ("GRE", "Greece"),
+                            ("GRN", "Grenada"),
+                            ("GUM", "Guam"),
+                            ("GUA", "Guatemala"),
+                            ("GGY", "Guernsey"),
+                            ("GUI", "Guinea"),
+                            ("GBS", "Guinea-Bissau"),
+                            ("GUY", "Guyana"),
+                            ("HAI", "Haiti"),
+                            ("HON", "Honduras"),
+                            ("HKG", "Hong Kong"),
+                            ("HUN", "Hungary"),
+                            ("ISL", "Iceland"),
+                            ("IND", "India"),
+                            ("INA", "Indonesia"),
+                            ("IRI", "Iran"),
+                            ("IRQ", "Iraq"),
+                            ("IRL", "Ireland"),
+                            ("IMN", "Isle of Man"),
+                            ("ISR", "Israel"),
+                            ("ITA", "Italy"),
+                            ("CIV", "Ivory Coast"),
+                            ("JAM", "Jamaica"),
+                            ("JPN", "Japan"),
+                            ("JEY", "Jersey"),
+                            ("JOR", "Jordan"),
+                            ("KAZ", "Kazakhstan"),
+                            ("KEN", "Kenya"),
+                            ("KIR", "Kiribati"),
+                            ("KOS", "Kosovo"),
+                            ("KUW", "Kuwait"),
+                            ("KGZ", "Kyrgyzstan"),
+                            ("LAO", "Laos"),
+                            ("LAT", "Latvia"),
+                            ("LBN", "Lebanon"),
+                            ("LES", "Lesotho"),
+                            ("LBR", "Liberia"),
+                            ("LBA", "Libya"),
+                            ("LIE", "Liechtenstein"),
+                            ("LTU", "Lithuania"),
+                            ("LUX", "Luxembourg"),
+                            ("MAC", "Macau"),
+                            ("MAD", "Madagascar"),
+                            ("MAW", "Malawi"),
+                            ("MAS", "Malaysia"),
+                            ("MDV", "Maldives"),
+                            ("MLI", "Mali"),
+                            ("MLT", "Malta"),
+                            ("MHL", "Marshall Islands"),
+                            ("MTN", "Mauritania"),
+                            ("MRI", "Mauritius"),
+                            ("MEX", "Mexico"),
+                            ("MDA", "Moldova"),
+                            ("MON", "Monaco"),
+                            ("MGL", "Mongolia"),
+                            ("MNE", "Montenegro"),
+                            ("MSR", "Montserrat"),
+                            ("MAR", "Morocco"),
+                            ("MOZ", "Mozambique"),
+                            ("MYA", "Myanmar"),
+                            ("NAM", "Namibia"),
+                            ("NRU", "Nauru"),
+                            ("NEP", "Nepal"),
+                            ("NED", "Netherlands"),
+                            ("AHO", "Netherlands Antilles"),
+                            ("NZL", "New Zealand"),
+                            ("NCA", "Nicaragua"),
+                            ("NIG", "Niger"),
+                            ("NGR", "Nigeria"),
+                            ("NIU", "Niue"),
+                            ("NFK", "Norfolk Island"),
+                            ("PRK", "North Korea"),
+                            ("MKD", "North Macedonia"),
+                            ("NIR", "Northern Ireland"),
+                            ("NOR", "Norway"),
+                            ("OMA", "Oman"),
+                            ("PAK", "Pakistan"),
+                            ("PLW", "Palau"),
+                            ("PLE", "Palestine"),
+                            ("PAN", "Panama"),
+                            ("PNG", "Papua New Guinea"),
+                            ("PAR", "Paraguay"),
+                            ("PER", "Peru"),
+                            ("PHI", "Philippines"),
+                            ("POL", "Poland"),
+                            ("POR", "Portugal"),
+                            ("PUR", "Puerto Rico"),
+                            ("QAT", "Qatar"),
+                            ("CGO", "Republic of the Congo"),
+                            ("ROU", "Romania"),
+                            ("RUS", "Russia"),
+                            ("RWA", "Rwanda"),
+                            ("SKN", "Saint Kitts and Nevis"),
+                            ("LCA", "Saint Lucia"),
+                            ("VIN", "Saint Vincent and the Grenadines"),
+                            ("SAM", "Samoa"),
+                            ("SMR", "San Marino"),
+                            ("STP", "São Tomé and Príncipe"),
+                            ("KSA", "Saudi Arabia"),
+                            ("SCO", "Scotland"),
+                            ("SEN", "Senegal"),
+                            ("SRB", "Serbia"),
+                            ("SCG", "Serbia and Montenegro"),
+                            ("SEY", "Seychelles"),
+                            ("SLE", "Sierra Leone"),
+                            ("SGP", "Singapore"),
+                            ("SVK", "Slovakia"),
+                            ("SLO", "Slovenia"),
+                            ("SOL", "Solomon Islands"),
+                            ("SOM", "Somalia"),
+                            ("RSA", "South Africa"),
+                            ("KOR", "South Korea"),
+                            ("SSD", "South Sudan"),
+                            ("ESP", "Spain"),
+                            ("SRI", "Sri Lanka"),
+                            ("SUD", "Sudan"),
+                            ("SUR", "Suriname"),
+                            ("SWE", "Sweden"),
+                            ("SUI", "Switzerland"),
+                            ("SYR", "Syria"),
+                            ("TJK", "Tajikistan"),
+                            ("TAN", "Tanzania"),
+                            ("THA", "Thailand"),
+                            ("GAM", "The Gambia"),
+                            ("TOG", "Togo"),
+                            ("TKL", "Tokelau"),
+                            ("TGA", "Tonga"),
+                            ("TTO", "Trinidad and Tobago"),
+                            ("TUN", "Tunisia"),
+                            ("TUR", "Turkey"),
+                            ("TKM", "Turkmenistan"),
+                            ("TCA", "Turks and Caicos"),
+                            ("TUV", "Tuvalu"),
+                            ("UGA", "Uganda"),
+                            ("UKR", "Ukraine"),
+                            ("UAE", "United Arab Emirates"),
+                            ("USA", "United States"),
+                            ("URU", "Uruguay"),
+                            ("URS", "USSR"),
+                            ("UZB", "Uzbekistan"),
+                            ("VAN", "Vanuatu"),
+                            ("VEN", "Venezuela"),
+                            ("VIE", "Vietnam"),
+                            ("ISV", "Virgin Islands"),
+                            ("WAL", "Wales"),
+                            ("YEM", "Yemen"),
+                            ("YUG", "Yugoslavia"),
+                            ("ZAM", "Zambia"),
+                            ("ZIM", "Zimbabwe"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                ("email", models.EmailField(max_length=254)),
+                ("birth", models.DateField(null=True)),
+                ("birth_year", models.SmallIntegerField(null=True)),
+                (
+                    "gender",
+                    models.CharField(
+                        choices=[("M", "Male"), ("F", "Female")], max_length=1
+                    ),
+                ),
+                (
+                    "sport",
+                    models.IntegerField(
+                        choices=[
+                            (1, "Table Tennis"),
+                            (3, "Hardbat Table Tennis"),
+                            (4, "Sandpaper Table Tennis"),
+                        ]
+                    ),
+                ),
+                ("usatt_id", models.IntegerField()),
+                ("tta_id", models.IntegerField()),
+                ("ittf_id", models.IntegerField()),
+                ("deceased", models.BooleanField()),
+                ("active", models.BooleanField(default=False)),
+                ("updated_at", models.DateTimeField(null=True)),
+            ],
+            options={
+                "db_table": "ratings_central_player_retained",
+                "managed": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="datasetversion",
+            name="retained_until",
+            field=models.DateTimeField(null=True),
+        ),
+    ]
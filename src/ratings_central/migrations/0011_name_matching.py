@@ -0,0 +1,48 @@
+# Generated by Django 2.2.22 on 2026-10-19 16:20
+
+from django.contrib.postgres.operations import CreateExtension
+from django.db import migrations
+
+import common.operations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are built concurrently, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("ratings_central", "0010_retained_versions"),
+    ]
+
+    # NOTE: The phonetic keys are the Double Metaphone codes of each word of a
+    # name, see ratings_central.matching. The function is immutable so the
+    # keys are computed once, when the importer writes a row, and stored in
+    # the index rather than in a column. Creating the extension may need a
+    # superuser, see the Database section of README.md.
+    operations = [
+        CreateExtension("fuzzystrmatch"),
+        migrations.RunSQL(
+            sql=(
+                "CREATE OR REPLACE FUNCTION ratings_central_name_keys(name text) "
+                "RETURNS text[] AS $$ "
+                "SELECT ARRAY("
+                "SELECT DISTINCT dmetaphone(word) "
+                "FROM regexp_split_to_table(UPPER(name), '[^[:alpha:]]+') AS word "
+                "WHERE dmetaphone(word) <> '' ORDER BY 1"
+                ") $$ LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE "
+                # index builds and maintenance ignore the session's search_path
+                "SET search_path FROM CURRENT"
+            ),
+            reverse_sql="DROP FUNCTION ratings_central_name_keys(text)",
+        ),
+        common.operations.RunSQLConcurrently(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS player_name_keys_idx "
+                'ON "ratings_central_player" '
+                'USING gin (ratings_central_name_keys("name"::text)) '
+                "WITH (fastupdate = off)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS player_name_keys_idx",
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 2.2.22 on 2026-10-19 17:05
+
+from django.db import migrations, models
+
+import common.operations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are built concurrently, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("ratings_central", "0011_name_matching"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="player",
+            name="birth_year",
+            field=models.SmallIntegerField(null=True),
+        ),
+        # the importer sets the birth year of the rows it writes from now on
+        migrations.RunSQL(
+            sql=(
+                'UPDATE "ratings_central_player" '
+                'SET "birth_year" = EXTRACT(YEAR FROM "birth") '
+                'WHERE "birth" IS NOT NULL'
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        common.operations.AddIndexConcurrently(
+            model_name="player",
+            index=models.Index(
+                fields=["birth_year", "id"], name="player_birth_year_id_idx"
+            ),
+        ),
+    ]
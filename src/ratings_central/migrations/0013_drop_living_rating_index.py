@@ -0,0 +1,23 @@
+# Generated by Django 2.2.22 on 2026-10-19 18:05
+
+from django.db import migrations
+
+import common.operations
+
+
+class Migration(migrations.Migration):
+
+    # indexes are dropped concurrently, which cannot happen inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("ratings_central", "0012_age_categories"),
+    ]
+
+    operations = [
+        # the few deceased players leave the living players in the rating index
+        common.operations.RemoveIndexConcurrently(
+            model_name="player",
+            name="player_living_rating_id_idx",
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 2.2.22 on 2026-10-19 18:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ratings_central", "0013_drop_living_rating_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="club",
+            name="removed_in",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ratings_central.DatasetVersion",
+            ),
+        ),
+        migrations.AddField(
+            model_name="player",
+            name="removed_in",
+            field=models.ForeignKey(
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="ratings_central.DatasetVersion",
+            ),
+        ),
+    ]
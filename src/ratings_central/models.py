@@ -1,12 +1,53 @@
 """Models for the ratings_central app."""
+import datetime
+
+from django.contrib.postgres.fields import JSONField
 from django.db import models
+from django.utils import timezone
 from django_cryptography.fields import encrypt
 
 from ratings_central import enums
 
+# players who played within this window before the latest import are active
+ACTIVE_WINDOW = datetime.timedelta(days=365)
 
-class Player(models.Model):
-    """Ratings Central Player information."""
+
+class PlayerQuerySet(models.QuerySet):
+    """Player queryset."""
+
+    def active(self):
+        """Return the living players who played recently."""
+        return self.filter(active=True)
+
+    def update_active(
+        self, date: datetime.date, dataset_version: "DatasetVersion" = None
+    ) -> None:
+        """Flag the players active as of the date, only writing changed rows.
+
+        The changed rows are marked as updated in the dataset version, if given.
+        """
+        changes = {}
+        if dataset_version is not None:
+            changes = {"updated_in": dataset_version, "updated_at": timezone.now()}
+        recent = models.Q(deceased=False, last_played__gt=date - ACTIVE_WINDOW)
+        self.filter(recent, active=False).update(active=True, **changes)
+        self.exclude(recent).filter(active=True).update(active=False, **changes)
+
+
+class CurrentManager(models.Manager):
+    """Manager of the rows which were not removed by an import.
+
+    The importer keeps the rows missing from a list as tombstones, see
+    importer.remove_missing, and `all_objects` also returns those.
+    """
+
+    def get_queryset(self):
+        """Exclude the removed rows."""
+        return super().get_queryset().filter(removed_in__isnull=True)
+
+
+class AbstractPlayer(models.Model):
+    """The columns of the player list, shared by its retained copy."""
 
     rc_id = models.IntegerField(db_index=True)
     rating = models.IntegerField()
@@ -23,12 +64,30 @@ class Player(models.Model):
     country = models.CharField(max_length=3, choices=enums.Country.choices)
     email = models.EmailField(max_length=254)
     birth = models.DateField(null=True)
+    # set from the birth by the importer, the age categories are ranges of it
+    birth_year = models.SmallIntegerField(null=True)
     gender = models.CharField(max_length=1, choices=enums.Gender.choices)
     sport = models.IntegerField(choices=enums.Sport.choices)
     usatt_id = models.IntegerField()
     tta_id = models.IntegerField()
     ittf_id = models.IntegerField()
     deceased = models.BooleanField()
+    # set after each import, see PlayerQuerySet.update_active
+    active = models.BooleanField(default=False)
+    # the import which last created or changed the row, see importer
+    updated_in = models.ForeignKey(
+        "DatasetVersion",
+        on_delete=models.PROTECT,
+        null=True,
+        related_name="+",
+        db_index=False,
+    )
+    updated_at = models.DateTimeField(null=True)
+
+    class Meta:
+        """Model meta options."""
+
+        abstract = True
 
     class JSONAPIMeta:
         """JSON:API meta information."""
@@ -36,8 +95,64 @@ class Player(models.Model):
         resource_name = "players"
 
 
-class Club(models.Model):
-    """Ratings Central Club information."""
+class Player(AbstractPlayer):
+    """Ratings Central Player information."""
+
+    # the import which removed the row from the list, see importer
+    removed_in = models.ForeignKey(
+        "DatasetVersion",
+        on_delete=models.PROTECT,
+        null=True,
+        related_name="+",
+        db_index=False,
+    )
+
+    objects = CurrentManager.from_queryset(PlayerQuerySet)()
+    all_objects = PlayerQuerySet.as_manager()
+
+    class Meta:
+        """Model meta options."""
+
+        # NOTE: `name__icontains` is served by a trigram index on UPPER(name)
+        # which can only be created with raw SQL (see migration 0002).
+        indexes = [
+            models.Index(fields=["email"], name="player_email_idx"),
+            # the sortable fields, ending with the primary key tie breaker
+            models.Index(fields=["name", "id"], name="player_name_id_idx"),
+            models.Index(fields=["rating", "id"], name="player_rating_id_idx"),
+            models.Index(fields=["st_dev", "id"], name="player_st_dev_id_idx"),
+            models.Index(
+                fields=["last_played", "id"], name="player_last_played_id_idx"
+            ),
+            models.Index(fields=["birth"], name="player_birth_idx"),
+            models.Index(fields=["birth_year", "id"], name="player_birth_year_id_idx"),
+            models.Index(fields=["deceased", "id"], name="player_deceased_id_idx"),
+            models.Index(fields=["deceased", "name"], name="player_deceased_name_idx"),
+            models.Index(fields=["updated_in", "id"], name="player_updated_in_id_idx"),
+            models.Index(fields=["usatt_id"], name="player_usatt_id_idx"),
+            models.Index(fields=["tta_id"], name="player_tta_id_idx"),
+            models.Index(fields=["ittf_id"], name="player_ittf_id_idx"),
+            # partial indexes over the hot set of active players
+            models.Index(
+                fields=["id"],
+                name="player_active_id_idx",
+                condition=models.Q(active=True),
+            ),
+            models.Index(
+                fields=["rating", "id"],
+                name="player_active_rating_id_idx",
+                condition=models.Q(active=True),
+            ),
+            models.Index(
+                fields=["name", "id"],
+                name="player_active_name_id_idx",
+                condition=models.Q(active=True),
+            ),
+        ]
+
+
+class AbstractClub(models.Model):
+    """The columns of the club list, shared by its retained copy."""
 
     rc_id = models.IntegerField(db_index=True)
     name = models.CharField(max_length=50)
@@ -54,6 +169,20 @@ class Club(models.Model):
     phone = models.CharField(max_length=25)
     sport = models.IntegerField(choices=enums.Sport.choices)
     status = models.CharField(max_length=8, choices=enums.ClubStatus.choices)
+    # the import which last created or changed the row, see importer
+    updated_in = models.ForeignKey(
+        "DatasetVersion",
+        on_delete=models.PROTECT,
+        null=True,
+        related_name="+",
+        db_index=False,
+    )
+    updated_at = models.DateTimeField(null=True)
+
+    class Meta:
+        """Model meta options."""
+
+        abstract = True
 
     class JSONAPIMeta:
         """JSON:API meta information."""
@@ -61,8 +190,235 @@ class Club(models.Model):
         resource_name = "clubs"
 
 
+class Club(AbstractClub):
+    """Ratings Central Club information."""
+
+    # the import which removed the row from the list, see importer
+    removed_in = models.ForeignKey(
+        "DatasetVersion",
+        on_delete=models.PROTECT,
+        null=True,
+        related_name="+",
+        db_index=False,
+    )
+
+    objects = CurrentManager()
+    all_objects = models.Manager()
+
+    class Meta:
+        """Model meta options."""
+
+        # NOTE: `name__icontains` is served by a trigram index on UPPER(name)
+        # which can only be created with raw SQL (see migration 0002).
+        indexes = [
+            models.Index(fields=["email"], name="club_email_idx"),
+            models.Index(fields=["name"], name="club_name_idx"),
+            models.Index(fields=["status", "id"], name="club_status_id_idx"),
+            models.Index(fields=["status", "name"], name="club_status_name_idx"),
+            models.Index(fields=["updated_in", "id"], name="club_updated_in_id_idx"),
+        ]
+
+
+class Ranking(models.Model):
+    """A player's rank in a leaderboard, computed after each import.
+
+    Leaderboards rank the players of a sport, optionally by country, gender
+    and age category. A null country, gender or age category ranks every
+    player regardless of it.
+    """
+
+    player = models.ForeignKey(
+        Player, on_delete=models.CASCADE, related_name="rankings"
+    )
+    sport = models.IntegerField(choices=enums.Sport.choices)
+    country = models.CharField(max_length=3, choices=enums.Country.choices, null=True)
+    gender = models.CharField(max_length=1, choices=enums.Gender.choices, null=True)
+    age_category = models.CharField(
+        max_length=3, choices=enums.AgeCategory.choices, null=True
+    )
+    rating = models.IntegerField()
+    rank = models.IntegerField()
+    percentile = models.FloatField()
+
+    class Meta:
+        """Model meta options."""
+
+        indexes = [
+            models.Index(
+                fields=["sport", "country", "gender", "age_category", "rank", "player"],
+                name="ranking_leaderboard_idx",
+            ),
+        ]
+
+    class JSONAPIMeta:
+        """JSON:API meta information."""
+
+        resource_name = "rankings"
+
+
 class Director(models.Model):
     """Ratings Central Director information."""
 
     rc_id = models.IntegerField(db_index=True)
     password = encrypt(models.TextField())
+
+
+class RetainedPlayer(AbstractPlayer):
+    """The players of the retained dataset version.
+
+    The table is a copy of the current players, written by
+    ratings_central.retention along with the indexes below and the trigram
+    index of the name.
+    """
+
+    objects = PlayerQuerySet.as_manager()
+
+    class Meta:
+        """Model meta options."""
+
+        managed = False
+        db_table = "ratings_central_player_retained"
+        # the filters and sorts of the list pages, as indexed on the players
+        indexes = [
+            models.Index(fields=["rc_id"], name="player_retained_rc_id_idx"),
+            models.Index(fields=["email"], name="player_retained_email_idx"),
+            models.Index(fields=["name", "id"], name="player_retained_name_idx"),
+            models.Index(fields=["rating", "id"], name="player_retained_rating_idx"),
+            models.Index(fields=["st_dev", "id"], name="player_retained_st_dev_idx"),
+            models.Index(
+                fields=["last_played", "id"], name="player_retained_played_idx"
+            ),
+            models.Index(fields=["birth"], name="player_retained_birth_idx"),
+            models.Index(
+                fields=["birth_year", "id"], name="player_retained_birth_year_idx"
+            ),
+            models.Index(
+                fields=["deceased", "id"], name="player_retained_deceased_idx"
+            ),
+            models.Index(
+                fields=["deceased", "name"], name="player_retained_dec_name_idx"
+            ),
+            models.Index(
+                fields=["updated_in", "id"], name="player_retained_updated_idx"
+            ),
+            models.Index(fields=["usatt_id"], name="player_retained_usatt_idx"),
+            models.Index(fields=["tta_id"], name="player_retained_tta_idx"),
+            models.Index(fields=["ittf_id"], name="player_retained_ittf_idx"),
+            models.Index(
+                fields=["id"],
+                name="player_retained_active_idx",
+                condition=models.Q(active=True),
+            ),
+            models.Index(
+                fields=["rating", "id"],
+                name="player_retained_act_rating_idx",
+                condition=models.Q(active=True),
+            ),
+            models.Index(
+                fields=["name", "id"],
+                name="player_retained_act_name_idx",
+                condition=models.Q(active=True),
+            ),
+        ]
+
+
+class RetainedClub(AbstractClub):
+    """The clubs of the retained dataset version, see RetainedPlayer."""
+
+    class Meta:
+        """Model meta options."""
+
+        managed = False
+        db_table = "ratings_central_club_retained"
+        indexes = [
+            models.Index(fields=["rc_id"], name="club_retained_rc_id_idx"),
+            models.Index(fields=["email"], name="club_retained_email_idx"),
+            models.Index(fields=["name"], name="club_retained_name_idx"),
+            models.Index(fields=["status", "id"], name="club_retained_status_idx"),
+            models.Index(
+                fields=["status", "name"], name="club_retained_status_name_idx"
+            ),
+            models.Index(fields=["updated_in", "id"], name="club_retained_updated_idx"),
+        ]
+
+
+class DatasetVersionQuerySet(models.QuerySet):
+    """Dataset version queryset."""
+
+    def completed(self):
+        """Return the versions whose import completed."""
+        return self.filter(completed__isnull=False)
+
+
+class DatasetVersion(models.Model):
+    """A version of the imported player and club lists, one per import."""
+
+    started = models.DateTimeField(auto_now_add=True)
+    completed = models.DateTimeField(null=True)
+    # the manifest of the static snapshots published for this version
+    manifest = JSONField(null=True)
+    # set while the version's lists are retained, see ratings_central.retention
+    retained_until = models.DateTimeField(null=True)
+
+    objects = models.Manager.from_queryset(DatasetVersionQuerySet)()
+
+    class JSONAPIMeta:
+        """JSON:API meta information."""
+
+        resource_name = "dataset-versions"
+
+    def get_completed(self) -> datetime.datetime:
+        """Return when the import completed, raise ValueError if it did not."""
+        if self.completed is None:
+            raise ValueError(f"Dataset version {self.pk} is not completed.")
+        return self.completed
+
+
+class Statistics(models.Model):
+    """Aggregates of a dataset version's players, computed after its import."""
+
+    dataset_version = models.OneToOneField(
+        DatasetVersion,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="statistics",
+    )
+    # histograms of the living players' ratings and standard deviations
+    ratings = JSONField()
+    st_devs = JSONField()
+    # living players who played within each window before the import
+    activity = JSONField()
+    countries = JSONField()
+    clubs = JSONField()
+
+    class Meta:
+        """Model meta options."""
+
+        verbose_name_plural = "statistics"
+
+    class JSONAPIMeta:
+        """JSON:API meta information."""
+
+        resource_name = "statistics"
+
+
+class Removal(models.Model):
+    """A player or club removed by an import, listed by the change feeds."""
+
+    dataset_version = models.ForeignKey(
+        DatasetVersion, on_delete=models.CASCADE, related_name="removals"
+    )
+    # the resource name and id of the removed row
+    resource = models.CharField(max_length=16)
+    record_id = models.IntegerField()
+    rc_id = models.IntegerField()
+
+    class Meta:
+        """Model meta options."""
+
+        indexes = [
+            models.Index(
+                fields=["resource", "dataset_version"],
+                name="removal_resource_version_idx",
+            ),
+        ]
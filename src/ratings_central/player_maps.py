@@ -0,0 +1,268 @@
+"""Memory-mapped columnar snapshots of the players, shared by every worker.
+
+Each import writes the players to a binary file: a header, a fixed-width
+array per numeric column and an offset-indexed heap of UTF-8 names. The rows
+are sorted by rc_id so lookups are a binary search over the mapped rc_id
+column. Every process maps the file read-only, so the pages are shared
+through the page cache instead of being copied into each worker.
+
+The arrays use the native byte order and are only meant to be read on the
+host which wrote them.
+"""
+import datetime
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from django.conf import settings
+
+from ratings_central import metrics, models
+
+MAGIC = b"RCPM"
+FORMAT_VERSION = 1
+# magic, format version, row count and dataset version
+HEADER = struct.Struct("=4sIIQ")
+# the numeric columns and their array type codes, read from the Player model
+COLUMNS = [
+    ("rc_id", "i"),
+    ("pk", "i"),
+    ("rating", "i"),
+    ("st_dev", "i"),
+    ("last_played", "i"),
+    ("birth", "i"),
+    ("deceased", "B"),
+]
+DATE_COLUMNS = {"last_played", "birth"}
+# the ordinal stored for a missing date, real ordinals start at 1
+NULL_DATE = 0
+POINTER_NAME = "players.map"
+ALIGNMENT = 8
+
+Row = Tuple[Any, ...]
+Map = TypeVar("Map")
+
+
+def get_directory() -> str:
+    """Return the directory the player maps are written to."""
+    return settings.PLAYER_MAP_DIR
+
+
+def get_file_name(dataset_version_pk: int) -> str:
+    """Return the file name of a dataset version's player map."""
+    return f"players-{dataset_version_pk}.map"
+
+
+def align(offset: int) -> int:
+    """Return the offset rounded up to the column alignment."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def get_layout(count: int) -> Tuple[Dict[str, Tuple[int, int]], int, int]:
+    """Return the offset and size of each column, the offsets and the heap."""
+    layout = {}
+    offset = align(HEADER.size)
+    for name, typecode in COLUMNS:
+        size = array(typecode).itemsize * count
+        layout[name] = (offset, size)
+        offset = align(offset + size)
+    name_offsets = offset
+    heap = align(name_offsets + array("I").itemsize * (count + 1))
+    return layout, name_offsets, heap
+
+
+def to_ordinal(date: Optional[datetime.date]) -> int:
+    """Return the stored ordinal of a date."""
+    return NULL_DATE if date is None else date.toordinal()
+
+
+def from_ordinal(ordinal: int) -> Optional[datetime.date]:
+    """Return the date of a stored ordinal."""
+    return None if ordinal == NULL_DATE else datetime.date.fromordinal(ordinal)
+
+
+class PlayerMap:
+    """A read-only, memory-mapped player map."""
+
+    def __init__(self, path: str):
+        """Map the file and view its columns without copying them."""
+        self.path = path
+        with open(path, "rb") as fyl:
+            self.mmap = mmap.mmap(fyl.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, format_version, self.count, self.dataset_version = HEADER.unpack_from(
+            self.mmap
+        )
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a player map.")
+        layout, name_offsets, heap = get_layout(self.count)
+        view = memoryview(self.mmap)
+        self.columns = {
+            name: view[offset : offset + size].cast(typecode)
+            for (name, typecode), (offset, size) in zip(COLUMNS, layout.values())
+        }
+        size = array("I").itemsize * (self.count + 1)
+        self.name_offsets = view[name_offsets : name_offsets + size].cast("I")
+        self.heap = view[heap:]
+
+    def __len__(self) -> int:
+        """Return the number of players."""
+        return self.count
+
+    def get_row(self, index: int) -> Row:
+        """Return the values of the row at the index, in the COLUMNS order."""
+        values: List[Any] = []
+        for name, _ in COLUMNS:
+            stored = self.columns[name][index]
+            if name in DATE_COLUMNS:
+                values.append(from_ordinal(stored))
+            elif name == "deceased":
+                values.append(bool(stored))
+            else:
+                values.append(stored)
+        start, end = self.name_offsets[index], self.name_offsets[index + 1]
+        return (*values, bytes(self.heap[start:end]).decode())
+
+    def lookup(self, rc_ids: Iterable[int]) -> List[Row]:
+        """Return the rows of the players with the rc_ids, ordered by rc_id."""
+        column = self.columns["rc_id"]
+        rows = []
+        for rc_id in sorted(set(rc_ids)):
+            index = bisect_left(column, rc_id)
+            while index < self.count and column[index] == rc_id:
+                rows.append(self.get_row(index))
+                index += 1
+        return rows
+
+
+def get_rows(rc_ids: Iterable[int]) -> List[Row]:
+    """Return the same rows as PlayerMap.lookup, from the database."""
+    names = [name for name, _ in COLUMNS]
+    return list(
+        models.Player.objects.filter(rc_id__in=set(rc_ids))
+        .order_by("rc_id", "pk")
+        .values_list(*names, "name")
+    )
+
+
+def collect_columns(
+    rows: Iterable[Tuple[Any, ...]]
+) -> Tuple[Dict[str, array], array, bytearray]:
+    """Return the column arrays, name offsets and name heap of the rows.
+
+    The rows hold the values of COLUMNS followed by the name.
+    """
+    arrays = {name: array(typecode) for name, typecode in COLUMNS}
+    name_offsets = array("I", [0])
+    heap = bytearray()
+    for *values, name in rows:
+        for (column, _), value in zip(COLUMNS, values):
+            if column in DATE_COLUMNS:
+                value = to_ordinal(value)
+            arrays[column].append(value)
+        heap += name.encode()
+        name_offsets.append(len(heap))
+    return arrays, name_offsets, heap
+
+
+def write_player_map(
+    dataset_version: models.DatasetVersion, directory: Optional[str] = None
+) -> str:
+    """Write the player map of the dataset version and make it current.
+
+    The file is written under a temporary name and renamed into place, then
+    the `players.map` symlink is replaced to point at it. Both renames are
+    atomic, so workers either map the previous file or the complete new one.
+    Workers which mapped a replaced file keep reading it until they reload.
+    """
+    directory = directory or get_directory()
+    os.makedirs(directory, exist_ok=True)
+    arrays, name_offsets, heap = collect_columns(
+        models.Player.objects.order_by("rc_id", "pk")
+        .values_list(*[name for name, _ in COLUMNS], "name")
+        .iterator(chunk_size=2000)
+    )
+    count = len(name_offsets) - 1
+    layout, name_offsets_offset, heap_offset = get_layout(count)
+    file_name = get_file_name(dataset_version.pk)
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as temp:
+        temp.write(HEADER.pack(MAGIC, FORMAT_VERSION, count, dataset_version.pk))
+        for name, (offset, _) in layout.items():
+            temp.seek(offset)
+            arrays[name].tofile(cast(BinaryIO, temp))
+        temp.seek(name_offsets_offset)
+        name_offsets.tofile(cast(BinaryIO, temp))
+        temp.seek(heap_offset)
+        temp.write(heap)
+        temp.flush()
+        os.fsync(temp.fileno())
+    return install(directory, temp.name, file_name, POINTER_NAME)
+
+
+def install(directory: str, temp_path: str, file_name: str, pointer_name: str) -> str:
+    """Rename the written file into place and point the pointer at it.
+
+    The files previously pointed at are removed, they are named like the new
+    file up to its last dash.
+    """
+    os.chmod(temp_path, 0o644)
+    os.replace(temp_path, os.path.join(directory, file_name))
+    pointer = os.path.join(directory, pointer_name)
+    temp_pointer = f"{pointer}.{file_name}.tmp"
+    if os.path.lexists(temp_pointer):
+        os.remove(temp_pointer)
+    os.symlink(file_name, temp_pointer)
+    os.replace(temp_pointer, pointer)
+    # mapped files stay readable after they are unlinked
+    stale_prefix = file_name[: file_name.rindex("-") + 1]
+    for stale in os.listdir(directory):
+        if stale.startswith(stale_prefix) and stale != file_name:
+            os.remove(os.path.join(directory, stale))
+    return os.path.join(directory, file_name)
+
+
+_loaded: Dict[str, Any] = {}
+
+
+def load(pointer_name: str, map_class: Callable[[str], Map]) -> Optional[Map]:
+    """Return the map the pointer points at, or None if none was written.
+
+    Checking for a new dataset version costs a `readlink` of the pointer, so
+    it is done on every call. The previous map is only unmapped once nothing
+    references it. The calls are counted as hits, or misses when the callers
+    fall back to the database (see ratings_central.metrics).
+    """
+    pointer = os.path.join(get_directory(), pointer_name)
+    try:
+        path = os.path.join(os.path.dirname(pointer), os.readlink(pointer))
+    except OSError:
+        metrics.MAP_LOOKUPS.labels(pointer_name, "miss").inc()
+        return None
+    loaded = _loaded.get(pointer)
+    if loaded is None or loaded.path != path:
+        try:
+            loaded = map_class(path)
+        except (OSError, ValueError):
+            metrics.MAP_LOOKUPS.labels(pointer_name, "miss").inc()
+            return None
+        _loaded[pointer] = loaded
+    metrics.MAP_LOOKUPS.labels(pointer_name, "hit").inc()
+    return loaded
+
+
+def get_player_map() -> Optional[PlayerMap]:
+    """Return the current player map, or None if none was written."""
+    return load(POINTER_NAME, PlayerMap)
@@ -0,0 +1,145 @@
+"""Retain the lists of the previous dataset version while an import replaces them.
+
+Before an import writes to the player and club tables, their current rows
+are copied to the tables of the retained models. List pages requested for
+the retained version are read from the copies, so clients paging through a
+list keep reading the version they started on until it expires. Only one
+version is retained, each import replaces the copies.
+"""
+import datetime
+from typing import List, Optional, Tuple, Type
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Model
+from django.utils import timezone
+
+from ratings_central import models
+
+# the live models and the retained models reading their copies
+RETAINED_MODELS: List[Tuple[Type[Model], Type[Model]]] = [
+    (models.Player, models.RetainedPlayer),
+    (models.Club, models.RetainedClub),
+]
+# the trigram indexes of the retained names, serving `name__icontains` like
+# those migration 0002 creates on the live tables
+TRIGRAM_INDEXES = {
+    models.RetainedPlayer: "player_retained_name_trgm_idx",
+    models.RetainedClub: "club_retained_name_trgm_idx",
+}
+
+
+def get_expiry(since: datetime.datetime) -> datetime.datetime:
+    """Return when a version retained since the time expires."""
+    return since + datetime.timedelta(seconds=settings.RETAINED_VERSION_TTL)
+
+
+def retain(dataset_version: models.DatasetVersion) -> None:
+    """Copy the current lists as those of the dataset version.
+
+    Each copy is built beside the retained one with only the columns and
+    indexes of the retained model, then swapped in by renaming it. The swap
+    is a single short transaction, so readers of the previously retained
+    version only wait for the renames rather than the copies.
+    """
+    for model, retained in RETAINED_MODELS:
+        copy_table(model, retained)
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for _, retained in RETAINED_MODELS:
+                swap_table(cursor, retained)
+        models.DatasetVersion.objects.exclude(pk=dataset_version.pk).filter(
+            retained_until__isnull=False
+        ).update(retained_until=None)
+        dataset_version.retained_until = get_expiry(timezone.now())
+        dataset_version.save(update_fields=["retained_until"])
+
+
+def get_index_names(retained: Type[Model]) -> List[str]:
+    """Return the names of the retained table's indexes, its primary key first."""
+    return [
+        f"{retained._meta.db_table}_pkey",
+        *(index.name for index in retained._meta.indexes),
+        TRIGRAM_INDEXES[retained],
+    ]
+
+
+def copy_table(model: Type[Model], retained: Type[Model]) -> None:
+    """Copy the current rows to a new table, named and indexed with `_new`."""
+    quote_name = connection.ops.quote_name
+    table = quote_name(model._meta.db_table)
+    copy = quote_name(f"{retained._meta.db_table}_new")
+    fields = retained._meta.concrete_fields
+    pkey = get_index_names(retained)[0]
+    primary_key = retained._meta.pk
+    assert primary_key is not None
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {copy}")
+        cursor.execute(
+            f"CREATE TABLE {copy} AS SELECT {columns} FROM {table} "
+            f"WHERE {quote_name(model._meta.get_field('removed_in').column)} IS NULL"
+        )
+        cursor.execute(
+            f"ALTER TABLE {copy} ADD CONSTRAINT {quote_name(f'{pkey}_new')} "
+            f"PRIMARY KEY ({quote_name(primary_key.column)})"
+        )
+        for statement in get_index_statements(retained):
+            cursor.execute(statement)
+        cursor.execute(f"ANALYZE {copy}")
+
+
+def get_index_statements(retained: Type[Model]) -> List[str]:
+    """Return the statements creating the retained indexes on the new copy."""
+    quote_name = connection.ops.quote_name
+    table = retained._meta.db_table
+    statements = []
+    with connection.schema_editor(collect_sql=True, atomic=False) as schema_editor:
+        for index in retained._meta.indexes:
+            statement = index.create_sql(retained, schema_editor)
+            statement.rename_table_references(table, f"{table}_new")
+            statement.parts["name"] = quote_name(f"{index.name}_new")
+            statements.append(str(statement))
+    statements.append(
+        f"CREATE INDEX {quote_name(f'{TRIGRAM_INDEXES[retained]}_new')} "
+        f"ON {quote_name(f'{table}_new')} "
+        'USING gin ((UPPER("name"::text)) gin_trgm_ops) WITH (fastupdate = off)'
+    )
+    return statements
+
+
+def swap_table(cursor, retained: Type[Model]) -> None:
+    """Replace the retained table and its indexes by the new copy."""
+    quote_name = connection.ops.quote_name
+    table = retained._meta.db_table
+    cursor.execute(f"DROP TABLE IF EXISTS {quote_name(table)}")
+    cursor.execute(
+        f"ALTER TABLE {quote_name(f'{table}_new')} RENAME TO {quote_name(table)}"
+    )
+    for name in get_index_names(retained):
+        cursor.execute(
+            f"ALTER INDEX {quote_name(f'{name}_new')} RENAME TO {quote_name(name)}"
+        )
+
+
+def extend(completed: datetime.datetime) -> None:
+    """Retain the copied version for the TTL after the import completed."""
+    models.DatasetVersion.objects.filter(retained_until__isnull=False).update(
+        retained_until=get_expiry(completed)
+    )
+
+
+def get_versions() -> Tuple[Optional[int], Optional[int]]:
+    """Return the latest completed and the retained dataset versions' ids."""
+    now = timezone.now()
+    latest, retained = None, None
+    # the retained version is the latest or the previous one
+    for primary_key, retained_until in (
+        models.DatasetVersion.objects.completed()
+        .order_by("-pk")
+        .values_list("pk", "retained_until")[:2]
+    ):
+        latest = latest or primary_key
+        if retained is None and retained_until is not None and retained_until > now:
+            retained = primary_key
+    return latest, retained
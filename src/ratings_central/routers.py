@@ -0,0 +1,138 @@
+"""Route the read-only ratings queries to the read replicas.
+
+Reads are only routed to a replica inside `replica_reads`, which the views
+enter for safe requests, so the importer and every write read the primary.
+The models of the other apps (users, auth, sessions) always stay on the
+primary.
+
+A replica is only read once it caught up to the latest dataset version
+completed on the primary, so the lists fall back to the primary right after
+an import until the replicas replayed it. The versions are checked at most
+every REPLICA_CHECK_INTERVAL seconds per process, and again once an import
+completes in the process. The pages of a dataset version newer than the one
+the replicas were checked against, e.g. the pages after a first one read from
+the primary, are read from the primary until they are checked again.
+"""
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+from django.db.models import Max
+
+from ratings_central import models
+
+ROUTED_APP_LABELS = {"ratings_central"}
+
+_read_database: ContextVar[Optional[str]] = ContextVar("read_database", default=None)
+# the replicas caught up to the primary's dataset version when last checked
+_caught_up: Dict[str, Any] = {"checked": None, "version": None, "replicas": []}
+
+
+def get_dataset_version(alias: str) -> Optional[int]:
+    """Return the latest dataset version completed in the database."""
+    return (
+        models.DatasetVersion.objects.using(alias)
+        .completed()
+        .aggregate(latest=Max("pk"))["latest"]
+    )
+
+
+def check_replicas() -> None:
+    """Check which replicas hold the primary's latest dataset version.
+
+    The replicas which cannot be reached are left out.
+    """
+    primary_version = get_dataset_version(DEFAULT_DB_ALIAS)
+    replicas = []
+    for alias in settings.DATABASE_REPLICAS:
+        try:
+            version = get_dataset_version(alias)
+        except DatabaseError:
+            continue
+        if primary_version is None or (
+            version is not None and version >= primary_version
+        ):
+            replicas.append(alias)
+    _caught_up.update(
+        checked=time.monotonic(), version=primary_version, replicas=replicas
+    )
+
+
+def invalidate_replicas() -> None:
+    """Check the replicas again before their next read, e.g. after an import."""
+    _caught_up["checked"] = None
+
+
+def get_caught_up_replicas(version: Optional[int] = None) -> List[str]:
+    """Return the replicas holding the primary's latest dataset version.
+
+    No replica is returned for a `version` newer than the one they were
+    checked against, as they may not hold it yet.
+    """
+    if not settings.DATABASE_REPLICAS:
+        return []
+    checked = _caught_up["checked"]
+    if checked is None or time.monotonic() - checked >= settings.REPLICA_CHECK_INTERVAL:
+        check_replicas()
+    if version is not None and (
+        _caught_up["version"] is None or version > _caught_up["version"]
+    ):
+        return []
+    return _caught_up["replicas"]
+
+
+def get_read_database(version: Optional[int] = None) -> str:
+    """Return a replica holding the version, or the primary if none is."""
+    replicas = get_caught_up_replicas(version)
+    return random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def replica_reads(version: Optional[int] = None) -> Iterator[str]:
+    """Route the ratings reads to a single database, returning its alias.
+
+    The database holds the dataset `version`, when given.
+    """
+    read_database = get_read_database(version)
+    token = _read_database.set(read_database)
+    try:
+        yield read_database
+    finally:
+        _read_database.reset(token)
+
+
+class ReplicaRouter:
+    """Route the ratings reads of `replica_reads` and keep the rest on the primary."""
+
+    # the signatures are Django's, see django.db.utils.ConnectionRouter
+    # pylint: disable=no-self-use,unused-argument
+
+    def db_for_read(self, model, **hints):
+        """Return the database of the current `replica_reads`, if any."""
+        if model._meta.app_label in ROUTED_APP_LABELS:
+            return _read_database.get()
+        return None
+
+    def db_for_write(self, model, **hints):
+        """Write to the primary."""
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Relate the rows of the primary and its replicas."""
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        # pylint: disable=protected-access
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(  # pylint: disable=invalid-name
+        self, db, app_label, model_name=None, **hints
+    ):
+        """Only migrate the primary, the replicas copy its schema."""
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -1,7 +1,7 @@
 """Serializers for the ratings_central app."""
 from rest_framework_json_api import serializers
 
-from ratings_central import models
+from ratings_central import enums, models, snapshots
 
 
 class PlayerSerializer(serializers.ModelSerializer):
@@ -33,6 +33,7 @@ class PlayerSerializer(serializers.ModelSerializer):
             "tta_id",
             "ittf_id",
             "deceased",
+            "active",
         ]
         fields = read_only_fields
 
@@ -62,3 +63,103 @@ class ClubSerializer(serializers.ModelSerializer):
             "status",
         ]
         fields = read_only_fields
+
+
+class DatasetVersionSerializer(serializers.ModelSerializer):
+    """Dataset version serializer."""
+
+    manifest = serializers.SerializerMethodField()
+
+    class Meta:
+        """Serializer meta information."""
+
+        model = models.DatasetVersion
+        read_only_fields = ["started", "completed", "manifest"]
+        fields = read_only_fields
+
+    def get_manifest(self, instance):  # pylint: disable=no-self-use
+        """Return the snapshots' manifest, with the url of each file."""
+        if instance.manifest is None:
+            return None
+        storage = snapshots.get_storage()
+        files = [
+            {**file, "url": storage.url(file["key"])}
+            for file in instance.manifest["files"]
+        ]
+        return {**instance.manifest, "files": files}
+
+
+class PlayerRatingSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Player rating serializer, documenting the player-ratings lookups."""
+
+    rc_id = serializers.IntegerField(read_only=True)
+    rating = serializers.IntegerField(read_only=True)
+    st_dev = serializers.IntegerField(read_only=True)
+    last_played = serializers.DateField(read_only=True)
+    birth = serializers.DateField(read_only=True)
+    deceased = serializers.BooleanField(read_only=True)
+    name = serializers.CharField(read_only=True)
+
+    class Meta:
+        """Serializer meta information."""
+
+        resource_name = "player-ratings"
+
+
+class NameQuerySerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """A name to match and the hints narrowing its candidates."""
+
+    name = serializers.CharField(max_length=100)
+    birth_year = serializers.IntegerField(
+        required=False, min_value=1900, max_value=2100
+    )
+    # the rc_id of the player's primary club
+    club = serializers.IntegerField(required=False)
+    country = serializers.ChoiceField(choices=enums.Country.choices, required=False)
+
+
+class PlayerMatchSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Player match serializer, validating the names to match."""
+
+    names = serializers.ListField(
+        child=NameQuerySerializer(), min_length=1, max_length=500
+    )
+    limit = serializers.IntegerField(default=5, min_value=1, max_value=20)
+
+    class Meta:
+        """Serializer meta information."""
+
+        resource_name = "player-matches"
+
+
+class RankingSerializer(serializers.ModelSerializer):
+    """Ranking serializer."""
+
+    included_serializers = {"player": PlayerSerializer}
+
+    class Meta:
+        """Serializer meta information."""
+
+        model = models.Ranking
+        read_only_fields = [
+            "player",
+            "sport",
+            "country",
+            "gender",
+            "age_category",
+            "rating",
+            "rank",
+            "percentile",
+        ]
+        fields = read_only_fields
+
+
+class StatisticsSerializer(serializers.ModelSerializer):
+    """Statistics serializer."""
+
+    class Meta:
+        """Serializer meta information."""
+
+        model = models.Statistics
+        read_only_fields = ["ratings", "st_devs", "activity", "countries", "clubs"]
+        fields = read_only_fields
@@ -0,0 +1,44 @@
+"""Signals for the ratings_central app."""
+# pylint: disable=unused-argument
+from django.dispatch import Signal, receiver
+
+from ratings_central import routers, tasks
+
+# sent by the importer once every list of an import has been imported
+import_completed = Signal(providing_args=["dataset_version"])
+
+
+@receiver(import_completed)
+def publish_snapshots_on_import_completed(sender, dataset_version, **kwargs):
+    """Publish the snapshots of the imported dataset version."""
+    tasks.publish_snapshots.apply_async([dataset_version.pk])
+
+
+@receiver(import_completed)
+def compute_rankings_on_import_completed(sender, dataset_version, **kwargs):
+    """Compute the leaderboards of the imported dataset version."""
+    tasks.compute_rankings.apply_async([dataset_version.pk])
+
+
+@receiver(import_completed)
+def compute_statistics_on_import_completed(sender, dataset_version, **kwargs):
+    """Compute the statistics of the imported dataset version."""
+    tasks.compute_statistics.apply_async([dataset_version.pk])
+
+
+@receiver(import_completed)
+def write_player_map_on_import_completed(sender, dataset_version, **kwargs):
+    """Write the player map of the imported dataset version."""
+    tasks.write_player_map.apply_async([dataset_version.pk])
+
+
+@receiver(import_completed)
+def write_name_maps_on_import_completed(sender, dataset_version, **kwargs):
+    """Write the name maps of the imported dataset version."""
+    tasks.write_name_maps.apply_async([dataset_version.pk])
+
+
+@receiver(import_completed)
+def invalidate_replicas_on_import_completed(sender, dataset_version, **kwargs):
+    """Check the replicas hold the imported dataset version before reading them."""
+    routers.invalidate_replicas()
@@ -0,0 +1,146 @@
+"""Publish static snapshots of the full player and club lists."""
+import gzip
+import hashlib
+import tempfile
+from itertools import islice
+from typing import IO, Any, Dict, Iterable, Iterator, List, Type
+
+from django.core.files import File
+from django.core.files.storage import Storage
+from rest_framework.serializers import ModelSerializer
+from rest_framework_json_api import utils
+
+from common.serializers import FieldPlan
+from ratings_central import models
+from webapp import renderers
+from webapp.storage import VersionedMediaS3
+
+CHUNK_SIZE = 2000
+
+
+def get_storage() -> Storage:
+    """Return the storage the snapshots are published to."""
+    return VersionedMediaS3()
+
+
+def get_key(dataset_version: models.DatasetVersion, name: str) -> str:
+    """Return the versioned key of a snapshot file."""
+    return f"snapshots/{dataset_version.pk}/{name}"
+
+
+def save_file(
+    storage: Storage, key: str, temp: IO[bytes], content_type: str
+) -> Dict[str, Any]:
+    """Save the written temporary file and return its details."""
+    size = temp.tell()
+    temp.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: temp.read(1024 * 1024), b""):
+        digest.update(chunk)
+    temp.seek(0)
+    content = File(temp)
+    # read by S3 storages, with the encoding guessed from the extension
+    content.content_type = content_type  # type: ignore
+    key = storage.save(key, content)
+    return {"key": key, "size": size, "sha256": digest.hexdigest()}
+
+
+def save_gzipped(
+    storage: Storage, key: str, lines: Iterable[bytes], content_type: str
+) -> Dict[str, Any]:
+    """Gzip the lines into a temporary file, save it and return its details."""
+    with tempfile.TemporaryFile() as temp:
+        with gzip.GzipFile(mode="wb", fileobj=temp, mtime=0) as gzipped:
+            for line in lines:
+                gzipped.write(line)
+        return save_file(storage, key, temp, content_type)
+
+
+class RowCounter:
+    """Count the rows of iterators as they are read."""
+
+    def __init__(self):
+        """Start counting from zero."""
+        self.count = 0
+
+    def __call__(self, rows: Iterable[Any]) -> Iterator[Any]:
+        """Yield the rows, counting each one."""
+        for row in rows:
+            self.count += 1
+            yield row
+
+
+def write_lines(
+    gzipped: gzip.GzipFile, renderer, header: List[str], rows: Iterable[List[Any]]
+) -> Iterator[List[Any]]:
+    """Yield the rows, writing their lines to the gzipped file as they are read.
+
+    The header line is written first, then the lines of each chunk of rows
+    before the chunk is yielded.
+    """
+    gzipped.write(next(renderer.render_rows(header, []), b""))
+    rows = iter(rows)
+    for chunk in iter(lambda: list(islice(rows, CHUNK_SIZE)), []):
+        lines = renderer.render_rows(header, chunk)
+        # skip the chunk's header line
+        next(lines, None)
+        gzipped.writelines(lines)
+        yield from chunk
+
+
+def publish_list(
+    storage: Storage,
+    dataset_version: models.DatasetVersion,
+    serializer_class: Type[ModelSerializer],
+) -> List[Dict[str, Any]]:
+    """Publish the JSON:API and CSV snapshots of a list, returning their details.
+
+    Both files are written from a single read of the rows, so they hold the
+    same rows.
+    """
+    resource_name = utils.get_resource_type_from_serializer(serializer_class)
+    plan = FieldPlan.build(serializer_class(), resource_name)
+    if plan is None:
+        raise ValueError(f"{serializer_class.__name__} cannot be snapshotted.")
+    rows = plan.values_list(serializer_class.Meta.model.objects.order_by("pk"))
+    json_counter, csv_counter = RowCounter(), RowCounter()
+    json_renderer = renderers.JSONRenderer()
+    csv_renderer = renderers.CSVRenderer()
+    with tempfile.TemporaryFile() as csv_temp:
+        with gzip.GzipFile(mode="wb", fileobj=csv_temp, mtime=0) as csv_gzipped:
+            values_list = write_lines(
+                csv_gzipped,
+                csv_renderer,
+                ["id", *plan.names],
+                csv_counter(plan.iter_values(rows.iterator(chunk_size=CHUNK_SIZE))),
+            )
+            json_file = save_gzipped(
+                storage,
+                get_key(dataset_version, f"{resource_name}.json.gz"),
+                json_renderer.render_stream(
+                    plan.iter_values_resources(json_counter(values_list)),
+                    meta={"dataset_version": dataset_version.pk},
+                    chunk_size=CHUNK_SIZE,
+                ),
+                json_renderer.media_type,
+            )
+        csv_file = save_file(
+            storage,
+            get_key(dataset_version, f"{resource_name}.csv.gz"),
+            csv_temp,
+            csv_renderer.media_type,
+        )
+    return [
+        {
+            "resource": resource_name,
+            "format": "json",
+            "count": json_counter.count,
+            **json_file,
+        },
+        {
+            "resource": resource_name,
+            "format": "csv",
+            "count": csv_counter.count,
+            **csv_file,
+        },
+    ]
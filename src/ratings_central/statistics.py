@@ -0,0 +1,94 @@
+"""Compute the statistics of each dataset version after its import."""
+import datetime
+from typing import Any, Dict, List
+
+from django.db.models import (
+    Avg,
+    Count,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    Max,
+    Q,
+    QuerySet,
+)
+
+from ratings_central import models
+
+RATING_BIN_WIDTH = 100
+ST_DEV_BIN_WIDTH = 10
+# the windows, in days before the import, active players are counted over
+ACTIVITY_WINDOWS = [30, 90, 365, 730]
+
+
+def get_histogram(players: QuerySet, field: str, width: int) -> List[Dict[str, Any]]:
+    """Return the number of players in each bin of the field, per sport."""
+    # integer division truncates the values to the start of their bin
+    minimum = ExpressionWrapper(F(field) / width * width, output_field=IntegerField())
+    return list(
+        players.values("sport", minimum=minimum)
+        .annotate(count=Count("pk"))
+        .order_by("sport", "minimum")
+    )
+
+
+def get_activity(players: QuerySet, date: datetime.date) -> List[Dict[str, Any]]:
+    """Return the number of players who played within each window, per sport."""
+    windows = {
+        f"days_{days}": Count(
+            "pk", filter=Q(last_played__gt=date - datetime.timedelta(days=days))
+        )
+        for days in ACTIVITY_WINDOWS
+    }
+    rows = players.values("sport").annotate(players=Count("pk"), **windows)
+    return [
+        {
+            "sport": row["sport"],
+            "players": row["players"],
+            "windows": [
+                {"days": days, "count": row[f"days_{days}"]}
+                for days in ACTIVITY_WINDOWS
+            ],
+        }
+        for row in rows.order_by("sport")
+    ]
+
+
+def get_aggregates(
+    players: QuerySet, date: datetime.date, *fields: str, **expressions: Any
+) -> List[Dict[str, Any]]:
+    """Return the players' count, activity and ratings of each group, per sport."""
+    active = Q(last_played__gt=date - models.ACTIVE_WINDOW)
+    rows = (
+        players.values("sport", *fields, **expressions)
+        .annotate(
+            players=Count("pk"),
+            active=Count("pk", filter=active),
+            rating_mean=Avg("rating"),
+            rating_max=Max("rating"),
+        )
+        .order_by("sport", *fields, *expressions)
+    )
+    return [{**row, "rating_mean": round(row["rating_mean"], 1)} for row in rows]
+
+
+def compute_statistics(dataset_version: models.DatasetVersion) -> models.Statistics:
+    """Compute and store the statistics of the dataset version.
+
+    Only living players are counted and activity is measured up to the date
+    the import completed. Every aggregate is computed by the database, so the
+    players are never loaded into memory.
+    """
+    date = dataset_version.get_completed().date()
+    players = models.Player.objects.filter(deceased=False)
+    statistics, _ = models.Statistics.objects.update_or_create(
+        dataset_version=dataset_version,
+        defaults={
+            "ratings": get_histogram(players, "rating", RATING_BIN_WIDTH),
+            "st_devs": get_histogram(players, "st_dev", ST_DEV_BIN_WIDTH),
+            "activity": get_activity(players, date),
+            "countries": get_aggregates(players, date, "country"),
+            "clubs": get_aggregates(players, date, club=F("rc_primary_club_id")),
+        },
+    )
+    return statistics
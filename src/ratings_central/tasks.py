@@ -0,0 +1,47 @@
+"""Tasks for the ratings_central app."""
+from celery import shared_task
+
+from ratings_central import (
+    autocomplete,
+    leaderboards,
+    manifests,
+    models,
+    player_maps,
+    statistics,
+)
+
+
+@shared_task
+def publish_snapshots(dataset_version_pk):
+    """Publish the static snapshots of the dataset version."""
+    dataset_version = models.DatasetVersion.objects.get(pk=dataset_version_pk)
+    manifests.publish_snapshots(dataset_version)
+
+
+@shared_task
+def compute_rankings(dataset_version_pk):
+    """Compute the leaderboards of the dataset version."""
+    dataset_version = models.DatasetVersion.objects.get(pk=dataset_version_pk)
+    leaderboards.compute_rankings(dataset_version)
+
+
+@shared_task
+def compute_statistics(dataset_version_pk):
+    """Compute the statistics of the dataset version."""
+    dataset_version = models.DatasetVersion.objects.get(pk=dataset_version_pk)
+    statistics.compute_statistics(dataset_version)
+
+
+@shared_task
+def write_player_map(dataset_version_pk):
+    """Write the player map of the dataset version."""
+    dataset_version = models.DatasetVersion.objects.get(pk=dataset_version_pk)
+    player_maps.write_player_map(dataset_version)
+
+
+@shared_task
+def write_name_maps(dataset_version_pk):
+    """Write the player and club name maps of the dataset version."""
+    dataset_version = models.DatasetVersion.objects.get(pk=dataset_version_pk)
+    for resource in autocomplete.SCORE_NAMES:
+        autocomplete.write_name_map(dataset_version, resource)
@@ -25,6 +25,9 @@ class PlayerFactory(factory.django.DjangoModelFactory):
     postal_code = "7000"
     country = enums.Country.AUS
     birth = date(1990, 1, 1)
+    birth_year = factory.LazyAttribute(
+        lambda player: player.birth and player.birth.year
+    )
     gender = enums.Gender.FEMALE
     sport = enums.Sport.TABLE_TENNIS
     usatt_id = 0
@@ -33,6 +33,7 @@ class PlayersSchema(JsonApiSchema):
         "tta_id": instance_of(int),
         "ittf_id": instance_of(int),
         "deceased": instance_of(bool),
+        "active": instance_of(bool),
     }
     relationships: Dict[str, IsJsonApiRelationship] = {}
     includes: Sequence[Union[Type[IsResourceObject], str]] = []
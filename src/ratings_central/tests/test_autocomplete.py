@@ -0,0 +1,136 @@
+"""Ensure names are completed from the memory-mapped name maps."""
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import autocomplete, importer, models
+from ratings_central.tests import factories, utils
+
+
+class AutocompleteTestCase(BaseTestCase):
+    """Ensure the name maps complete the same names as the database."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the imported dataset."""
+        super().setUpTestData()
+        cls.club = factories.ClubFactory(rc_id=1, name="Smithton Table Tennis")
+        factories.ClubFactory(rc_id=2, name="Hobart Smashers")
+        cls.players = [
+            factories.PlayerFactory(name="Jon Smith", rating=1800, active=True),
+            factories.PlayerFactory(name="Mary Smithson", rating=2100, active=True),
+            factories.PlayerFactory(name="Zoë Ćwikła", rating=1500),
+            factories.PlayerFactory(name="Smith Jones", rating=1800),
+            factories.PlayerFactory(name="Sam Smith", rating=2500, deceased=True),
+        ]
+        cls.dataset_version = models.DatasetVersion.objects.create(
+            completed=timezone.now()
+        )
+
+    def setUp(self):
+        """Write the name maps to a temporary directory."""
+        super().setUp()
+        settings = override_settings(PLAYER_MAP_DIR=self.get_temporary_directory())
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(autocomplete.get_active_players.cache_clear)
+
+    def test_lookup(self):
+        """The name maps complete the database's names, best scored first."""
+        for resource in autocomplete.SCORE_NAMES:
+            autocomplete.write_name_map(self.dataset_version, resource)
+        players = autocomplete.get_name_map("players")
+        self.assertEqual(players.dataset_version, self.dataset_version.pk)
+        jon, mary, zoe, smith = self.players[:4]
+        self.assertEqual(
+            players.lookup("SMI", 10),
+            [
+                (mary.pk, "Mary Smithson", 2100),
+                (jon.pk, "Jon Smith", 1800),
+                (smith.pk, "Smith Jones", 1800),
+            ],
+        )
+        self.assertEqual(
+            players.lookup("smith j", 10), [(smith.pk, "Smith Jones", 1800)]
+        )
+        self.assertEqual(players.lookup("cwi", 10), [(zoe.pk, "Zoë Ćwikła", 1500)])
+        self.assertEqual(players.lookup("zoe cw", 10), [(zoe.pk, "Zoë Ćwikła", 1500)])
+        for prefix, limit in [("smi", 2), ("Smith", 10), ("smith j", 10), ("xyz", 10)]:
+            with self.subTest(prefix=prefix, limit=limit):
+                self.assertEqual(
+                    players.lookup(prefix, limit),
+                    autocomplete.get_matches("players", prefix, limit),
+                )
+        for prefix in ["s", "jo", ""]:
+            with self.subTest(prefix=prefix):
+                self.assertEqual(autocomplete.get_matches("players", prefix, 10), [])
+        self.assertEqual(
+            autocomplete.get_name_map("clubs").lookup("smi", 10),
+            [(self.club.pk, "Smithton Table Tennis", 2)],
+        )
+        self.assertEqual(
+            autocomplete.get_matches("clubs", "smi", 10),
+            [(self.club.pk, "Smithton Table Tennis", 2)],
+        )
+
+    def test_endpoint(self):
+        """The endpoint lists the same names with or without a name map."""
+        params = {"filter[prefix]": "smi", "page[size]": 2}
+        expected = self.get(
+            "/players/autocomplete/", params, asserted_status=status.HTTP_200_OK
+        ).json()
+        self.assertEqual(
+            expected["data"],
+            [
+                {
+                    "type": "players",
+                    "id": str(self.players[1].pk),
+                    "attributes": {"name": "Mary Smithson", "rating": 2100},
+                },
+                {
+                    "type": "players",
+                    "id": str(self.players[0].pk),
+                    "attributes": {"name": "Jon Smith", "rating": 1800},
+                },
+            ],
+        )
+        autocomplete.write_name_map(self.dataset_version, "players")
+        with CaptureQueriesContext(connection) as context:
+            json_data = self.get(
+                "/players/autocomplete/", params, asserted_status=status.HTTP_200_OK
+            ).json()
+        self.assertEqual(json_data, expected)
+        self.assertEqual(context.captured_queries, [])
+        json_data = self.get(
+            "/clubs/autocomplete/", params, asserted_status=status.HTTP_200_OK
+        ).json()
+        self.assertEqual(
+            json_data["data"][0]["attributes"],
+            {"name": "Smithton Table Tennis", "active_players": 2},
+        )
+
+    def test_invalid(self):
+        """A prefix and a page size within the limit are required."""
+        for params in [
+            {},
+            {"filter[prefix]": " - "},
+            {"filter[prefix]": "smi", "page[size]": 50},
+            {"filter[prefix]": "smi", "page[size]": "x"},
+        ]:
+            with self.subTest(params=params):
+                self.get(
+                    "/players/autocomplete/",
+                    params,
+                    asserted_status=status.HTTP_400_BAD_REQUEST,
+                )
+
+    def test_import_completed(self):  # pylint: disable=no-self-use
+        """Completing an import writes its name maps."""
+        with utils.mock_import() as apply_asyncs:
+            importer.import_zipped_list(models.Director(rc_id=1))
+        dataset_version = models.DatasetVersion.objects.latest("pk")
+        apply_asyncs["write_name_maps"].assert_called_once_with([dataset_version.pk])
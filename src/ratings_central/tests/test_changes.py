@@ -0,0 +1,193 @@
+"""Ensure the imports track changed rows and serve them as change feeds."""
+import csv
+import datetime
+import io
+
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import importer, models
+from ratings_central.tests import utils
+
+PLAYER_COLUMNS = [
+    "ID",
+    "Name",
+    "Rating",
+    "StDev",
+    "LastPlayed",
+    "Club",
+    "Address1",
+    "Address2",
+    "City",
+    "State",
+    "Province",
+    "PostalCode",
+    "Country",
+    "Email",
+    "Birth",
+    "Sex",
+    "Sport",
+    "USATT",
+    "TTA",
+    "ITTF",
+    "Deceased",
+]
+
+
+def get_player_list(*players):
+    """Return the player list CSV of the (rc_id, name, rating) tuples."""
+    last_played = (timezone.now() - datetime.timedelta(days=10)).date()
+    content = io.StringIO()
+    writer = csv.DictWriter(content, PLAYER_COLUMNS, restval="")
+    writer.writeheader()
+    for rc_id, name, rating in players:
+        writer.writerow(
+            {
+                "ID": rc_id,
+                "Name": name,
+                "Rating": rating,
+                "StDev": 50,
+                "LastPlayed": last_played.isoformat(),
+                "Club": 1,
+                "Country": "AUS",
+                "Birth": "1990-01-01",
+                "Sex": "F",
+                "Sport": 1,
+                "USATT": 0,
+                "TTA": 0,
+                "ITTF": 0,
+            }
+        )
+    return {"RatingList.csv": content.getvalue()}
+
+
+@override_settings(IMPORT_MAX_REMOVED_SHARE=0.5)
+class ChangesTestCase(BaseTestCase):
+    """Ensure only the rows created, changed or removed are listed."""
+
+    @staticmethod
+    def import_lists(lists):
+        """Import the lists and return the completed dataset version."""
+        with utils.mock_import(lists):
+            importer.import_zipped_list(models.Director(rc_id=1))
+        return models.DatasetVersion.objects.latest("pk")
+
+    def setUp(self):
+        """Import two versions of the player list."""
+        super().setUp()
+        self.first = self.import_lists(
+            get_player_list(
+                (1, "Unchanged", 1500), (2, "Changed", 1600), (3, "Gone", 1700)
+            )
+        )
+        self.players = {player.rc_id: player for player in models.Player.objects.all()}
+        self.second = self.import_lists(
+            get_player_list(
+                (1, "Unchanged", 1500), (2, "Changed", 1650), (4, "New", 1800)
+            )
+        )
+
+    def test_import(self):
+        """Only the created and changed rows are marked as updated."""
+        updated_in = dict(models.Player.objects.values_list("rc_id", "updated_in"))
+        self.assertEqual(
+            updated_in, {1: self.first.pk, 2: self.second.pk, 4: self.second.pk}
+        )
+        birth_years = models.Player.objects.values_list("birth_year", flat=True)
+        self.assertEqual(set(birth_years), {1990})
+        (removal,) = models.Removal.objects.all()
+        self.assertEqual(
+            (
+                removal.dataset_version,
+                removal.resource,
+                removal.record_id,
+                removal.rc_id,
+            ),
+            (self.second, "players", self.players[3].pk, 3),
+        )
+
+    def test_tombstones(self):
+        """The removed rows are hidden but kept, and restored once listed again."""
+        self.assertFalse(models.Player.objects.filter(rc_id=3).exists())
+        removed = models.Player.all_objects.get(rc_id=3)
+        self.assertEqual(removed.removed_in, self.second)
+        third = self.import_lists(
+            get_player_list(
+                (1, "Unchanged", 1500),
+                (2, "Changed", 1650),
+                (3, "Gone", 1700),
+                (4, "New", 1800),
+            )
+        )
+        restored = models.Player.objects.get(rc_id=3)
+        self.assertEqual(restored.pk, removed.pk)
+        self.assertEqual(restored.updated_in, third)
+        json_data = self.get(
+            "/players/changes/",
+            {"filter[since]": self.first.pk},
+            asserted_status=status.HTTP_200_OK,
+        ).json()
+        self.assertEqual(
+            [data["attributes"]["rc_id"] for data in json_data["data"]], [2, 3, 4]
+        )
+        self.assertEqual(json_data["meta"]["removed"], [])
+
+    def test_implausible_removals(self):
+        """A list missing too many of the current rows is not imported."""
+        with self.assertRaises(importer.ImplausibleRemovals):
+            self.import_lists(get_player_list((1, "Unchanged", 1500)))
+        self.assertEqual(models.DatasetVersion.objects.latest("pk"), self.second)
+        self.assertEqual(
+            set(models.Player.objects.values_list("rc_id", flat=True)), {1, 2, 4}
+        )
+
+    def test_changes(self):
+        """The feed lists the rows updated and removed after the token."""
+        json_data = self.get(
+            "/players/changes/",
+            {"filter[since]": self.first.pk},
+            asserted_status=status.HTTP_200_OK,
+        ).json()
+        self.assertEqual(
+            [data["attributes"]["rc_id"] for data in json_data["data"]], [2, 4]
+        )
+        self.assertEqual(json_data["data"][0]["attributes"]["rating"], 1650)
+        self.assertEqual(json_data["meta"]["since"], self.first.pk)
+        self.assertEqual(json_data["meta"]["token"], self.second.pk)
+        self.assertEqual(json_data["meta"]["removed"], [str(self.players[3].pk)])
+        json_data = self.get(
+            "/players/changes/",
+            {"filter[since]": self.second.pk},
+            asserted_status=status.HTTP_200_OK,
+        ).json()
+        self.assertEqual(json_data["data"], [])
+        self.assertEqual(json_data["meta"]["removed"], [])
+        self.assertEqual(json_data["meta"]["token"], self.second.pk)
+
+    def test_removed_first_page(self):
+        """Only the first page lists the removed ids."""
+        params = {"filter[since]": self.first.pk, "page[size]": 1}
+        json_data = self.get(
+            "/players/changes/", params, asserted_status=status.HTTP_200_OK
+        ).json()
+        self.assertEqual(json_data["meta"]["removed"], [str(self.players[3].pk)])
+        json_data = self.get(
+            "/players/changes/",
+            {**params, "page[number]": 2},
+            asserted_status=status.HTTP_200_OK,
+        ).json()
+        self.assertEqual(json_data["data"][0]["attributes"]["rc_id"], 4)
+        self.assertNotIn("removed", json_data["meta"])
+        self.assertEqual(json_data["meta"]["token"], self.second.pk)
+
+    def test_since_required(self):
+        """The token must be a dataset version id."""
+        for params in [{}, {"filter[since]": "abc"}]:
+            with self.subTest(params=params):
+                self.get(
+                    "/clubs/changes/",
+                    params,
+                    asserted_status=status.HTTP_400_BAD_REQUEST,
+                )
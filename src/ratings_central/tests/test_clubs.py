@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from typing import Type
 
+from rest_framework import status
+
 from common.test import JsonApiTestCase, mixins
 from common.test.schemas import JsonApiSchema
 from ratings_central.tests import factories, schemas
@@ -30,6 +32,21 @@ class EndpointConfig(
 class AnonTestCase(EndpointConfig, mixins.readonly.AnonTestCaseMixin, JsonApiTestCase):
     """Test validation for anon users."""
 
+    def test_filter_rc_id_in(self):
+        """Multiple clubs can be looked up by rc_id at once."""
+        expected = self.instances[:2]
+        json = self.get(
+            f"/{self.resource_name}/",
+            data={"filter[rc_id__in]": ",".join(str(c.rc_id) for c in expected)},
+            asserted_status=status.HTTP_200_OK,
+            asserted_schema=self.schema.get_matcher(many=True),
+        ).json()
+        # check only the requested clubs are returned
+        self.assertCountEqual(
+            [data["id"] for data in json["data"]],
+            [str(club.pk) for club in expected],
+        )
+
 
 class UserTestCase(
     EndpointConfig,
@@ -0,0 +1,120 @@
+"""Ensure the export actions stream every filtered row."""
+import csv
+import io
+import json
+from unittest import mock
+
+from rest_framework import status
+
+from common.test import BaseTestCase
+from common.views import ExportMixin
+from ratings_central import views
+from ratings_central.tests import factories
+
+
+class ExportTestCaseMixin:
+    """Compare the exported rows with the list's resources."""
+
+    resource_name: str
+    view_class: type
+    factory: type
+    filter_params: dict
+
+    @classmethod
+    def setUpTestData(cls):  # pylint: disable=invalid-name
+        """Create the instances to export."""
+        super().setUpTestData()  # type: ignore
+        cls.factory.create_batch(size=5)
+
+    def get_export(self, params=None, suffix="", **kwargs):
+        """Return the streamed response and its content."""
+        response = self.get(  # type: ignore
+            f"/{self.resource_name}/export{suffix}/",
+            params,
+            asserted_status=status.HTTP_200_OK,
+            **kwargs,
+        )
+        self.assertTrue(response.streaming)  # type: ignore
+        return response, b"".join(response.streaming_content).decode()
+
+    def get_records(self, params=None):
+        """Return the list's resources as flat records."""
+        json_data = self.get(  # type: ignore
+            f"/{self.resource_name}/",
+            params,
+            asserted_status=status.HTTP_200_OK,
+        ).json()
+        return [
+            {"id": int(data["id"]), **data["attributes"]} for data in json_data["data"]
+        ]
+
+    def test_ndjson(self):
+        """Every row is exported as a JSON object per line."""
+        response, content = self.get_export(HTTP_ACCEPT="application/x-ndjson")
+        self.assertEqual(  # type: ignore
+            response["Content-Type"], "application/x-ndjson"
+        )
+        self.assertEqual(  # type: ignore
+            response["Content-Disposition"],
+            f'attachment; filename="{self.resource_name}.ndjson"',
+        )
+        records = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(records, self.get_records())  # type: ignore
+
+    def test_csv(self):
+        """Every row is exported as a CSV line after the header."""
+        response, content = self.get_export(suffix=".csv")
+        self.assertEqual(  # type: ignore
+            response["Content-Type"], "text/csv; charset=utf-8"
+        )
+        rows = list(csv.DictReader(io.StringIO(content)))
+        expected = self.get_records()
+        self.assertEqual(list(rows[0]), list(expected[0]))  # type: ignore
+        self.assertEqual(  # type: ignore
+            [row["id"] for row in rows], [str(record["id"]) for record in expected]
+        )
+
+    def test_filters(self):
+        """The list's filters and sparse fieldsets apply to the export."""
+        params = {**self.filter_params, f"fields[{self.resource_name}]": "name"}
+        _, content = self.get_export(params, suffix=".ndjson")
+        records = [json.loads(line) for line in content.splitlines()]
+        self.assertTrue(records)  # type: ignore
+        self.assertEqual(records, self.get_records(params))  # type: ignore
+
+    def test_batches(self):
+        """Rows are streamed in batches of the chunk size."""
+        with mock.patch.object(ExportMixin, "export_chunk_size", 2):
+            response = self.get(  # type: ignore
+                f"/{self.resource_name}/export.ndjson/",
+                asserted_status=status.HTTP_200_OK,
+            )
+            batches = list(response.streaming_content)
+        self.assertEqual(  # type: ignore
+            [len(batch.splitlines()) for batch in batches], [2, 2, 1]
+        )
+
+    def test_serializer_fallback(self):
+        """Rows the fast read path cannot map are exported by the serializer."""
+        with mock.patch("common.views.FieldPlan.build", return_value=None):
+            _, content = self.get_export(suffix=".ndjson")
+        records = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(records, self.get_records())  # type: ignore
+
+
+class PlayerExportTestCase(ExportTestCaseMixin, BaseTestCase):
+    """Compare the exported players with the list's players."""
+
+    resource_name = "players"
+    view_class = views.PlayerView
+    factory = factories.PlayerFactory
+    filter_params = {"filter[deceased]": "false"}
+
+
+class ClubExportTestCase(ExportTestCaseMixin, BaseTestCase):
+    """Compare the exported clubs with the list's clubs."""
+
+    resource_name = "clubs"
+    view_class = views.ClubView
+    factory = factories.ClubFactory
+    filter_params = {"filter[status]": "Active"}
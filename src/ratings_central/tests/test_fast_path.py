@@ -0,0 +1,156 @@
+"""Ensure the fast read path renders the same documents as the serializers."""
+from datetime import date
+from unittest import mock
+
+from rest_framework import status
+
+from common.serializers import FieldPlan
+from common.test import BaseTestCase
+from ratings_central import enums, views
+from ratings_central.tests import factories
+
+
+class FastReadTestCaseMixin:
+    """Compare the fast path's responses with the serializer's, byte for byte."""
+
+    resource_name: str
+    view_class: type
+    params_list: list
+
+    def get_content(self, params, fast_read, stream_page_size=None):
+        """Return the content of the list response."""
+        with mock.patch.multiple(
+            self.view_class,
+            fast_read=fast_read,
+            stream_page_size=stream_page_size,
+            stream_chunk_size=2,
+        ):
+            response = self.get(  # type: ignore
+                f"/{self.resource_name}/",
+                params,
+                asserted_status=status.HTTP_200_OK,
+            )
+            if stream_page_size is None:
+                return response.content
+            self.assertTrue(response.streaming)  # type: ignore
+            self.assertEqual(  # type: ignore
+                response["Content-Type"], "application/vnd.api+json"
+            )
+            return b"".join(response.streaming_content)
+
+    def test_byte_identical(self):
+        """The fast path renders exactly what the serializer renders."""
+        for params in self.params_list:
+            with self.subTest(params=params):
+                self.assertEqual(
+                    self.get_content(params, fast_read=True),
+                    self.get_content(params, fast_read=False),
+                )
+
+    def test_stream_byte_identical(self):
+        """Streamed pages render exactly what the serializer renders."""
+        for params in self.params_list:
+            with self.subTest(params=params):
+                self.assertEqual(
+                    self.get_content(params, fast_read=True, stream_page_size=1),
+                    self.get_content(params, fast_read=False),
+                )
+
+    def test_fast_path_used(self):
+        """The fast path does not instantiate model instances."""
+        model = self.view_class.queryset.model
+        with mock.patch.object(model, "from_db") as from_db:
+            self.get(  # type: ignore
+                f"/{self.resource_name}/", asserted_status=status.HTTP_200_OK
+            )
+        from_db.assert_not_called()
+
+    def test_filtered_once(self):
+        """The queryset is filtered once, with or without the fast path."""
+        filter_queryset = self.view_class.filter_queryset
+        for fast_read in [True, False]:
+            with self.subTest(fast_read=fast_read):
+                with mock.patch.object(
+                    self.view_class,
+                    "filter_queryset",
+                    autospec=True,
+                    side_effect=filter_queryset,
+                ) as mocked:
+                    self.get_content({}, fast_read=fast_read)
+                self.assertEqual(mocked.call_count, 1)  # type: ignore
+
+
+class ConverterTestCase(BaseTestCase):
+    """Ensure the converters represent values as the fields do."""
+
+    def test_choices(self):
+        """Blank, missing and unknown choices are represented as by DRF."""
+        serializer = views.PlayerView.serializer_class()
+        field = serializer.fields["na_state"]
+        plan = FieldPlan.build(serializer, "players")
+        converter = dict(plan.conversions)[plan.columns.index("na_state")]
+        # the values are read from the database as plain strings
+        for value in ["", None, str(enums.NorthAmericaState.QC), "ZZ"]:
+            with self.subTest(value=value):
+                self.assertEqual(converter(value), field.to_representation(value))
+
+
+class PlayerFastReadTestCase(FastReadTestCaseMixin, BaseTestCase):
+    """Compare the fast path's player responses with the serializer's."""
+
+    resource_name = "players"
+    view_class = views.PlayerView
+    params_list = [
+        {},
+        {"page[size]": 2},
+        {"page[size]": 2, "page[number]": 2},
+        {"fields[players]": "name,rating,birth"},
+        {"fields[players]": "birth"},
+        {"filter[deceased]": "true"},
+        {"filter[name__icontains]": "nobody"},
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create players covering each kind of value."""
+        super().setUpTestData()
+        factories.PlayerFactory.create_batch(size=3)
+        factories.PlayerFactory(
+            name="Zoë Ćwikła 山田",
+            birth=None,
+            na_state=enums.NorthAmericaState.QC,
+            country=enums.Country.CAN,
+            gender=enums.Gender.MALE,
+            sport=enums.Sport.HARDBAT,
+            last_played=date(1999, 12, 31),
+            email='"quoted"@example.com',
+            deceased=True,
+        )
+        factories.PlayerFactory(na_state="")
+
+
+class ClubFastReadTestCase(FastReadTestCaseMixin, BaseTestCase):
+    """Compare the fast path's club responses with the serializer's."""
+
+    resource_name = "clubs"
+    view_class = views.ClubView
+    params_list = [
+        {},
+        {"page[size]": 2},
+        {"page[size]": 2, "page[number]": 2},
+        {"fields[clubs]": "name,status"},
+        {"filter[status]": enums.ClubStatus.INACTIVE},
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create clubs covering each kind of value."""
+        super().setUpTestData()
+        factories.ClubFactory.create_batch(size=3)
+        factories.ClubFactory(
+            name="Club \\ “Ping” ✓",
+            website="https://example.com/?a=1&b=2",
+            na_state=enums.NorthAmericaState.NY,
+            country=enums.Country.USA,
+            status=enums.ClubStatus.INACTIVE,
+        )
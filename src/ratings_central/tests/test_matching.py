@@ -0,0 +1,101 @@
+"""Ensure batches of names are matched to players."""
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import enums
+from ratings_central.tests import factories
+from users.tests.factories import UserFactory
+
+
+class PlayerMatchTestCase(BaseTestCase):
+    """Ensure each name returns its best scored candidates."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create players with similar names."""
+        super().setUpTestData()
+        cls.jonathan = factories.PlayerFactory(
+            name="Jonathan Smith", birth=datetime.date(1990, 5, 1)
+        )
+        cls.jon = factories.PlayerFactory(
+            name="Jon Smyth",
+            birth=datetime.date(1985, 5, 1),
+            country=enums.Country.NZL,
+        )
+        cls.mary = factories.PlayerFactory(name="Mary Jones")
+        factories.PlayerFactory(name="John Smith", deceased=True)
+
+    def setUp(self):
+        """Authenticate, as anonymous users cannot match names."""
+        super().setUp()
+        self.auth(UserFactory())
+
+    def match(self, names, asserted_status=status.HTTP_200_OK, **attributes):
+        """Post the names and return the response's data."""
+        response = self.post(
+            "/player-matches/",
+            {
+                "data": {
+                    "type": "player-matches",
+                    "attributes": {"names": names, **attributes},
+                }
+            },
+            asserted_status=asserted_status,
+        )
+        return response.json().get("data")
+
+    @staticmethod
+    def get_candidates(data):
+        """Return the ids of each name's candidates."""
+        return [
+            [candidate["id"] for candidate in match["attributes"]["candidates"]]
+            for match in data
+        ]
+
+    def test_match(self):
+        """The names are matched by trigrams and phonetic keys in one query."""
+        names = [
+            {"name": "John Smith"},
+            {"name": "John Smith", "birth_year": 1990, "country": "AUS"},
+            {"name": "mary jones"},
+            {"name": "1234"},
+        ]
+        with CaptureQueriesContext(connection) as context:
+            data = self.match(names)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertEqual(
+            self.get_candidates(data),
+            [
+                # "Jon Smyth" sounds the same
+                [str(self.jon.pk), str(self.jonathan.pk)],
+                [str(self.jonathan.pk), str(self.jon.pk)],
+                [str(self.mary.pk)],
+                [],
+            ],
+        )
+        self.assertEqual(data[1]["attributes"]["birth_year"], 1990)
+        candidate = data[2]["attributes"]["candidates"][0]
+        self.assertEqual(candidate["rc_id"], self.mary.rc_id)
+        self.assertEqual(candidate["name"], "Mary Jones")
+        # the same letters and phonetic keys
+        self.assertEqual(candidate["score"], 1.2)
+
+    def test_limit(self):
+        """Only the best candidates are returned."""
+        data = self.match([{"name": "John Smith"}], limit=1)
+        self.assertEqual(self.get_candidates(data), [[str(self.jon.pk)]])
+
+    def test_invalid(self):
+        """The names and hints are validated."""
+        for names in [[], [{"name": ""}], [{"name": "Jo", "birth_year": "x"}]]:
+            with self.subTest(names=names):
+                self.match(names, asserted_status=status.HTTP_400_BAD_REQUEST)
+
+    def test_anonymous(self):
+        """Anonymous users cannot match names."""
+        self.auth(None)
+        self.match([{"name": "Mary Jones"}], status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,116 @@
+"""Ensure players are looked up from the memory-mapped player map."""
+import os
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import importer, models, player_maps
+from ratings_central.tests import factories, utils
+
+
+class PlayerMapTestCase(BaseTestCase):
+    """Ensure the player map holds the same rows as the database."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the imported dataset."""
+        super().setUpTestData()
+        cls.players = [
+            factories.PlayerFactory(rc_id=5001, name="Zoë Ćwikła", birth=None),
+            factories.PlayerFactory(rc_id=5002, deceased=True),
+            factories.PlayerFactory(rc_id=5003, name=""),
+            factories.PlayerFactory(rc_id=7000),
+        ]
+        cls.dataset_version = models.DatasetVersion.objects.create(
+            completed=timezone.now()
+        )
+
+    def setUp(self):
+        """Write the player maps to a temporary directory."""
+        super().setUp()
+        self.directory = self.get_temporary_directory()
+        settings = override_settings(PLAYER_MAP_DIR=self.directory)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_lookup(self):
+        """Looking rc_ids up in the map returns the database's rows."""
+        player_maps.write_player_map(self.dataset_version)
+        player_map = player_maps.get_player_map()
+        self.assertEqual(len(player_map), len(self.players))
+        self.assertEqual(player_map.dataset_version, self.dataset_version.pk)
+        for rc_ids in [[5001], [7000, 5002, 5003, 5002], [1, 6000, 9000], []]:
+            with self.subTest(rc_ids=rc_ids):
+                self.assertEqual(
+                    player_map.lookup(rc_ids), player_maps.get_rows(rc_ids)
+                )
+
+    def test_reload(self):
+        """Workers map the new file once a new dataset version is written."""
+        self.assertIsNone(player_maps.get_player_map())
+        player_maps.write_player_map(self.dataset_version)
+        player_map = player_maps.get_player_map()
+        self.assertIs(player_maps.get_player_map(), player_map)
+        factories.PlayerFactory(rc_id=8000)
+        later = models.DatasetVersion.objects.create(completed=timezone.now())
+        player_maps.write_player_map(later)
+        reloaded = player_maps.get_player_map()
+        self.assertEqual(reloaded.dataset_version, later.pk)
+        self.assertEqual(len(reloaded), len(self.players) + 1)
+        # the previous map is still readable while it is referenced
+        self.assertEqual(len(player_map.lookup([5001])), 1)
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            sorted([player_maps.POINTER_NAME, player_maps.get_file_name(later.pk)]),
+        )
+
+    def test_endpoint(self):
+        """The endpoint returns the same players with or without a map."""
+        params = {"filter[rc_id__in]": "5003,5001,404"}
+        expected = self.get(
+            "/player-ratings/", params, asserted_status=status.HTTP_200_OK
+        ).json()
+        self.assertEqual(
+            [data["id"] for data in expected["data"]],
+            [str(self.players[0].pk), str(self.players[2].pk)],
+        )
+        self.assertEqual(
+            expected["data"][0]["attributes"],
+            {
+                "rc_id": 5001,
+                "rating": self.players[0].rating,
+                "st_dev": self.players[0].st_dev,
+                "last_played": self.players[0].last_played.isoformat(),
+                "birth": None,
+                "deceased": False,
+                "name": "Zoë Ćwikła",
+            },
+        )
+        player_maps.write_player_map(self.dataset_version)
+        with CaptureQueriesContext(connection) as context:
+            json_data = self.get(
+                "/player-ratings/", params, asserted_status=status.HTTP_200_OK
+            ).json()
+        self.assertEqual(json_data, expected)
+        self.assertEqual(context.captured_queries, [])
+
+    def test_invalid(self):
+        """The rc_ids to look up must be given as integers."""
+        for params in [{}, {"filter[rc_id]": "abc"}]:
+            with self.subTest(params=params):
+                self.get(
+                    "/player-ratings/",
+                    params,
+                    asserted_status=status.HTTP_400_BAD_REQUEST,
+                )
+
+    def test_import_completed(self):  # pylint: disable=no-self-use
+        """Completing an import writes its player map."""
+        with utils.mock_import() as apply_asyncs:
+            importer.import_zipped_list(models.Director(rc_id=1))
+        dataset_version = models.DatasetVersion.objects.latest("pk")
+        apply_asyncs["write_player_map"].assert_called_once_with([dataset_version.pk])
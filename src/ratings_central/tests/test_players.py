@@ -1,10 +1,15 @@
 """Tests for players endpoint."""
 from __future__ import annotations
 
+import datetime
 from typing import Type
 
+from django.utils import timezone
+from rest_framework import status
+
 from common.test import JsonApiTestCase, mixins
 from common.test.schemas import JsonApiSchema
+from ratings_central import models
 from ratings_central.tests import factories, schemas
 
 
@@ -30,6 +35,157 @@ class EndpointConfig(
 class AnonTestCase(EndpointConfig, mixins.readonly.AnonTestCaseMixin, JsonApiTestCase):
     """Test validation for anon users."""
 
+    def test_filter_rc_id_in(self):
+        """Multiple players can be looked up by rc_id at once."""
+        expected = self.instances[:2]
+        json = self.get(
+            f"/{self.resource_name}/",
+            data={"filter[rc_id__in]": ",".join(str(p.rc_id) for p in expected)},
+            asserted_status=status.HTTP_200_OK,
+            asserted_schema=self.schema.get_matcher(many=True),
+        ).json()
+        # check only the requested players are returned
+        self.assertCountEqual(
+            [data["id"] for data in json["data"]],
+            [str(player.pk) for player in expected],
+        )
+
+    def test_filter_federation_ids_in(self):
+        """Multiple players can be looked up by federation ids at once."""
+        for field in ["usatt_id", "tta_id", "ittf_id"]:
+            with self.subTest(field=field):
+                expected = [self.factory(**{field: 5000 + index}) for index in range(2)]
+                json = self.get(
+                    f"/{self.resource_name}/",
+                    data={
+                        f"filter[{field}__in]": ",".join(
+                            str(getattr(player, field)) for player in expected
+                        )
+                    },
+                    asserted_status=status.HTTP_200_OK,
+                    asserted_schema=self.schema.get_matcher(many=True),
+                ).json()
+                # check only the requested players are returned
+                self.assertCountEqual(
+                    [data["id"] for data in json["data"]],
+                    [str(player.pk) for player in expected],
+                )
+
+    def test_filter_rating_band(self):
+        """Players can be filtered to a band of ratings."""
+        for rating in [1499, 1500, 1650, 1800, 1801]:
+            self.factory(rating=rating)
+        expected = self.factory._meta.model.objects.filter(
+            rating__gte=1500, rating__lte=1800
+        )
+        json = self.get(
+            f"/{self.resource_name}/",
+            data={"filter[rating__gte]": 1500, "filter[rating__lte]": 1800},
+            asserted_status=status.HTTP_200_OK,
+            asserted_schema=self.schema.get_matcher(many=True),
+        ).json()
+        self.assertCountEqual(
+            [data["id"] for data in json["data"]],
+            [str(player.pk) for player in expected],
+        )
+
+    def test_filter_age_category(self):
+        """Players can be filtered to an age category as of a reference date."""
+        players = {
+            birth.year: self.factory(birth=birth)
+            for birth in [
+                datetime.date(2010, 12, 31),
+                datetime.date(2011, 1, 1),
+                datetime.date(2012, 6, 1),
+                datetime.date(1970, 1, 1),
+            ]
+        }
+        self.factory(birth=None)
+
+        def get_years(**params):
+            json = self.get(
+                f"/{self.resource_name}/",
+                data={
+                    "filter[rc_id__in]": ",".join(
+                        str(player.rc_id) for player in players.values()
+                    ),
+                    **{f"filter[{name}]": value for name, value in params.items()},
+                },
+                asserted_status=status.HTTP_200_OK,
+            ).json()
+            return sorted(
+                year
+                for year, player in players.items()
+                if str(player.pk) in [data["id"] for data in json["data"]]
+            )
+
+        # in 2024, those born in 2011 turn 13 and those born in 2012 turn 12
+        for age_category, expected in [
+            ("U11", []),
+            ("U13", [2012]),
+            ("U15", [2010, 2011, 2012]),
+            ("SEN", [1970]),
+            ("O30", [1970]),
+            ("O50", [1970]),
+        ]:
+            with self.subTest(age_category=age_category):
+                self.assertEqual(
+                    get_years(age_category=age_category, age_reference="2024-06-30"),
+                    expected,
+                )
+        # the reference date defaults to today
+        self.assertEqual(
+            get_years(age_category="O50"),
+            get_years(age_category="O50", age_reference=timezone.localdate()),
+        )
+
+    def test_sort(self):
+        """Players are sorted by the field, ties broken by id in its direction."""
+        self.factory.create_batch(size=2, rating=1000)
+        players = sorted(
+            self.factory._meta.model.objects.all(),
+            key=lambda player: (player.rating, player.pk),
+            reverse=True,
+        )
+        json = self.get(
+            f"/{self.resource_name}/",
+            data={"sort": "-rating"},
+            asserted_status=status.HTTP_200_OK,
+            asserted_schema=self.schema.get_matcher(many=True),
+        ).json()
+        self.assertEqual(
+            [data["id"] for data in json["data"]],
+            [str(player.pk) for player in players],
+        )
+
+    def test_active(self):
+        """The active route and filter only return the active players."""
+        self.factory._meta.model.objects.update(active=False)
+        expected = self.factory.create_batch(size=2, active=True)
+        for path, data in [
+            (f"/{self.resource_name}/active/", {}),
+            (f"/{self.resource_name}/", {"filter[active]": "true"}),
+        ]:
+            with self.subTest(path=path):
+                json = self.get(
+                    path,
+                    data=data,
+                    asserted_status=status.HTTP_200_OK,
+                    asserted_schema=self.schema.get_matcher(many=True),
+                ).json()
+                self.assertEqual(
+                    [data["id"] for data in json["data"]],
+                    [str(player.pk) for player in expected],
+                )
+
+    def test_sort_not_allowed(self):
+        """Only the whitelisted fields can be sorted on."""
+        self.get(
+            f"/{self.resource_name}/",
+            data={"sort": "email"},
+            asserted_status=status.HTTP_400_BAD_REQUEST,
+        )
+
 
 class UserTestCase(
     EndpointConfig,
@@ -47,3 +203,26 @@ class PrivilegedTestCase(
     JsonApiTestCase,
 ):
     """Test validation for privileged users."""
+
+
+class UpdateActiveTestCase(JsonApiTestCase):
+    """Ensure players are flagged active as of each import."""
+
+    def test_update_active(self):
+        """Living players who played within the window are flagged active."""
+        date = datetime.date(2021, 6, 1)
+        recent = date - datetime.timedelta(days=10)
+        players = {
+            (True, False): factories.PlayerFactory(last_played=recent),
+            (False, False): factories.PlayerFactory(
+                last_played=date - datetime.timedelta(days=400), active=True
+            ),
+            (False, True): factories.PlayerFactory(
+                last_played=recent, deceased=True, active=True
+            ),
+        }
+        models.Player.objects.update_active(date)
+        for (active, deceased), player in players.items():
+            with self.subTest(active=active, deceased=deceased):
+                player.refresh_from_db()
+                self.assertEqual(player.active, active)
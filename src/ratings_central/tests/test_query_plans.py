@@ -0,0 +1,282 @@
+"""Ensure the filters on the ratings_central endpoints are backed by indexes."""
+from itertools import combinations
+from typing import Dict, List
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import matching, models
+
+# a bulk lookup of a few hundred ids, as sent by tournament software
+BULK_IDS = ",".join(str(i) for i in range(1250, 1550))
+
+
+class QueryPlanTestCaseMixin:
+    """Check each filter is read from its index and no combination scans the table.
+
+    A large dataset is generated and analysed so the planner uses realistic
+    statistics. Each filter, each pair of filters and each of the larger
+    `client_combinations` is requested through the API and every query
+    issued for the page (excluding the paginator's COUNT) is EXPLAINed. The
+    filter values are chosen to match a single generated row, so
+    combinations which match nothing (and thus issue no page query) are kept
+    to a minimum.
+
+    Every combination of the player filters would be 2 ** 26 requests, so
+    combinations of more than `max_combination_size` filters are limited to
+    those the clients send.
+    """
+
+    dataset_size = 20000
+    max_combination_size = 2
+    resource_name: str
+    table_name: str
+    insert_sql: str
+    # the possible values of each filter, with the index their page is read
+    # from; the values matching many rows are read in primary key order
+    filter_values: Dict[str, Dict[str, str]]
+    # the combinations of more than max_combination_size filters clients send
+    client_combinations: List[Dict[str, str]] = []
+    # the sorts which are checked alone and with each filter
+    sort_values: List[str] = []
+
+    @classmethod
+    def setUpTestData(cls):  # pylint: disable=invalid-name
+        """Generate and analyse the large dataset."""
+        super().setUpTestData()  # type: ignore
+        with connection.cursor() as cursor:
+            cursor.execute(cls.insert_sql, {"size": cls.dataset_size})
+            cursor.execute(f'ANALYZE "{cls.table_name}"')
+
+    def get_filter_combinations(self):
+        """Return the combinations of filters and their values."""
+        names = list(self.filter_values)
+        for length in range(1, min(len(names), self.max_combination_size) + 1):
+            for combination in combinations(names, length):
+                params = [{}]
+                for name in combination:
+                    params = [
+                        {**param, f"filter[{name}]": value}
+                        for param in params
+                        for value in self.filter_values[name]
+                    ]
+                yield from params
+        for combination in self.client_combinations:
+            yield {f"filter[{name}]": value for name, value in combination.items()}
+
+    def get_sort_combinations(self):
+        """Return each sort alone and with each filter value."""
+        for sort in self.sort_values:
+            yield {"sort": sort}
+            for name, values in self.filter_values.items():
+                for value in values:
+                    yield {"sort": sort, f"filter[{name}]": value}
+
+    def get_plans(self, params, route=""):
+        """Return the query plans of the page queries for the given params."""
+        with CaptureQueriesContext(connection) as context:
+            self.get(  # type: ignore
+                f"/{self.resource_name}/{route}",
+                params,
+                asserted_status=status.HTTP_200_OK,
+            )
+        plans = []
+        with connection.cursor() as cursor:
+            for query in context.captured_queries:
+                sql = query["sql"]
+                if not sql.startswith("SELECT") or "COUNT(*)" in sql:
+                    continue
+                # the dataset versions looked up by the lists are not paged
+                if models.DatasetVersion._meta.db_table in sql:
+                    continue
+                cursor.execute(f"EXPLAIN {sql}")
+                plans.append((sql, "\n".join(row[0] for row in cursor.fetchall())))
+        return plans
+
+    def test_no_seq_scans(self):
+        """No combination of filters results in a sequential scan."""
+        for params in self.get_filter_combinations():
+            with self.subTest(params=params):
+                for sql, plan in self.get_plans(params):
+                    self.assertNotIn("Seq Scan", plan, f"\n{sql}\n{plan}")
+
+    def test_filter_indexes(self):
+        """Each filter value is read from its index."""
+        for name, indexes in self.filter_values.items():
+            for value, index in indexes.items():
+                params = {f"filter[{name}]": value}
+                with self.subTest(params=params):
+                    plans = self.get_plans(params)
+                    self.assertTrue(plans)
+                    for sql, plan in plans:
+                        self.assertIn(index, plan, f"\n{sql}\n{plan}")
+
+    def test_client_combinations(self):
+        """The client combinations match rows, so their page query is checked."""
+        for combination in self.client_combinations:
+            params = {f"filter[{name}]": value for name, value in combination.items()}
+            with self.subTest(params=params):
+                self.assertTrue(self.get_plans(params))
+
+    def test_sorts(self):
+        """Sorted pages are read in order from an index."""
+        for params in self.get_sort_combinations():
+            with self.subTest(params=params):
+                for sql, plan in self.get_plans(params):
+                    self.assertNotIn("Seq Scan", plan, f"\n{sql}\n{plan}")
+                    if len(params) == 1:
+                        self.assertNotIn("Sort Key", plan, f"\n{sql}\n{plan}")
+
+
+class PlayerQueryPlanTestCase(QueryPlanTestCaseMixin, BaseTestCase):
+    """Check no player filter combination plans a sequential scan."""
+
+    resource_name = "players"
+    table_name = "ratings_central_player"
+    insert_sql = """
+        INSERT INTO ratings_central_player (
+            rc_id, rating, st_dev, last_played, rc_primary_club_id, name,
+            address_one, address_two, city, na_state, world_province,
+            postal_code, country, email, birth, birth_year, gender, sport,
+            usatt_id, tta_id, ittf_id, deceased, active
+        )
+        SELECT
+            i, i %% 3000, i %% 700, DATE '2020-01-01' - (i %% 3650),
+            i %% 500, 'Player ' || md5(i::text), '', '', 'Hobart', '', 'TAS',
+            '7000', 'AUS', 'player' || i || '@example.com',
+            DATE '1990-01-01' - (i %% 20000),
+            EXTRACT(YEAR FROM DATE '1990-01-01' - (i %% 20000)), 'F', 1, i, i, i,
+            i %% 50 = 0,
+            i %% 50 != 0 AND i %% 3650 < 365
+        FROM generate_series(1, %(size)s) AS i
+    """
+    filter_values = {
+        "rc_id": {"1250": "ratings_central_player_rc_id_6e829ac0"},
+        "rc_id__in": {BULK_IDS: "ratings_central_player_rc_id_6e829ac0"},
+        "email": {"player1250@example.com": "player_email_idx"},
+        "name": {"Player 81e5f81db77c596492e6f1a5a792ed53": "player_name_id_idx"},
+        "name__icontains": {"81e5f81db7": "player_name_upper_trgm_idx"},
+        "rating__gte": {"1500": "ratings_central_player_pkey"},
+        "rating__lte": {"1800": "ratings_central_player_pkey"},
+        "st_dev__gte": {"600": "ratings_central_player_pkey"},
+        "st_dev__lte": {"100": "ratings_central_player_pkey"},
+        "last_played__gte": {"2019-06-01": "ratings_central_player_pkey"},
+        "last_played__lte": {"2010-06-01": "ratings_central_player_pkey"},
+        "birth__gte": {"1989-01-01": "player_birth_idx"},
+        "birth__lte": {"1940-01-01": "ratings_central_player_pkey"},
+        "birth_year__gte": {"1989": "ratings_central_player_pkey"},
+        "birth_year__lte": {"1940": "ratings_central_player_pkey"},
+        "age_category": {"O30": "ratings_central_player_pkey"},
+        "age_reference": {"2026-01-01": "ratings_central_player_pkey"},
+        "deceased": {
+            "true": "player_deceased_id_idx",
+            "false": "ratings_central_player_pkey",
+        },
+        "active": {
+            "true": "player_active_id_idx",
+            "false": "ratings_central_player_pkey",
+        },
+        "usatt_id": {"1250": "player_usatt_id_idx"},
+        "usatt_id__in": {BULK_IDS: "player_usatt_id_idx"},
+        "tta_id": {"1250": "player_tta_id_idx"},
+        "tta_id__in": {BULK_IDS: "player_tta_id_idx"},
+        "ittf_id": {"1250": "player_ittf_id_idx"},
+        "ittf_id__in": {BULK_IDS: "player_ittf_id_idx"},
+    }
+    client_combinations = [
+        # the player search page
+        {
+            "name__icontains": "81e5f81db7",
+            "rating__gte": "1000",
+            "rating__lte": "2000",
+            "st_dev__lte": "600",
+        },
+        # the ranking pages of recently played, reliably rated players
+        {
+            "deceased": "false",
+            "active": "true",
+            "rating__gte": "1500",
+            "st_dev__lte": "100",
+            "last_played__gte": "2019-06-01",
+        },
+        # the entry lists of junior and veteran events
+        {
+            "age_category": "O40",
+            "age_reference": "2026-01-01",
+            "deceased": "false",
+            "active": "true",
+            "rating__gte": "1000",
+        },
+        {
+            "birth_year__gte": "1985",
+            "birth_year__lte": "1989",
+            "deceased": "false",
+            "rating__lte": "1800",
+        },
+        # the entry lists resolved by tournament software
+        {"rc_id__in": BULK_IDS, "deceased": "false", "rating__lte": "1800"},
+        {"usatt_id__in": BULK_IDS, "deceased": "false", "rating__gte": "1500"},
+        {"ittf_id__in": BULK_IDS, "tta_id__in": BULK_IDS, "deceased": "false"},
+    ]
+    sort_values = ["rating", "-rating", "st_dev", "-last_played", "name"]
+
+    def test_active_route(self):
+        """The active players are read from the partial indexes."""
+        for params in [{}, {"sort": "-rating"}, {"sort": "name"}]:
+            with self.subTest(params=params):
+                for sql, plan in self.get_plans(params, route="active/"):
+                    self.assertIn("player_active_", plan, f"\n{sql}\n{plan}")
+                    self.assertNotIn("Sort Key", plan, f"\n{sql}\n{plan}")
+
+    def test_name_matching(self):
+        """The names are matched from the trigram and phonetic key indexes."""
+        names = ["Player 81e5f81db77c596492e6f1a5a792ed53", "Plaier 81e5f81db77c"]
+        with CaptureQueriesContext(connection) as context:
+            matching.match_players([{"name": name} for name in names], 5)
+        (query,) = context.captured_queries
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {query['sql']}")
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        self.assertNotIn("Seq Scan", plan, f"\n{plan}")
+        self.assertIn("player_name_upper_trgm_idx", plan, f"\n{plan}")
+        self.assertIn("player_name_keys_idx", plan, f"\n{plan}")
+
+    def test_living_by_rating(self):
+        """The living players sorted by rating are read in order from an index."""
+        params = {"filter[deceased]": "false", "sort": "-rating"}
+        for sql, plan in self.get_plans(params):
+            # few players are deceased, so they are skipped in the rating index
+            self.assertIn("player_rating_id_idx", plan, f"\n{sql}\n{plan}")
+            self.assertNotIn("Sort Key", plan, f"\n{sql}\n{plan}")
+
+
+class ClubQueryPlanTestCase(QueryPlanTestCaseMixin, BaseTestCase):
+    """Check no club filter combination plans a sequential scan."""
+
+    resource_name = "clubs"
+    table_name = "ratings_central_club"
+    insert_sql = """
+        INSERT INTO ratings_central_club (
+            rc_id, name, nickname, address_one, address_two, city, na_state,
+            world_province, postal_code, country, email, website, phone, sport,
+            status
+        )
+        SELECT
+            i, 'Club ' || md5(i::text), '', '', '', 'Hobart', '', 'TAS',
+            '7000', 'AUS', 'club' || i || '@example.com', '', '', 1,
+            CASE WHEN i %% 10 = 0 THEN 'Inactive' ELSE 'Active' END
+        FROM generate_series(1, %(size)s) AS i
+    """
+    filter_values = {
+        "rc_id": {"1250": "ratings_central_club_rc_id_6dd90702"},
+        "rc_id__in": {BULK_IDS: "ratings_central_club_rc_id_6dd90702"},
+        "email": {"club1250@example.com": "club_email_idx"},
+        "name": {"Club 81e5f81db77c596492e6f1a5a792ed53": "club_name_idx"},
+        "name__icontains": {"81e5f81db7": "club_name_upper_trgm_idx"},
+        "status": {
+            "Active": "ratings_central_club_pkey",
+            "Inactive": "ratings_central_club_pkey",
+        },
+    }
@@ -0,0 +1,164 @@
+"""Ensure the leaderboards are computed after each import."""
+import datetime
+
+from django.utils import timezone
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import enums, importer, leaderboards, models
+from ratings_central.tests import factories, utils
+
+
+class RankingsTestCase(BaseTestCase):
+    """Ensure players are ranked in each leaderboard."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the imported dataset and compute its rankings."""
+        super().setUpTestData()
+        cls.alice = factories.PlayerFactory(
+            rating=2000, country="AUS", gender="F", birth=datetime.date(2010, 5, 1)
+        )
+        cls.bella = factories.PlayerFactory(
+            rating=1800, country="NZL", gender="F", birth=datetime.date(1990, 1, 1)
+        )
+        cls.carol = factories.PlayerFactory(
+            rating=1800, country="AUS", gender="F", birth=None
+        )
+        cls.david = factories.PlayerFactory(
+            rating=1500, country="AUS", gender="M", birth=datetime.date(2010, 1, 1)
+        )
+        factories.PlayerFactory(rating=2500, deceased=True)
+        factories.PlayerFactory(rating=2500, sport=enums.Sport.HARDBAT)
+        dataset_version = models.DatasetVersion.objects.create(
+            completed=timezone.make_aware(datetime.datetime(2021, 6, 1))
+        )
+        cls.count = leaderboards.compute_rankings(dataset_version)
+
+    def get_leaderboard(self, **filters):
+        """Return the players' ids, ranks and percentiles of a leaderboard."""
+        params = {
+            "filter[sport]": enums.Sport.TABLE_TENNIS,
+            **{f"filter[{name}]": value for name, value in filters.items()},
+        }
+        json_data = self.get(
+            "/rankings/", params, asserted_status=status.HTTP_200_OK
+        ).json()
+        return [
+            (
+                int(data["relationships"]["player"]["data"]["id"]),
+                data["attributes"]["rank"],
+                data["attributes"]["percentile"],
+            )
+            for data in json_data["data"]
+        ]
+
+    def test_overall(self):
+        """Living players are ranked by rating, ties sharing their rank."""
+        self.assertEqual(
+            self.get_leaderboard(),
+            [
+                (self.alice.pk, 1, 100.0),
+                (self.bella.pk, 2, 100 * (1 / 3)),
+                (self.carol.pk, 2, 100 * (1 / 3)),
+                (self.david.pk, 4, 0.0),
+            ],
+        )
+
+    def test_scopes(self):
+        """Players are ranked within their country, gender and age category."""
+        self.assertEqual(
+            self.get_leaderboard(country="AUS"),
+            [
+                (self.alice.pk, 1, 100.0),
+                (self.carol.pk, 2, 50.0),
+                (self.david.pk, 3, 0.0),
+            ],
+        )
+        self.assertEqual(
+            self.get_leaderboard(country="AUS", gender="F"),
+            [(self.alice.pk, 1, 100.0), (self.carol.pk, 2, 0.0)],
+        )
+        # players without a birth date are left out of age categories
+        self.assertEqual(
+            self.get_leaderboard(age_category=enums.AgeCategory.U13),
+            [(self.alice.pk, 1, 100.0), (self.david.pk, 2, 0.0)],
+        )
+        # the players are ranked in every category covering their age
+        self.assertEqual(
+            self.get_leaderboard(age_category=enums.AgeCategory.U21),
+            [(self.alice.pk, 1, 100.0), (self.david.pk, 2, 0.0)],
+        )
+        self.assertEqual(self.get_leaderboard(age_category=enums.AgeCategory.U11), [])
+        self.assertEqual(
+            self.get_leaderboard(age_category=enums.AgeCategory.O30),
+            [(self.bella.pk, 1, 0.0)],
+        )
+        self.assertEqual(
+            self.get_leaderboard(age_category=enums.AgeCategory.SENIOR),
+            [(self.bella.pk, 1, 0.0)],
+        )
+        self.assertEqual(self.get_leaderboard(gender="M", country="NZL"), [])
+        # five living players in each scope, the four with a birth date in
+        # four, four, two and two age categories
+        self.assertEqual(self.count, 4 * 5 + 4 * 12)
+
+    def test_player(self):
+        """A player's rank in a leaderboard is looked up by their id."""
+        self.assertEqual(
+            self.get_leaderboard(player=self.david.pk, country="AUS"),
+            [(self.david.pk, 3, 0.0)],
+        )
+
+    def test_include_player(self):
+        """The ranked players can be included."""
+        json_data = self.get(
+            "/rankings/",
+            {"filter[country]": "NZL", "include": "player"},
+            asserted_status=status.HTTP_200_OK,
+        ).json()
+        self.assertEqual(
+            [data["attributes"]["name"] for data in json_data["included"]],
+            [self.bella.name],
+        )
+
+    def test_recompute(self):
+        """Computing the rankings again replaces them."""
+        models.Player.objects.filter(pk=self.david.pk).update(rating=2100)
+        # in the same reference year, the age categories being the same
+        dataset_version = models.DatasetVersion.objects.create(
+            completed=timezone.make_aware(datetime.datetime(2021, 12, 1))
+        )
+        leaderboards.compute_rankings(dataset_version)
+        self.assertEqual(self.get_leaderboard()[0], (self.david.pk, 1, 100.0))
+        self.assertEqual(models.Ranking.objects.count(), self.count)
+
+    def test_import_completed(self):  # pylint: disable=no-self-use
+        """Completing an import computes its rankings."""
+        with utils.mock_import() as apply_asyncs:
+            importer.import_zipped_list(models.Director(rc_id=1))
+        dataset_version = models.DatasetVersion.objects.latest("pk")
+        apply_asyncs["compute_rankings"].assert_called_once_with([dataset_version.pk])
+
+    def test_age_ranges(self):
+        """The under categories are open ended below and the others above."""
+        self.assertEqual(leaderboards.get_range_birth_years("U15", 2021), (2007, None))
+        self.assertEqual(leaderboards.get_range_birth_years("SEN", 2021), (None, 2000))
+        self.assertEqual(leaderboards.get_range_birth_years("O40", 2021), (None, 1981))
+
+    def test_players_filter(self):
+        """The players filtered by an age category are those ranked in it."""
+        json_data = self.get(
+            "/players/",
+            {"filter[age_category]": "U15", "filter[age_reference]": "2021-06-30"},
+            asserted_status=status.HTTP_200_OK,
+        ).json()
+        self.assertCountEqual(
+            [int(data["id"]) for data in json_data["data"]],
+            [
+                player_pk
+                for player_pk, _, _ in self.get_leaderboard(
+                    age_category=enums.AgeCategory.U15
+                )
+            ],
+        )
@@ -0,0 +1,99 @@
+"""Ensure list pages are read from a single dataset version."""
+import datetime
+
+from django.db import connection
+from django.utils import timezone
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import importer, models, retention
+from ratings_central.tests import factories, utils
+
+
+class RetentionTestCase(BaseTestCase):
+    """Ensure clients keep paging through the version they started on."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Import a version, then change the lists as the next import would."""
+        super().setUpTestData()
+        cls.players = factories.PlayerFactory.create_batch(size=3, rating=1500)
+        cls.previous = models.DatasetVersion.objects.create(completed=timezone.now())
+        retention.retain(cls.previous)
+        models.Player.objects.filter(pk=cls.players[0].pk).update(rating=2000)
+        cls.created = factories.PlayerFactory()
+        cls.latest = models.DatasetVersion.objects.create(completed=timezone.now())
+        retention.extend(cls.latest.completed)
+
+    def get_page(self, params, asserted_status=status.HTTP_200_OK):
+        """Return the first page of players."""
+        return self.get(
+            "/players/", {"page[size]": 2, **params}, asserted_status=asserted_status
+        ).json()
+
+    def test_latest(self):
+        """The pages read the latest version and link to it."""
+        json_data = self.get_page({})
+        self.assertEqual(json_data["meta"]["dataset_version"], self.latest.pk)
+        self.assertIn(f"page%5Bversion%5D={self.latest.pk}", json_data["links"]["next"])
+        self.assertEqual(json_data["data"][0]["attributes"]["rating"], 2000)
+
+    def test_retained(self):
+        """The pages of the retained version are read from its copies."""
+        json_data = self.get_page({"page[version]": self.previous.pk, "page[size]": 10})
+        self.assertEqual(json_data["meta"]["dataset_version"], self.previous.pk)
+        self.assertEqual(
+            [(data["id"], data["attributes"]["rating"]) for data in json_data["data"]],
+            [(str(player.pk), 1500) for player in self.players],
+        )
+        json_data = self.get(
+            "/players/active/", {"page[version]": self.previous.pk}
+        ).json()
+        self.assertEqual(json_data["meta"]["dataset_version"], self.previous.pk)
+
+    def test_expired(self):
+        """The pages of an expired version cannot be read."""
+        models.DatasetVersion.objects.filter(pk=self.previous.pk).update(
+            retained_until=timezone.now() - datetime.timedelta(seconds=1)
+        )
+        self.get_page(
+            {"page[version]": self.previous.pk},
+            asserted_status=status.HTTP_410_GONE,
+        )
+        self.get_page(
+            {"page[version]": "abc"}, asserted_status=status.HTTP_400_BAD_REQUEST
+        )
+
+    def test_import_retains(self):
+        """Imports retain the lists of the previous version."""
+        with utils.mock_import():
+            importer.import_zipped_list(models.Director(rc_id=1))
+        dataset_version = models.DatasetVersion.objects.latest("pk")
+        self.assertEqual(
+            models.RetainedPlayer.objects.count(), models.Player.objects.count()
+        )
+        self.latest.refresh_from_db()
+        self.assertEqual(
+            self.latest.retained_until, retention.get_expiry(dataset_version.completed)
+        )
+        self.assertEqual(retention.get_versions(), (dataset_version.pk, self.latest.pk))
+
+    def test_copies(self):
+        """The copies only have the retained models' indexes and current rows."""
+        models.Player.objects.filter(pk=self.players[1].pk).update(
+            removed_in=self.latest
+        )
+        retention.retain(self.latest)
+        for _, retained in retention.RETAINED_MODELS:
+            with self.subTest(retained=retained):
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT indexname FROM pg_indexes WHERE tablename = %s",
+                        [retained._meta.db_table],
+                    )
+                    indexes = {row[0] for row in cursor.fetchall()}
+                self.assertEqual(indexes, set(retention.get_index_names(retained)))
+        self.assertEqual(
+            set(models.RetainedPlayer.objects.values_list("pk", flat=True)),
+            {self.players[0].pk, self.players[2].pk, self.created.pk},
+        )
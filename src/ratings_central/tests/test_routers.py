@@ -0,0 +1,118 @@
+"""Ensure the ratings reads are routed to the caught up read replicas."""
+from unittest import mock
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import importer, models, routers
+from ratings_central.tests import factories, utils
+from users.models import User
+
+
+@override_settings(
+    DATABASE_REPLICAS=["replica0", "replica1"], REPLICA_CHECK_INTERVAL=60
+)
+class ReplicaRouterTestCase(BaseTestCase):
+    """Ensure only the replicas holding the latest dataset version are read."""
+
+    def setUp(self):
+        """Forget the replicas checked by the other tests."""
+        super().setUp()
+        routers.invalidate_replicas()
+        self.addCleanup(routers.invalidate_replicas)
+        self.router = routers.ReplicaRouter()
+
+    @staticmethod
+    def patch_versions(versions):
+        """Return a patch of the dataset version of each database."""
+
+        def get_dataset_version(alias):
+            version = versions[alias]
+            if isinstance(version, Exception):
+                raise version
+            return version
+
+        return mock.patch.object(
+            routers, "get_dataset_version", side_effect=get_dataset_version
+        )
+
+    def test_route(self):
+        """Inside replica_reads, the ratings reads go to a caught up replica."""
+        versions = {DEFAULT_DB_ALIAS: 2, "replica0": 1, "replica1": 2}
+        with self.patch_versions(versions):
+            with routers.replica_reads() as alias:
+                self.assertEqual(alias, "replica1")
+                self.assertEqual(self.router.db_for_read(models.Player), "replica1")
+                self.assertIsNone(self.router.db_for_read(User))
+            self.assertIsNone(self.router.db_for_read(models.Player))
+        self.assertEqual(self.router.db_for_write(models.Player), DEFAULT_DB_ALIAS)
+        self.assertFalse(self.router.allow_migrate("replica0", "ratings_central"))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, "users"))
+
+    def test_lag(self):
+        """The primary is read until a replica catches up, checked per interval."""
+        versions = {DEFAULT_DB_ALIAS: 2, "replica0": 1, "replica1": DatabaseError()}
+        with self.patch_versions(versions) as get_dataset_version:
+            self.assertEqual(routers.get_read_database(), DEFAULT_DB_ALIAS)
+            versions["replica0"] = 2
+            # the replicas are not checked again within the interval
+            self.assertEqual(routers.get_read_database(), DEFAULT_DB_ALIAS)
+            self.assertEqual(get_dataset_version.call_count, 3)
+            with mock.patch.object(routers.time, "monotonic", return_value=1e12):
+                self.assertEqual(routers.get_read_database(), "replica0")
+
+    def test_newer_version(self):
+        """A version newer than the replicas were checked against reads the primary."""
+        versions = {DEFAULT_DB_ALIAS: 2, "replica0": 2, "replica1": 1}
+        with self.patch_versions(versions) as get_dataset_version:
+            self.assertEqual(routers.get_read_database(2), "replica0")
+            # e.g. the next page of a first one read after an import completed
+            self.assertEqual(routers.get_read_database(3), DEFAULT_DB_ALIAS)
+            self.assertEqual(get_dataset_version.call_count, 3)
+            versions.update({DEFAULT_DB_ALIAS: 3, "replica0": 3})
+            with mock.patch.object(routers.time, "monotonic", return_value=1e12):
+                self.assertEqual(routers.get_read_database(3), "replica0")
+
+    def test_import_completed(self):
+        """Completing an import checks the replicas again before their next read."""
+        versions = {DEFAULT_DB_ALIAS: 2, "replica0": 2, "replica1": 1}
+        with self.patch_versions(versions) as get_dataset_version:
+            self.assertEqual(routers.get_read_database(), "replica0")
+            versions[DEFAULT_DB_ALIAS] = 3
+            with utils.mock_import():
+                importer.import_zipped_list(models.Director(rc_id=1))
+            self.assertEqual(routers.get_read_database(), DEFAULT_DB_ALIAS)
+            self.assertEqual(get_dataset_version.call_count, 6)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas(self):
+        """Without replicas, the versions are never checked."""
+        with self.patch_versions({}) as get_dataset_version:
+            self.assertEqual(routers.get_read_database(), DEFAULT_DB_ALIAS)
+        get_dataset_version.assert_not_called()
+
+    def test_views(self):
+        """Only the safe requests of the ratings views are read from a replica."""
+        player = factories.PlayerFactory()
+        with mock.patch.object(
+            routers, "get_read_database", return_value=DEFAULT_DB_ALIAS
+        ) as get_read_database:
+            self.get(f"/players/{player.pk}/", asserted_status=status.HTTP_200_OK)
+            self.get("/clubs/", asserted_status=status.HTTP_200_OK)
+            self.assertEqual(get_read_database.call_count, 2)
+            get_read_database.assert_called_with(None)
+            self.post("/players/", {}, asserted_status=status.HTTP_401_UNAUTHORIZED)
+            self.assertEqual(get_read_database.call_count, 2)
+            # the following pages are read from a database holding their version
+            dataset_version = models.DatasetVersion.objects.create(
+                completed=timezone.now()
+            )
+            self.get(
+                "/clubs/",
+                {"page[version]": dataset_version.pk},
+                asserted_status=status.HTTP_200_OK,
+            )
+            get_read_database.assert_called_with(dataset_version.pk)
@@ -0,0 +1,253 @@
+"""Ensure the static snapshots are published after each import."""
+import csv
+import gzip
+import io
+import json
+import os
+import sqlite3
+from unittest import mock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.core.files.storage import FileSystemStorage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import bundles, importer, manifests, models, serializers, snapshots
+from ratings_central.tests import factories, utils
+
+
+class SnapshotsTestCase(BaseTestCase):
+    """Ensure the snapshots hold every player and club."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the imported dataset."""
+        super().setUpTestData()
+        factories.PlayerFactory.create_batch(size=3)
+        factories.PlayerFactory(name="Zoë Ćwikła", birth=None)
+        factories.ClubFactory.create_batch(size=2)
+        cls.dataset_version = models.DatasetVersion.objects.create(
+            completed=timezone.now()
+        )
+
+    def setUp(self):
+        """Publish to a temporary directory."""
+        super().setUp()
+        self.storage = FileSystemStorage(
+            self.get_temporary_directory(), base_url="/snapshots/"
+        )
+        patcher = mock.patch.object(snapshots, "get_storage", return_value=self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read(self, manifest, resource, file_format):
+        """Return the decompressed content of a published file."""
+        (file,) = [
+            file
+            for file in manifest["files"]
+            if file["resource"] == resource and file["format"] == file_format
+        ]
+        with self.storage.open(file["key"]) as fyl:
+            return file, gzip.decompress(fyl.read()).decode()
+
+    def test_publish(self):
+        """The snapshots hold the same resources as the lists."""
+        manifest = manifests.publish_snapshots(self.dataset_version)
+        for resource in ["players", "clubs"]:
+            with self.subTest(resource=resource):
+                expected = self.get(
+                    f"/{resource}/", asserted_status=status.HTTP_200_OK
+                ).json()["data"]
+                file, content = self.read(manifest, resource, "json")
+                self.assertTrue(
+                    file["key"].startswith(f"snapshots/{self.dataset_version.pk}/")
+                )
+                self.assertEqual(file["count"], len(expected))
+                self.assertEqual(
+                    json.loads(content),
+                    {
+                        "data": expected,
+                        "meta": {"dataset_version": self.dataset_version.pk},
+                    },
+                )
+                file, content = self.read(manifest, resource, "csv")
+                self.assertEqual(file["count"], len(expected))
+                rows = list(csv.DictReader(io.StringIO(content)))
+                self.assertEqual(
+                    [row["id"] for row in rows], [data["id"] for data in expected]
+                )
+        self.dataset_version.refresh_from_db()
+        self.assertEqual(self.dataset_version.manifest, manifest)
+        key = f"snapshots/{self.dataset_version.pk}/manifest.json"
+        with self.storage.open(key) as fyl:
+            self.assertEqual(json.load(fyl), manifest)
+
+    def test_not_completed(self):
+        """Only the snapshots of completed imports are published."""
+        dataset_version = models.DatasetVersion.objects.create()
+        with self.assertRaises(ValueError):
+            manifests.publish_snapshots(dataset_version)
+        self.assertEqual(self.storage.listdir("")[1], [])
+
+    def test_single_read(self):
+        """The JSON:API and CSV snapshots are written from one read of the rows."""
+        with mock.patch.object(snapshots, "CHUNK_SIZE", 2):
+            with CaptureQueriesContext(connection) as context:
+                files = snapshots.publish_list(
+                    self.storage, self.dataset_version, serializers.PlayerSerializer
+                )
+        table = models.Player._meta.db_table
+        self.assertEqual(len([query for query in context if table in query["sql"]]), 1)
+        manifest = {"files": files}
+        _, content = self.read(manifest, "players", "json")
+        expected = [
+            [resource["id"], *resource["attributes"].values()]
+            for resource in json.loads(content)["data"]
+        ]
+        _, content = self.read(manifest, "players", "csv")
+        rows = list(csv.reader(io.StringIO(content)))
+        self.assertEqual(len(expected), 4)
+        self.assertEqual(rows[0][0], "id")
+        self.assertEqual([row[0] for row in rows[1:]], [row[0] for row in expected])
+
+    def test_parquet(self):
+        """The Parquet files hold the lists' typed values."""
+        manifest = manifests.publish_snapshots(self.dataset_version)
+        for resource in ["players", "clubs"]:
+            with self.subTest(resource=resource):
+                expected = self.get(
+                    f"/{resource}/", asserted_status=status.HTTP_200_OK
+                ).json()["data"]
+                (file,) = [
+                    file
+                    for file in manifest["files"]
+                    if file["resource"] == resource and file["format"] == "parquet"
+                ]
+                self.assertEqual(
+                    file["key"],
+                    f"snapshots/{self.dataset_version.pk}/{resource}.parquet",
+                )
+                self.assertEqual(file["count"], len(expected))
+                with self.storage.open(file["key"]) as fyl:
+                    table = pq.read_table(fyl)
+                self.assertEqual(table.schema.names, ["id", *expected[0]["attributes"]])
+                for name in ["country", "status" if resource == "clubs" else "gender"]:
+                    self.assertTrue(
+                        pa.types.is_dictionary(table.schema.field(name).type)
+                    )
+                columns = table.to_pydict()
+                records = [
+                    {
+                        name: value.isoformat()
+                        if hasattr(value, "isoformat")
+                        else value
+                        for name, value in zip(columns, values)
+                    }
+                    for values in zip(*columns.values())
+                ]
+                self.assertEqual(
+                    records,
+                    [
+                        {"id": int(data["id"]), **data["attributes"]}
+                        for data in expected
+                    ],
+                )
+        with self.storage.open(
+            f"snapshots/{self.dataset_version.pk}/players.parquet"
+        ) as fyl:
+            schema = pq.read_schema(fyl)
+        self.assertEqual(schema.field("birth").type, pa.date32())
+        self.assertTrue(schema.field("birth").nullable)
+        self.assertEqual(schema.field("rating").type, pa.int32())
+        self.assertEqual(schema.field("sport").type, pa.int32())
+        self.assertEqual(schema.field("deceased").type, pa.bool_())
+
+    def test_bundle(self):
+        """The SQLite bundle holds the lists' rows and searches their names."""
+        manifest = manifests.publish_snapshots(self.dataset_version)
+        (file,) = [file for file in manifest["files"] if file["format"] == "sqlite"]
+        self.assertEqual(
+            file["key"], f"snapshots/{self.dataset_version.pk}/{bundles.FILE_NAME}"
+        )
+        path = os.path.join(self.get_temporary_directory(), "ratings.sqlite3")
+        with self.storage.open(file["key"]) as fyl, open(path, "wb") as bundle:
+            bundle.write(gzip.decompress(fyl.read()))
+        database = sqlite3.connect(path)
+        self.addCleanup(database.close)
+        database.row_factory = sqlite3.Row
+        self.assertEqual(
+            database.execute("PRAGMA user_version").fetchone()[0],
+            bundles.FORMAT_VERSION,
+        )
+        self.assertEqual(
+            dict(database.execute("SELECT key, value FROM meta").fetchall()),
+            {
+                "dataset_version": str(self.dataset_version.pk),
+                "completed": self.dataset_version.completed.isoformat(),
+            },
+        )
+        for resource in ["players", "clubs"]:
+            with self.subTest(resource=resource):
+                expected = self.get(
+                    f"/{resource}/", asserted_status=status.HTTP_200_OK
+                ).json()["data"]
+                self.assertEqual(file["counts"][resource], len(expected))
+                rows = database.execute(
+                    f"SELECT * FROM {resource} ORDER BY id"
+                ).fetchall()
+                self.assertEqual(
+                    [dict(row) for row in rows],
+                    [
+                        {
+                            "id": int(data["id"]),
+                            **{
+                                name: int(value) if isinstance(value, bool) else value
+                                for name, value in data["attributes"].items()
+                            },
+                        }
+                        for data in expected
+                    ],
+                )
+        player = models.Player.objects.get(name="Zoë Ćwikła")
+        self.assertEqual(
+            database.execute(
+                "SELECT rowid FROM players_search WHERE players_search MATCH ?",
+                ["zoe*"],
+            ).fetchone()["rowid"],
+            player.pk,
+        )
+        (plan,) = [
+            row["detail"]
+            for row in database.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM players WHERE rc_id = 1"
+            )
+        ]
+        self.assertIn("players_rc_id_idx", plan)
+
+    def test_latest(self):
+        """The latest manifest is served with the url of each file."""
+        self.get("/dataset-versions/latest/", asserted_status=status.HTTP_404_NOT_FOUND)
+        manifest = manifests.publish_snapshots(self.dataset_version)
+        json_data = self.get(
+            "/dataset-versions/latest/", asserted_status=status.HTTP_200_OK
+        ).json()
+        self.assertEqual(json_data["data"]["id"], str(self.dataset_version.pk))
+        self.assertEqual(
+            json_data["data"]["attributes"]["manifest"]["files"],
+            [
+                {**file, "url": f"/snapshots/{file['key']}"}
+                for file in manifest["files"]
+            ],
+        )
+
+    def test_import_completed(self):
+        """Completing an import publishes its snapshots."""
+        with utils.mock_import() as apply_asyncs:
+            importer.import_zipped_list(models.Director(rc_id=1))
+        dataset_version = models.DatasetVersion.objects.latest("pk")
+        self.assertIsNotNone(dataset_version.completed)
+        apply_asyncs["publish_snapshots"].assert_called_once_with([dataset_version.pk])
@@ -0,0 +1,87 @@
+"""Ensure sparse fieldsets only select the requested columns."""
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import models, views
+from ratings_central.tests import factories
+
+
+class SparseColumnsTestCaseMixin:
+    """Check the columns selected for sparse fieldsets."""
+
+    resource_name: str
+    view_class: type
+    factory: type
+    fieldset: list
+    left_out: list
+
+    @classmethod
+    def setUpTestData(cls):  # pylint: disable=invalid-name
+        """Create the instance to read."""
+        super().setUpTestData()  # type: ignore
+        cls.instance = cls.factory()
+
+    def get_select(self, path, fast_read):
+        """Return the SQL selecting the rows and the response's attributes."""
+        params = {f"fields[{self.resource_name}]": ",".join(self.fieldset)}
+        with mock.patch.object(self.view_class, "fast_read", fast_read):
+            with CaptureQueriesContext(connection) as context:
+                response = self.get(  # type: ignore
+                    path, params, asserted_status=status.HTTP_200_OK
+                )
+        # the lists also look the dataset versions up
+        selects = [
+            query["sql"]
+            for query in context.captured_queries
+            if query["sql"].startswith("SELECT")
+            and "COUNT(*)" not in query["sql"]
+            and models.DatasetVersion._meta.db_table not in query["sql"]
+        ]
+        self.assertEqual(len(selects), 1)  # type: ignore
+        data = response.json()["data"]
+        return selects[0], data[0] if isinstance(data, list) else data
+
+    def test_columns(self):
+        """Only the requested columns and the primary key are selected."""
+        table = self.view_class.queryset.model._meta.db_table
+        paths = [
+            f"/{self.resource_name}/",
+            f"/{self.resource_name}/{self.instance.pk}/",
+        ]
+        for path in paths:
+            for fast_read in [True, False]:
+                with self.subTest(path=path, fast_read=fast_read):
+                    select, attributes = self.get_select(path, fast_read)
+                    self.assertIn(f'"{table}"."id"', select)  # type: ignore
+                    for column in self.fieldset:
+                        self.assertIn(f'"{table}"."{column}"', select)  # type: ignore
+                    for column in self.left_out:
+                        self.assertNotIn(column, select)  # type: ignore
+                    self.assertEqual(  # type: ignore
+                        attributes["attributes"],
+                        {name: getattr(self.instance, name) for name in self.fieldset},
+                    )
+
+
+class PlayerSparseColumnsTestCase(SparseColumnsTestCaseMixin, BaseTestCase):
+    """Check the columns selected for sparse player fieldsets."""
+
+    resource_name = "players"
+    view_class = views.PlayerView
+    factory = factories.PlayerFactory
+    fieldset = ["name", "rating"]
+    left_out = ["address_one", "email", "birth", "usatt_id"]
+
+
+class ClubSparseColumnsTestCase(SparseColumnsTestCaseMixin, BaseTestCase):
+    """Check the columns selected for sparse club fieldsets."""
+
+    resource_name = "clubs"
+    view_class = views.ClubView
+    factory = factories.ClubFactory
+    fieldset = ["name", "website"]
+    left_out = ["address_one", "email", "nickname", "status"]
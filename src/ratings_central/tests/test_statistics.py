@@ -0,0 +1,153 @@
+"""Ensure the statistics are computed after each import."""
+import datetime
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import enums, importer, models, statistics
+from ratings_central.tests import factories, utils
+
+
+class StatisticsTestCase(BaseTestCase):
+    """Ensure the statistics aggregate the living players."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the imported dataset and compute its statistics."""
+        super().setUpTestData()
+        today = datetime.date(2021, 6, 1)
+        factories.PlayerFactory(
+            rating=1450,
+            st_dev=25,
+            country="AUS",
+            rc_primary_club_id=1,
+            last_played=today - datetime.timedelta(days=10),
+        )
+        factories.PlayerFactory(
+            rating=1499,
+            st_dev=31,
+            country="AUS",
+            rc_primary_club_id=2,
+            last_played=today - datetime.timedelta(days=100),
+        )
+        factories.PlayerFactory(
+            rating=2010,
+            st_dev=39,
+            country="NZL",
+            rc_primary_club_id=1,
+            last_played=today - datetime.timedelta(days=1000),
+        )
+        factories.PlayerFactory(
+            rating=1000,
+            st_dev=200,
+            sport=enums.Sport.HARDBAT,
+            country="AUS",
+            rc_primary_club_id=1,
+            last_played=today,
+        )
+        factories.PlayerFactory(rating=3000, deceased=True)
+        cls.dataset_version = models.DatasetVersion.objects.create(
+            completed=timezone.make_aware(datetime.datetime(2021, 6, 1, 12))
+        )
+        statistics.compute_statistics(cls.dataset_version)
+
+    def test_statistics(self):
+        """The histograms and aggregates count the living players."""
+        json_data = self.get(
+            f"/statistics/{self.dataset_version.pk}/",
+            asserted_status=status.HTTP_200_OK,
+        ).json()
+        self.assertEqual(json_data["data"]["id"], str(self.dataset_version.pk))
+        attributes = json_data["data"]["attributes"]
+        table_tennis, hardbat = enums.Sport.TABLE_TENNIS, enums.Sport.HARDBAT
+        self.assertEqual(
+            attributes["ratings"],
+            [
+                {"sport": table_tennis, "minimum": 1400, "count": 2},
+                {"sport": table_tennis, "minimum": 2000, "count": 1},
+                {"sport": hardbat, "minimum": 1000, "count": 1},
+            ],
+        )
+        self.assertEqual(
+            attributes["st_devs"],
+            [
+                {"sport": table_tennis, "minimum": 20, "count": 1},
+                {"sport": table_tennis, "minimum": 30, "count": 2},
+                {"sport": hardbat, "minimum": 200, "count": 1},
+            ],
+        )
+        self.assertEqual(
+            attributes["activity"][0],
+            {
+                "sport": table_tennis,
+                "players": 3,
+                "windows": [
+                    {"days": 30, "count": 1},
+                    {"days": 90, "count": 1},
+                    {"days": 365, "count": 2},
+                    {"days": 730, "count": 2},
+                ],
+            },
+        )
+        self.assertEqual(
+            attributes["countries"][:2],
+            [
+                {
+                    "sport": table_tennis,
+                    "country": "AUS",
+                    "players": 2,
+                    "active": 2,
+                    "rating_mean": 1474.5,
+                    "rating_max": 1499,
+                },
+                {
+                    "sport": table_tennis,
+                    "country": "NZL",
+                    "players": 1,
+                    "active": 0,
+                    "rating_mean": 2010.0,
+                    "rating_max": 2010,
+                },
+            ],
+        )
+        self.assertEqual(
+            [
+                (row["sport"], row["club"], row["players"])
+                for row in attributes["clubs"]
+            ],
+            [(table_tennis, 1, 2), (table_tennis, 2, 1), (hardbat, 1, 1)],
+        )
+
+    def test_latest(self):
+        """The latest statistics are read with a single query."""
+        later = models.DatasetVersion.objects.create(completed=timezone.now())
+        statistics.compute_statistics(later)
+        with CaptureQueriesContext(connection) as context:
+            json_data = self.get(
+                "/statistics/latest/",
+                {"fields[statistics]": "activity"},
+                asserted_status=status.HTTP_200_OK,
+            ).json()
+        self.assertEqual(json_data["data"]["id"], str(later.pk))
+        self.assertEqual(list(json_data["data"]["attributes"]), ["activity"])
+        (query,) = [
+            query["sql"]
+            for query in context.captured_queries
+            if "ratings_central_statistics" in query["sql"]
+        ]
+        self.assertNotIn('"clubs"', query)
+
+    def test_latest_missing(self):
+        """There are no latest statistics before the first import."""
+        models.Statistics.objects.all().delete()
+        self.get("/statistics/latest/", asserted_status=status.HTTP_404_NOT_FOUND)
+
+    def test_import_completed(self):  # pylint: disable=no-self-use
+        """Completing an import computes its statistics."""
+        with utils.mock_import() as apply_asyncs:
+            importer.import_zipped_list(models.Director(rc_id=1))
+        dataset_version = models.DatasetVersion.objects.latest("pk")
+        apply_asyncs["compute_statistics"].assert_called_once_with([dataset_version.pk])
@@ -0,0 +1,32 @@
+"""Test utilities for the ratings_central app."""
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, Optional
+from unittest import mock
+
+from ratings_central import importer, tasks
+
+# the tasks queued once an import completes
+IMPORT_COMPLETED_TASKS = [
+    "publish_snapshots",
+    "compute_rankings",
+    "compute_statistics",
+    "write_player_map",
+    "write_name_maps",
+]
+
+
+@contextmanager
+def mock_import(
+    lists: Optional[Dict[str, str]] = None
+) -> Iterator[Dict[str, mock.Mock]]:
+    """Mock the downloaded lists and yield the mocked `apply_async` of each task."""
+    with ExitStack() as stack:
+        stack.enter_context(
+            mock.patch.object(importer, "download_rc_lists", return_value=lists or {})
+        )
+        yield {
+            name: stack.enter_context(
+                mock.patch.object(getattr(tasks, name), "apply_async")
+            )
+            for name in IMPORT_COMPLETED_TASKS
+        }
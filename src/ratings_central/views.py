@@ -1,22 +1,446 @@
 """Views for the ratings_central app."""
+from typing import Optional, Type
+
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+from django_filters.rest_framework import FilterSet
+from rest_framework import permissions, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException, NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 from rest_framework_json_api import views
 
-from ratings_central import filters, models, serializers
+from common.views import ExportMixin, FastReadMixin, SparseColumnsMixin
+from ratings_central import (
+    autocomplete,
+    filters,
+    matching,
+    models,
+    player_maps,
+    retention,
+    routers,
+    serializers,
+)
+from webapp import renderers
+
+
+class VersionExpired(APIException):
+    """The requested dataset version is no longer retained."""
+
+    status_code = status.HTTP_410_GONE
+    default_detail = "The dataset version expired, restart from the first page."
+    default_code = "version_expired"
+
+
+class RetainedVersionMixin:
+    """Page through the list of a single dataset version.
+
+    The meta of each page holds the dataset version it was read from and the
+    pagination links request it with `page[version]`. Pages of the version
+    retained while an import replaces it are read from the retained copies,
+    see ratings_central.retention.
+    """
+
+    retained_model: Optional[Type[Model]] = None
+    retained_filterset_class: Optional[Type[FilterSet]] = None
+    retained_actions = ["list"]
+    version_query_param = "page[version]"
+
+    def resolve_version(self):
+        """Resolve the dataset version to read and whether it is retained."""
+        latest, retained = retention.get_versions()
+        version = latest
+        requested = self.request.query_params.get(self.version_query_param)
+        if requested is not None:
+            try:
+                version = int(requested)
+            except ValueError as error:
+                raise ValidationError(
+                    f"{self.version_query_param} must be a dataset version id."
+                ) from error
+            if version not in [latest, retained]:
+                raise VersionExpired()
+        self._version = (version, version is not None and version == retained)
+
+    def is_retained(self):
+        """Return whether the request reads the retained copies.
+
+        The version is only resolved by `list`, so the other actions and the
+        schema generation read the live tables.
+        """
+        return getattr(self, "_version", (None, False))[1]
+
+    def list(self, request, *args, **kwargs):
+        """Resolve the dataset version before listing it."""
+        if self.action in self.retained_actions:
+            self.resolve_version()
+        return super().list(request, *args, **kwargs)
+
+    def get_filterset_class(self):
+        """Return the retained FilterSet when the version is retained."""
+        if self.is_retained():
+            return self.retained_filterset_class
+        return self.filterset_class
+
+    def get_queryset(self):
+        """Read the retained copy when the version is retained."""
+        if self.is_retained():
+            # the view's filters, e.g. the active route, apply to the copy
+            return self.retained_model.objects.all()
+        return super().get_queryset()
+
+    def get_paginated_response(self, data):
+        """Add the dataset version to the meta and pagination links."""
+        response = super().get_paginated_response(data)
+        if not hasattr(self, "_version"):
+            return response
+        version = self._version[0]
+        response.data["meta"]["dataset_version"] = version
+        if version is not None:
+            links = response.data.get("links") or {}
+            for name, url in links.items():
+                if url is not None:
+                    links[name] = replace_query_param(
+                        url, self.version_query_param, version
+                    )
+        return response
+
+
+class ChangesMixin:
+    """List the resources created or changed by the imports after a token.
+
+    The token is a dataset version id, e.g. the `dataset_version` of a
+    snapshot's manifest. `changes?filter[since]=<token>` pages through the
+    rows updated in later imports and the meta of its first page lists the ids
+    removed by them, along with the token to pass to the next sync.
+    """
+
+    # provided by GenericAPIView
+    request: Request
+
+    def get_since(self) -> int:
+        """Return the dataset version the changes are listed after."""
+        try:
+            return int(self.request.query_params["filter[since]"])
+        except (KeyError, ValueError) as error:
+            raise ValidationError(
+                "filter[since] must be a dataset version id."
+            ) from error
+
+    def get_paginated_response(self, data):
+        """Add the next token, and on the first page the removed ids, to the meta."""
+        response = super().get_paginated_response(data)
+        if self.action == "changes":
+            since = self.get_since()
+            latest = models.DatasetVersion.objects.completed().order_by("-pk").first()
+            response.data["meta"].update(
+                {
+                    "since": since,
+                    "token": since if latest is None else max(since, latest.pk),
+                }
+            )
+            if self.paginator.page.number != 1:
+                return response
+            # the rows restored by a later import are listed as changed instead
+            removed = (
+                models.Removal.objects.filter(
+                    resource=self.queryset.model.JSONAPIMeta.resource_name,
+                    dataset_version__gt=since,
+                )
+                .exclude(record_id__in=self.queryset.model.objects.values("pk"))
+                .order_by("record_id")
+            )
+            response.data["meta"]["removed"] = [
+                str(record_id)
+                for record_id in removed.values_list("record_id", flat=True)
+            ]
+        return response
+
+    @action(detail=False)
+    def changes(self, request, *args, **kwargs):
+        """List the resources created or changed after the token."""
+        self.get_since()
+        return self.list(request, *args, **kwargs)
+
+
+class AutocompleteMixin:
+    """Complete names from the memory-mapped name maps.
+
+    `autocomplete?filter[prefix]=<prefix>` lists the best scored resources
+    with a word of their name starting with the prefix. The database is only
+    read until the first name map is written, and then only completes prefixes
+    of at least MIN_MATCH_LENGTH characters, see ratings_central.autocomplete.
+    """
+
+    autocomplete_page_size = 10
+    # provided by GenericAPIView
+    request: Request
+
+    def get_autocomplete_page_size(self) -> int:
+        """Return the number of resources to list."""
+        try:
+            page_size = int(
+                self.request.query_params.get("page[size]", self.autocomplete_page_size)
+            )
+        except ValueError as error:
+            raise ValidationError("page[size] must be an integer.") from error
+        if not 1 <= page_size <= autocomplete.MAX_LIMIT:
+            raise ValidationError(
+                f"page[size] must be between 1 and {autocomplete.MAX_LIMIT}."
+            )
+        return page_size
+
+    @action(detail=False)
+    def autocomplete(self, request, *args, **kwargs):
+        """List the best scored resources whose name completes the prefix."""
+        prefix = request.query_params.get("filter[prefix]", "")
+        if not autocomplete.normalize(prefix):
+            raise ValidationError("filter[prefix] is required.")
+        page_size = self.get_autocomplete_page_size()
+        resource_name = self.queryset.model.JSONAPIMeta.resource_name
+        name_map = autocomplete.get_name_map(resource_name)
+        if name_map is None:
+            records = autocomplete.get_matches(resource_name, prefix, page_size)
+        else:
+            records = name_map.lookup(prefix, page_size)
+        score_name = autocomplete.SCORE_NAMES[resource_name]
+        data = [
+            {
+                "type": resource_name,
+                "id": str(primary_key),
+                "attributes": {"name": name, score_name: score},
+            }
+            for primary_key, name, score in records
+        ]
+        return renderers.DocumentResponse({"data": data})
+
+
+class ReplicaReadMixin:
+    """Read the safe requests from a caught up read replica.
+
+    See ratings_central.routers. The queryset is pinned to the replica too, so
+    the rows of streamed pages, read after dispatch returns, come from it.
+    """
+
+    read_database = DEFAULT_DB_ALIAS
 
+    def get_requested_version(self, request) -> Optional[int]:
+        """Return the dataset version the page links request, if any.
 
-class PlayerView(views.ReadOnlyModelViewSet):
+        See RetainedVersionMixin.
+        """
+        try:
+            return int(request.GET[getattr(self, "version_query_param", None)])
+        except (KeyError, ValueError):
+            return None
+
+    def dispatch(self, request, *args, **kwargs):
+        """Route the reads of safe requests to the replica."""
+        if request.method not in permissions.SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        version = self.get_requested_version(request)
+        with routers.replica_reads(version) as read_database:
+            self.read_database = read_database
+            return super().dispatch(request, *args, **kwargs)
+
+    def get_queryset(self):
+        """Read the queryset from the request's database."""
+        return super().get_queryset().using(self.read_database)
+
+
+class PlayerView(
+    ReplicaReadMixin,
+    AutocompleteMixin,
+    RetainedVersionMixin,
+    ChangesMixin,
+    ExportMixin,
+    FastReadMixin,
+    SparseColumnsMixin,
+    views.ReadOnlyModelViewSet,
+):
     """players endpoint."""
 
     queryset = models.Player.objects.all()
     serializer_class = serializers.PlayerSerializer
     filterset_class = filters.PlayerFilter
+    ordering_fields = ["rating", "st_dev", "last_played", "name"]
     ordering = ["pk"]
+    sparse_columns_actions = ["list", "retrieve", "active", "changes"]
+    retained_model = models.RetainedPlayer
+    retained_filterset_class = filters.RetainedPlayerFilter
+    retained_actions = ["list", "active"]
+    query_budget = 6
 
+    def get_queryset(self):
+        """Only list the active players on the active route."""
+        queryset = super().get_queryset()
+        if self.action == "active":
+            queryset = queryset.active()
+        return queryset
 
-class ClubView(views.ReadOnlyModelViewSet):
+    @action(detail=False)
+    def active(self, request, *args, **kwargs):
+        """List the living players who played recently."""
+        return self.list(request, *args, **kwargs)
+
+
+class ClubView(
+    ReplicaReadMixin,
+    AutocompleteMixin,
+    RetainedVersionMixin,
+    ChangesMixin,
+    ExportMixin,
+    FastReadMixin,
+    SparseColumnsMixin,
+    views.ReadOnlyModelViewSet,
+):
     """clubs endpoint."""
 
     queryset = models.Club.objects.all()
     serializer_class = serializers.ClubSerializer
     filterset_class = filters.ClubFilter
     ordering = ["pk"]
+    sparse_columns_actions = ["list", "retrieve", "changes"]
+    retained_model = models.RetainedClub
+    retained_filterset_class = filters.RetainedClubFilter
+    query_budget = 6
+
+
+class PlayerRatingView(viewsets.GenericViewSet):
+    """player-ratings endpoint.
+
+    Looks players up by `filter[rc_id]` or `filter[rc_id__in]`, reading the
+    memory-mapped player map when one was written and the database otherwise.
+    """
+
+    queryset = models.Player.objects.all()
+    serializer_class = serializers.PlayerRatingSerializer
+    # the rc_id filters are parsed by the view, whichever source is read
+    filter_backends: list = []
+    pagination_class = None
+    resource_name = "player-ratings"
+    max_rc_ids = 1000
+
+    def get_rc_ids(self):
+        """Return the rc_ids to look up."""
+        value = self.request.query_params.get(
+            "filter[rc_id__in]", self.request.query_params.get("filter[rc_id]")
+        )
+        if not value:
+            raise ValidationError("filter[rc_id] or filter[rc_id__in] is required.")
+        try:
+            rc_ids = {int(rc_id) for rc_id in value.split(",")}
+        except ValueError as error:
+            raise ValidationError("rc_ids must be integers.") from error
+        if len(rc_ids) > self.max_rc_ids:
+            raise ValidationError(f"At most {self.max_rc_ids} rc_ids can be looked up.")
+        return rc_ids
+
+    def list(self, request, *args, **kwargs):
+        """Return the players with the requested rc_ids."""
+        rc_ids = self.get_rc_ids()
+        player_map = player_maps.get_player_map()
+        if player_map is None:
+            rows = player_maps.get_rows(rc_ids)
+        else:
+            rows = player_map.lookup(rc_ids)
+        names = [name for name, _ in player_maps.COLUMNS if name != "pk"] + ["name"]
+        data = []
+        for rc_id, primary_key, *values in rows:
+            data.append(
+                {
+                    "type": self.resource_name,
+                    "id": str(primary_key),
+                    "attributes": dict(zip(names, [rc_id, *values])),
+                }
+            )
+        return renderers.DocumentResponse({"data": data})
+
+
+class PlayerMatchView(viewsets.GenericViewSet):
+    """player-matches endpoint.
+
+    Matches a batch of names to the best candidate players of each, in a
+    single query. Each batch is a costly query, so only authenticated users
+    can post names to match.
+    """
+
+    queryset = models.Player.objects.all()
+    serializer_class = serializers.PlayerMatchSerializer
+    filter_backends: list = []
+    pagination_class = None
+    resource_name = "player-matches"
+
+    def create(self, request, *args, **kwargs):
+        """Return the candidates of each name, best first."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        queries = serializer.validated_data["names"]
+        matches = matching.match_players(queries, serializer.validated_data["limit"])
+        data = []
+        for position, (query, candidates) in enumerate(zip(queries, matches)):
+            data.append(
+                {
+                    "type": self.resource_name,
+                    "id": str(position),
+                    "attributes": {
+                        **query,
+                        "candidates": [
+                            {**candidate, "id": str(candidate["id"])}
+                            for candidate in candidates
+                        ],
+                    },
+                }
+            )
+        return renderers.DocumentResponse({"data": data})
+
+
+class RankingView(views.ReadOnlyModelViewSet):
+    """rankings endpoint."""
+
+    queryset = models.Ranking.objects.all()
+    serializer_class = serializers.RankingSerializer
+    filterset_class = filters.RankingFilter
+    select_for_includes = {"player": ["player"]}
+    ordering = ["rank", "player"]
+
+
+class StatisticsView(SparseColumnsMixin, views.ReadOnlyModelViewSet):
+    """statistics endpoint.
+
+    The statistics are identified by their dataset version. Sparse fieldsets
+    only read the aggregates requested.
+    """
+
+    queryset = models.Statistics.objects.all()
+    serializer_class = serializers.StatisticsSerializer
+    sparse_columns_actions = ["list", "retrieve", "latest"]
+    ordering = ["-pk"]
+
+    @action(detail=False)
+    def latest(self, request, *args, **kwargs):
+        """Return the statistics of the latest dataset version."""
+        instance = self.get_queryset().order_by("-pk").first()
+        if instance is None:
+            raise NotFound()
+        return Response(self.get_serializer(instance).data)
+
+
+class DatasetVersionView(views.ReadOnlyModelViewSet):
+    """dataset-versions endpoint."""
+
+    queryset = models.DatasetVersion.objects.completed()
+    serializer_class = serializers.DatasetVersionSerializer
+    ordering = ["-pk"]
+
+    @action(detail=False)
+    def latest(self, request, *args, **kwargs):
+        """Return the latest dataset version with published snapshots."""
+        instance = (
+            self.get_queryset().filter(manifest__isnull=False).order_by("-pk").first()
+        )
+        if instance is None:
+            raise NotFound()
+        return Response(self.get_serializer(instance).data)
@@ -0,0 +1,28 @@
+# Generated by Django 2.2.22 on 2026-10-19 17:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="user",
+            options={
+                "permissions": [
+                    ("set_user_roles", "Can set user roles"),
+                    (
+                        "set_user_password",
+                        "Can set user passwords without knowing the current password",
+                    ),
+                    ("profile_requests", "Can profile API requests"),
+                ],
+                "verbose_name": "user",
+                "verbose_name_plural": "users",
+            },
+        ),
+    ]
@@ -53,6 +53,8 @@ class User(AbstractBaseUser, PermissionsMixin):
                 "set_user_password",
                 "Can set user passwords without knowing the current password",
             ),
+            # only granted to staff, see common.profiling
+            ("profile_requests", "Can profile API requests"),
         ]
 
     class JSONAPIMeta:
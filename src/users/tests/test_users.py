@@ -226,6 +226,28 @@ class PrivilegedTestCase(
             [data["id"] for data in json["data"]], [str(user.pk) for user in users]
         )
 
+    def test_list_roles(self):
+        """The roles of the listed users are read in a single query."""
+        user = User.objects.get(pk=self.instance.pk)
+        self.auth(user)
+        self.give_perms("retrieve")
+        # cache the permissions of the user, as the first request would
+        user.get_all_permissions()
+        group = Group.objects.get(name=settings.ADMINS_GROUP_NAME)
+        query_counts = []
+        for size in [1, 9]:
+            for other_user in self.factory.create_batch(size=size):
+                other_user.groups.add(group)
+            response = self.get(
+                f"/{self.resource_name}/",
+                {"filter[roles__in]": settings.ADMINS_GROUP_NAME},
+                asserted_status=status.HTTP_200_OK,
+            )
+            query_counts.append(response.query_count)
+        self.assertEqual(len(response.json()["data"]), 10)
+        # listing 10 users issues as many queries as listing 1
+        self.assertEqual(query_counts[0], query_counts[1])
+
     def test_delete(self):
         """Users with privileges cannot delete users."""
         user = User.objects.get(pk=self.instance.pk)
@@ -80,7 +80,8 @@ class UserView(
 ):
     """ViewSet for the users endpoint."""
 
-    queryset = models.User.objects.filter(is_superuser=False)
+    # the roles of each user are read from the prefetched groups
+    queryset = models.User.objects.filter(is_superuser=False).prefetch_related("groups")
     serializer_class = serializers.UserSerializer
     permission_classes = [IsAuthenticated]
     filterset_class = filters.UserFilter
@@ -88,6 +89,7 @@ class UserView(
     # schema containing invalid methods
     http_method_names = ["get", "post", "patch", "head", "options"]
     ordering = ["pk"]
+    query_budget = {"list": 6, "retrieve": 6}
 
     @sensitive_post_parameters_m
     def dispatch(self, request, *args, **kwargs):
@@ -0,0 +1,72 @@
+"""Management Command to compare the JSON:API renderers on an API list."""
+import timeit
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+from django.urls import resolve
+from rest_framework.test import APIRequestFactory
+from rest_framework_json_api import renderers as json_api_renderers
+
+from webapp import renderers
+
+RENDERER_CLASSES = [json_api_renderers.JSONRenderer, renderers.JSONRenderer]
+
+
+def get_response(path, params, fast_read):
+    """Return the response of the view at `path`, before rendering."""
+    match = resolve(path)
+    view_class = match.func.cls  # type: ignore
+    request = APIRequestFactory().get(path, params)
+    # render the whole page at once, as large pages are otherwise streamed
+    with mock.patch.multiple(
+        view_class, fast_read=fast_read, stream_page_size=None, create=True
+    ):
+        return match.func(request, *match.args, **match.kwargs)
+
+
+class Command(BaseCommand):
+    """Time rendering a response with the stock and project renderers."""
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        """Add the path, page size and repeat arguments."""
+        parser.add_argument("--path", default="/backend/api/v1/players/")
+        parser.add_argument("--page-size", type=int, default=1000)
+        parser.add_argument("--number", type=int, default=20)
+        parser.add_argument(
+            "--serializer",
+            action="store_true",
+            help="render the serializer's data rather than the fast read path's",
+        )
+
+    def handle(self, *args, **options):
+        """Render the response with each renderer and output the timings."""
+        response = get_response(
+            options["path"],
+            {"page[size]": options["page_size"]},
+            fast_read=not options["serializer"],
+        )
+        if isinstance(response, renderers.DocumentResponse):
+            # the stock renderer outputs the document as is without a resource name
+            response.renderer_context["view"].resource_name = False
+        contents = set()
+        for renderer_class in RENDERER_CLASSES:
+            renderer = renderer_class()
+            content = renderer.render(
+                response.data, renderer.media_type, response.renderer_context
+            )
+            contents.add(content)
+            seconds = timeit.timeit(
+                lambda renderer=renderer: renderer.render(
+                    response.data, renderer.media_type, response.renderer_context
+                ),
+                number=options["number"],
+            )
+            self.stdout.write(
+                f"{renderer_class.__module__}.{renderer_class.__name__}: "
+                f"{seconds / options['number'] * 1000:.2f}ms per render, "
+                f"{len(content)} bytes"
+            )
+        if len(contents) != 1:
+            self.stderr.write("The renderers output different content.")
@@ -1,4 +1,6 @@
 """Project-wide pagination classes."""
+from django.core.paginator import InvalidPage
+from rest_framework.exceptions import NotFound
 from rest_framework_json_api import pagination
 
 
@@ -6,3 +8,26 @@ class JsonApiPageNumberPagination(pagination.JsonApiPageNumberPagination):
     """Increase the max page size."""
 
     max_page_size = 10000
+
+    def paginate_queryset_lazily(self, queryset, request):
+        """Paginate like `paginate_queryset`, without evaluating the page.
+
+        The page's rows are returned as a sliced queryset, so they can be
+        iterated in chunks rather than loaded all at once.
+        """
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        paginator = self.django_paginator_class(queryset, page_size)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            )
+            raise NotFound(msg) from exc
+        # read by `get_paginated_response`, as `paginate_queryset` sets them
+        self.page = page  # pylint: disable=attribute-defined-outside-init
+        self.request = request  # pylint: disable=attribute-defined-outside-init
+        return self.page.object_list
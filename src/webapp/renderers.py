@@ -0,0 +1,239 @@
+"""Project-wide renderer classes."""
+import csv
+import io
+import math
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, List
+
+from django.utils import encoding
+from rest_framework import relations, renderers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework_json_api import renderers as json_api_renderers
+from rest_framework_json_api import utils
+from rest_framework_json_api.settings import json_api_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    # rendered with DRF's encoder instead, see ORJSONRenderer
+    orjson = None  # type: ignore
+
+
+# the types checked by identity first, which are most of the values
+_SCALARS = frozenset([str, int, bool, type(None)])
+
+
+def has_unmatched_floats(data) -> bool:
+    """Return whether the data holds floats orjson encodes unlike `json`.
+
+    orjson encodes NaN and infinities as null rather than raising, and
+    writes exponents differently (`1e16` rather than `1e+16`, `0.00001`
+    rather than `1e-05`). `json` only writes exponents outside [1e-4, 1e16).
+    """
+    # only the containers are stacked, the scalars are checked as they are met
+    stack: List[Any] = [(data,)]
+    while stack:
+        items = stack.pop()
+        for item in items.values() if isinstance(items, dict) else items:
+            if type(item) in _SCALARS:
+                continue
+            if isinstance(item, float):
+                if not math.isfinite(item) or (item and not 1e-4 <= abs(item) < 1e16):
+                    return True
+            elif isinstance(item, (dict, list, tuple)):
+                stack.append(item)
+    return False
+
+
+def can_use_orjson(data, indent, ensure_ascii, compact) -> bool:
+    """Return whether orjson renders the data as the stock renderer would."""
+    return (
+        data is not None
+        and indent is None
+        and not ensure_ascii
+        and compact
+        and not has_unmatched_floats(data)
+    )
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """Encode with orjson, falling back to DRF's encoder when unavailable.
+
+    orjson is only used for the compact, unicode output DRF produces by
+    default, so the content is the same as with the stock renderer. Anything
+    orjson does not natively encode (datetimes, decimals, lazy strings) is
+    handed to `encoder_class` as the stock renderer would, and data holding
+    floats orjson encodes differently is left to the stock renderer, which
+    rejects NaN and infinities under STRICT_JSON.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render `data` into JSON, returning a bytestring."""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or not can_use_orjson(
+            data, indent, self.ensure_ascii, self.compact
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.options
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits, let the stock encoder decide
+            return super().render(data, accepted_media_type, renderer_context)
+        # escape the same javascript line terminators as the stock renderer
+        return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class DocumentResponse(Response):
+    """A response whose data is already a JSON:API document.
+
+    JSONRenderer outputs the document as is, rather than building it from
+    serializer data.
+    """
+
+
+class JSONRenderer(json_api_renderers.JSONRenderer, ORJSONRenderer):
+    """Render JSON:API documents without the intermediate OrderedDict copies.
+
+    The stock renderer builds each resource object as an OrderedDict and
+    copies the attributes again to format their names. Plain dicts keep their
+    insertion order, so the rendered document is the same without the copies.
+    The documents of a DocumentResponse are output as is.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render the document, as is for a DocumentResponse."""
+        response = (renderer_context or {}).get("response")
+        if isinstance(response, DocumentResponse):
+            return ORJSONRenderer.render(
+                self, data, accepted_media_type, renderer_context
+            )
+        return super().render(data, accepted_media_type, renderer_context)
+
+    @classmethod
+    def extract_attributes(cls, fields, resource):
+        """Build the `attributes` object of the resource object."""
+        data = {}
+        for field_name, field in fields.items():
+            # ID is always provided in the root of JSON API so remove it from attributes
+            if field_name == "id" or field.write_only:
+                continue
+            if isinstance(field, (relations.RelatedField, relations.ManyRelatedField)):
+                continue
+            # skip read only fields missing from an empty serializer's data
+            if field_name not in resource and field.read_only:
+                continue
+            data[field_name] = resource.get(field_name)
+        if json_api_settings.FORMAT_FIELD_NAMES:
+            return utils.format_field_names(data)
+        return data
+
+    @classmethod
+    def build_json_resource_obj(  # pylint: disable=too-many-arguments
+        cls,
+        fields,
+        resource,
+        resource_instance,
+        resource_name,
+        serializer,
+        force_type_resolution=False,
+    ):
+        """Build the resource object (type, id, attributes) and relationships."""
+        # Determine type from the instance if the underlying model is polymorphic
+        if force_type_resolution:
+            resource_name = utils.get_resource_type_from_instance(resource_instance)
+        resource_data = {
+            "type": resource_name,
+            "id": encoding.force_str(resource_instance.pk)
+            if resource_instance
+            else None,
+            "attributes": cls.extract_attributes(fields, resource),
+        }
+        relationships = cls.extract_relationships(fields, resource, resource_instance)
+        if relationships:
+            resource_data["relationships"] = relationships
+        # Add 'self' link if field is present and valid
+        if api_settings.URL_FIELD_NAME in resource and isinstance(
+            fields[api_settings.URL_FIELD_NAME], relations.RelatedField
+        ):
+            resource_data["links"] = {"self": resource[api_settings.URL_FIELD_NAME]}
+        meta = cls.extract_meta(serializer, resource)
+        if meta:
+            resource_data["meta"] = utils.format_field_names(meta)
+        return resource_data
+
+    def render_stream(self, resources, links=None, meta=None, chunk_size=500):
+        """Yield the content of a list document, `chunk_size` resources at a time.
+
+        The content is the same as rendering the whole document at once, but
+        only one chunk of resources needs to be held in memory.
+        """
+        encode = super(json_api_renderers.JSONRenderer, self).render
+        # keep the member order the JSON:API renderer uses
+        start = b'{"links":' + encode(links) + b"," if links else b"{"
+        yield start + b'"data":['
+        resources = iter(resources)
+        separator = b""
+        while True:
+            chunk = b",".join(map(encode, islice(resources, chunk_size)))
+            if not chunk:
+                break
+            yield separator + chunk
+            separator = b","
+        yield b'],"meta":' + encode(meta) + b"}" if meta else b"]}"
+
+
+class RecordsRendererMixin:
+    """Render a record, or a list of records, from the rows `render_rows` yields."""
+
+    # provided by the renderer, yields the content of the header and each row
+    render_rows: Callable[[List[str], Iterator[List[Any]]], Iterable[bytes]]
+
+    def render(  # pylint: disable=unused-argument
+        self, data, accepted_media_type=None, renderer_context=None
+    ):
+        """Render the records, keyed by every key of any record."""
+        records = [data] if isinstance(data, dict) else data or []
+        header = list(dict.fromkeys(key for record in records for key in record))
+        rows = ([record.get(key) for key in header] for record in records)
+        return b"".join(self.render_rows(header, rows))
+
+
+class NDJSONRenderer(RecordsRendererMixin, renderers.BaseRenderer):
+    """Render records as newline delimited JSON, one object per line."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    # like JSON, NDJSON is always UTF-8
+    charset = None
+    json_renderer = ORJSONRenderer()
+
+    def render_rows(self, header, rows):
+        """Yield the line of each row, as an object keyed by the header."""
+        render = self.json_renderer.render
+        for row in rows:
+            yield render(dict(zip(header, row))) + b"\n"
+
+
+class CSVRenderer(RecordsRendererMixin, renderers.BaseRenderer):
+    """Render records as CSV, with a header line."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render_rows(self, header, rows):
+        """Yield the header line followed by the line of each row."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in chain([header], rows):
+            writer.writerow(row)
+            yield buffer.getvalue().encode(self.charset)
+            buffer.seek(0)
+            buffer.truncate()
@@ -19,6 +19,15 @@ scheme: Dict[str, Tuple[Type, Any]] = {
     "AXES_META_PRECEDENCE_ORDER": (tuple, ("HTTP_X_FORWARDED_FOR", "X_FORWARDED_FOR")),
     "SENTRY_ENABLED": (bool, True),
     "SENTRY_ENVIRONMENT": (str, "production"),
+    "PLAYER_MAP_DIR": (str, "/var/tmp/ratings_central"),
+    "RETAINED_VERSION_TTL": (int, 86400),
+    "IMPORT_MAX_REMOVED_SHARE": (float, 0.05),
+    "REPLICA_DATABASE_URLS": (list, []),
+    "REPLICA_CHECK_INTERVAL": (int, 5),
+    "PROFILE_SAMPLE_RATE": (float, 0.0),
+    "PROFILE_SLOW_THRESHOLD": (float, 1.0),
+    "SLOW_QUERY_THRESHOLD": (float, 0.5),
+    "SLOW_QUERY_BUFFER_SIZE": (int, 100),
 }
 
 if DEBUG:
@@ -75,6 +84,18 @@ CELERY_BROKER_URL = env("CELERY_BROKER_URL")
 # celery instances data is namespaced on the shared broker (probably redis)
 CELERY_TASK_DEFAULT_QUEUE = env.str("CELERY_TASK_DEFAULT_QUEUE")
 DATABASES = {"default": env.db_url(default=default_databse_url)}
+# read replicas of the default database, only read by the ratings views (see
+# ratings_central.routers)
+DATABASE_REPLICAS: List[str] = []
+for index, replica_url in enumerate(env("REPLICA_DATABASE_URLS")):
+    DATABASE_REPLICAS.append(f"replica{index}")
+    DATABASES[f"replica{index}"] = {
+        **env.db_url_config(replica_url),
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["ratings_central.routers.ReplicaRouter"]
+# seconds between the checks of the dataset version the replicas caught up to
+REPLICA_CHECK_INTERVAL = env("REPLICA_CHECK_INTERVAL")
 
 # Storage
 DEFAULT_FILE_STORAGE = "webapp.storage.MediaS3"
@@ -82,6 +103,15 @@ STATICFILES_STORAGE = "webapp.storage.StaticS3"
 
 AWS_S3_REGION_NAME = env("AWS_S3_REGION_NAME")
 AWS_STORAGE_BUCKET_NAME = env("AWS_STORAGE_BUCKET_NAME")
+# NOTE: The celery worker writes the player maps here and gunicorn maps them,
+# so both must share the directory, see PLAYER_MAP_DIR in README.md
+PLAYER_MAP_DIR = env("PLAYER_MAP_DIR")
+# seconds the lists of the previous dataset version are still served after an
+# import, so paging clients finish on the version they started on
+RETAINED_VERSION_TTL = env("RETAINED_VERSION_TTL")
+# imports removing a larger share of the players or clubs are aborted, as the
+# list is more likely truncated than that many rows removed
+IMPORT_MAX_REMOVED_SHARE = env("IMPORT_MAX_REMOVED_SHARE")
 
 INSTALLED_APPS = [
     # Project apps
@@ -108,11 +138,14 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "common.metrics.MetricsMiddleware",
+    "common.middleware.QueryTimingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "common.profiling.ProfilingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.security.SecurityMiddleware",
@@ -195,6 +228,19 @@ MAILGUN_API_KEY = env("MAILGUN_API_KEY")
 
 # Misc
 FRONTEND_URL = SITE_URL
+# collected when the metrics are scraped, see common.metrics
+METRICS_COLLECTORS = ["ratings_central.metrics.DatasetVersionCollector"]
+# the share of requests profiled, whose profiles are stored when they take at
+# least PROFILE_SLOW_THRESHOLD seconds, see common.profiling
+PROFILE_SAMPLE_RATE = env("PROFILE_SAMPLE_RATE")
+PROFILE_SLOW_THRESHOLD = env("PROFILE_SLOW_THRESHOLD")
+# seconds between the samples of a profiled request's stack
+PROFILE_INTERVAL = 0.005
+# the queries taking at least SLOW_QUERY_THRESHOLD seconds are captured with
+# their plan, the last SLOW_QUERY_BUFFER_SIZE of each worker being served by
+# the slow-queries endpoint, see common.slow_queries
+SLOW_QUERY_THRESHOLD = env("SLOW_QUERY_THRESHOLD")
+SLOW_QUERY_BUFFER_SIZE = env("SLOW_QUERY_BUFFER_SIZE")
 
 # Django-axes
 AXES_HANDLER = "axes.handlers.cache.AxesCacheHandler"
@@ -253,12 +299,12 @@ REST_FRAMEWORK = {
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
-    "DEFAULT_RENDERER_CLASSES": ["rest_framework_json_api.renderers.JSONRenderer"],
+    "DEFAULT_RENDERER_CLASSES": ["webapp.renderers.JSONRenderer"],
     "DEFAULT_METADATA_CLASS": "rest_framework_json_api.metadata.JSONAPIMetadata",
     "DEFAULT_FILTER_BACKENDS": [
         "rest_framework_json_api.filters.QueryParameterValidationFilter",
-        "rest_framework_json_api.filters.OrderingFilter",
-        "rest_framework_json_api.django_filters.DjangoFilterBackend",
+        "common.filters.OrderingFilter",
+        "common.filters.DjangoFilterBackend",
         "rest_framework.filters.SearchFilter",
     ],
     "SEARCH_PARAM": "filter[search]",
@@ -63,3 +63,30 @@ class MediaS3(s3boto3.S3Boto3Storage):  # pylint: disable=abstract-method
             else:
                 raise
         return bucket
+
+
+class PrivateS3(MediaS3):  # pylint: disable=abstract-method
+    """Storage for the objects only staff read, e.g. the request profiles.
+
+    The bucket policy only makes the objects under the assets prefix public.
+    """
+
+    location = "private"
+    default_acl = "private"
+    querystring_auth = True
+
+
+class VersionedMediaS3(MediaS3):  # pylint: disable=abstract-method
+    """Media storage for immutable objects under versioned keys.
+
+    Objects are never overwritten, so clients and CDNs may cache them forever.
+    """
+
+    file_overwrite = False
+
+    def get_object_parameters(self, name):
+        """Mark the object as cacheable forever."""
+        return {
+            "CacheControl": "public, max-age=31536000, immutable",
+            **super().get_object_parameters(name),
+        }
@@ -0,0 +1,87 @@
+"""Ensure the metrics of the requests are served to Prometheus."""
+import datetime
+import os
+import tempfile
+from unittest import mock
+
+from django.test import Client
+from django.utils import timezone
+from prometheus_client import REGISTRY
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central import models, player_maps
+
+
+class MetricsTestCase(BaseTestCase):
+    """Ensure the request, cache and dataset version metrics are exported."""
+
+    def get_metrics(self):
+        """Return the metrics served by the endpoint."""
+        response = Client().get("/metrics")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        return response.content.decode()
+
+    def test_requests(self):
+        """Each request's status, latency, size and database time are recorded."""
+        labels = {"method": "GET", "view": "players-list"}
+
+        def get_value(name, **extra_labels):
+            return REGISTRY.get_sample_value(name, {**labels, **extra_labels}) or 0
+
+        requests = get_value("http_requests_total", status="200")
+        durations = get_value("http_request_duration_seconds_count")
+        db_durations = get_value("http_request_db_duration_seconds_count")
+        sizes = get_value("http_response_size_bytes_sum")
+        response = self.get("/players/", asserted_status=status.HTTP_200_OK)
+        self.assertEqual(get_value("http_requests_total", status="200"), requests + 1)
+        self.assertEqual(
+            get_value("http_request_duration_seconds_count"), durations + 1
+        )
+        self.assertEqual(
+            get_value("http_request_db_duration_seconds_count"), db_durations + 1
+        )
+        self.assertEqual(
+            get_value("http_response_size_bytes_sum"), sizes + len(response.content)
+        )
+        self.assertEqual(
+            REGISTRY.get_sample_value("http_requests_in_flight", {"method": "GET"}), 0
+        )
+        self.assertIn(
+            'http_requests_total{method="GET",status="200"', self.get_metrics()
+        )
+
+    def test_map_lookups(self):
+        """The lookups falling back to the database are counted as misses."""
+        labels = {"map": player_maps.POINTER_NAME, "result": "miss"}
+        misses = REGISTRY.get_sample_value("ratings_central_map_lookups_total", labels)
+        with tempfile.TemporaryDirectory() as directory:
+            with self.settings(PLAYER_MAP_DIR=directory):
+                self.assertIsNone(player_maps.get_player_map())
+        self.assertEqual(
+            REGISTRY.get_sample_value("ratings_central_map_lookups_total", labels),
+            (misses or 0) + 1,
+        )
+
+    def test_dataset_version(self):
+        """The latest dataset version and its age are collected when scraped."""
+        self.assertNotIn("\nratings_central_dataset_version ", self.get_metrics())
+        dataset_version = models.DatasetVersion.objects.create(
+            completed=timezone.now() - datetime.timedelta(hours=1)
+        )
+        models.DatasetVersion.objects.create()
+        metrics = self.get_metrics()
+        self.assertIn(
+            f"\nratings_central_dataset_version {float(dataset_version.pk)}\n", metrics
+        )
+        self.assertRegex(metrics, r"\nratings_central_import_age_seconds 36\d\d\.")
+
+    def test_multiprocess(self):
+        """With a multiprocess directory, the workers' files are aggregated."""
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(os.environ, PROMETHEUS_MULTIPROC_DIR=directory):
+                metrics = self.get_metrics()
+        # this process does not write its metrics to the directory
+        self.assertNotIn("http_requests_total{", metrics)
+        self.assertIn("ratings_central_import_age_seconds", metrics)
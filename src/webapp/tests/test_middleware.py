@@ -0,0 +1,42 @@
+"""Ensure the queries of each request are reported."""
+from unittest import mock
+
+from rest_framework import status
+
+from common.test import BaseTestCase
+from ratings_central.views import DatasetVersionView, PlayerView
+
+
+class QueryTimingMiddlewareTestCase(BaseTestCase):
+    """Ensure the queries are counted, timed and checked against the budget."""
+
+    def test_server_timing(self):
+        """The count and duration of the queries are sent and logged."""
+        with self.assertLogs("common.middleware", "INFO") as logs:
+            response = self.get(
+                "/dataset-versions/", asserted_status=status.HTTP_200_OK
+            )
+        self.assertEqual(response.query_count, 1)
+        self.assertIsNone(response.query_budget)
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=\d+\.\d;desc="1 queries", total;dur=\d+\.\d$',
+        )
+        (record,) = logs.records
+        self.assertEqual(record.levelname, "INFO")
+        self.assertEqual(record.view, "dataset-versions-list")
+        self.assertEqual(record.query_count, 1)
+        self.assertEqual(record.status_code, status.HTTP_200_OK)
+
+    def test_budget(self):
+        """The requests exceeding their action's budget are logged and fail tests."""
+        budget = {"list": 0, "retrieve": 5}
+        with mock.patch.object(DatasetVersionView, "query_budget", budget, create=True):
+            with self.assertLogs("common.middleware", "WARNING"):
+                response = self.client.get("/dataset-versions/")
+            self.assertEqual(response.query_budget, 0)
+            with self.assertRaises(self.failureException):
+                self.assertWithinQueryBudget(response)
+        with mock.patch.object(PlayerView, "query_budget", 100):
+            response = self.get("/players/", asserted_status=status.HTTP_200_OK)
+        self.assertEqual(response.query_budget, 100)
@@ -0,0 +1,121 @@
+"""Ensure staff can profile live requests."""
+import time
+from unittest import mock
+
+from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from common import profiling
+from common.test import BaseTestCase
+from ratings_central import models
+from ratings_central.views import PlayerView
+from users.tests.factories import UserFactory
+
+
+def get_slow_queryset(view):  # pylint: disable=unused-argument
+    """Return the players after long enough to be sampled."""
+    time.sleep(0.05)
+    return models.Player.objects.all()
+
+
+@override_settings(PROFILE_INTERVAL=0.001)
+class ProfilingTestCase(BaseTestCase):
+    """Ensure the requested and sampled requests are profiled."""
+
+    def setUp(self):
+        """Save the profiles to a temporary directory and slow the players list."""
+        super().setUp()
+        self.storage = FileSystemStorage(location=self.get_temporary_directory())
+        for patcher in [
+            mock.patch.object(profiling, "get_storage", return_value=self.storage),
+            mock.patch.object(PlayerView, "get_queryset", get_slow_queryset),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.staff = UserFactory(is_staff=True, permission_codes=[profiling.PERMISSION])
+
+    def assertProfile(self, profile):  # pylint: disable=invalid-name
+        """Assert the profile holds the folded stacks of the slow queryset."""
+        lines = profile.splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            self.assertRegex(line, r"^\S+ \d+$")
+        self.assertIn(f"{__name__}:get_slow_queryset", profile)
+
+    def test_return(self):
+        """The profile replaces the response of a header or query param."""
+        self.client.force_login(self.staff)
+        for params, headers in [
+            ({}, {"HTTP_X_PROFILE": "return"}),
+            ({"profile": "return", "sort": "-rating"}, {}),
+        ]:
+            with self.subTest(params=params):
+                response = self.get(
+                    "/players/", params, asserted_status=status.HTTP_200_OK, **headers
+                )
+                self.assertEqual(response["Content-Type"], profiling.CONTENT_TYPE)
+                self.assertProfile(response.content.decode())
+
+    def test_store(self):
+        """The profile is stored and its key returned."""
+        self.client.force_login(self.staff)
+        response = self.get(
+            "/players/", asserted_status=status.HTTP_200_OK, HTTP_X_PROFILE="1"
+        )
+        self.assertIn("data", response.json())
+        key = response[profiling.RESPONSE_HEADER]
+        self.assertRegex(
+            key, r"^profiles/\d{4}-\d\d-\d\d/\d{6}-players-list-\w+\.folded$"
+        )
+        with self.storage.open(key) as fyl:
+            self.assertProfile(fyl.read().decode())
+
+    def test_forbidden(self):
+        """Only staff with the permission can profile."""
+        for user in [None, UserFactory(is_staff=True), UserFactory()]:
+            with self.subTest(user=user):
+                if user is not None:
+                    self.client.force_login(user)
+                response = self.get(
+                    "/players/",
+                    asserted_status=status.HTTP_200_OK,
+                    HTTP_X_PROFILE="return",
+                )
+                self.assertIn("data", response.json())
+                self.assertNotIn(profiling.RESPONSE_HEADER, response)
+        self.assertEqual(self.storage.listdir("")[1], [])
+
+    def test_token(self):
+        """Only the token of staff with the permission is profiled."""
+        for user, asserted_status, profiled in [
+            (self.staff, status.HTTP_200_OK, True),
+            (UserFactory(), status.HTTP_200_OK, False),
+            (None, status.HTTP_401_UNAUTHORIZED, False),
+        ]:
+            with self.subTest(user=user):
+                key = "invalid" if user is None else Token.objects.create(user=user)
+                response = self.get(
+                    "/players/",
+                    asserted_status=asserted_status,
+                    HTTP_X_PROFILE="return",
+                    HTTP_AUTHORIZATION=f"Token {key}",
+                )
+                self.assertEqual(
+                    response["Content-Type"] == profiling.CONTENT_TYPE, profiled
+                )
+
+    def test_sampling(self):
+        """The sampled requests are only stored when slow."""
+        with override_settings(PROFILE_SAMPLE_RATE=1, PROFILE_SLOW_THRESHOLD=60):
+            self.get("/players/", asserted_status=status.HTTP_200_OK)
+        self.assertEqual(self.storage.listdir(""), ([], []))
+        with override_settings(PROFILE_SAMPLE_RATE=1, PROFILE_SLOW_THRESHOLD=0):
+            self.get("/players/", asserted_status=status.HTTP_200_OK)
+        dates = self.storage.listdir("profiles")[0]
+        self.assertEqual(len(dates), 1)
+        names = self.storage.listdir(f"profiles/{dates[0]}")[1]
+        self.assertEqual(len(names), 1)
+        with self.storage.open(f"profiles/{dates[0]}/{names[0]}") as fyl:
+            self.assertProfile(fyl.read().decode())
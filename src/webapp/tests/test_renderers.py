@@ -0,0 +1,162 @@
+"""Ensure the project renderers output the same content as the stock renderers."""
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework import renderers as drf_renderers
+from rest_framework import status
+from rest_framework_json_api import renderers as json_api_renderers
+
+from common.test import BaseTestCase
+from ratings_central import views
+from ratings_central.tests import factories
+from webapp import renderers
+
+DATA = {
+    "string": 'Zoë \u2028 \u2029 \\ " 山田',
+    "integer": 12345678901234,
+    "float": 0.1,
+    "none": None,
+    "bool": False,
+    "date": date(2021, 5, 1),
+    "datetime": datetime(2021, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+    "decimal": Decimal("1.50"),
+    "lazy": gettext_lazy("lazy"),
+    "list": [1, "two", {"three": 3}],
+    1: "non string key",
+}
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    """Compare the orjson renderer with DRF's JSON renderer."""
+
+    def test_same_content(self):
+        """The orjson renderer outputs the same bytes as DRF's renderer."""
+        self.assertEqual(
+            renderers.ORJSONRenderer().render(DATA),
+            drf_renderers.JSONRenderer().render(DATA),
+        )
+
+    def test_unsupported(self):
+        """Data orjson cannot encode is left to DRF's renderer."""
+        data = {"huge": 2 ** 70}
+        self.assertEqual(
+            renderers.ORJSONRenderer().render(data),
+            drf_renderers.JSONRenderer().render(data),
+        )
+
+    def test_floats(self):
+        """Floats are written as by DRF's renderer, exponents included."""
+        data = {"floats": [0.0, -0.0, 0.1, 1e-4, 1e-5, -2.5e-7, 1e15, 1e16, -1.5e300]}
+        self.assertEqual(
+            renderers.ORJSONRenderer().render(data),
+            drf_renderers.JSONRenderer().render(data),
+        )
+
+    def test_non_finite(self):
+        """NaN and infinities are rejected, as by DRF's renderer."""
+        for value in [float("nan"), float("inf"), float("-inf")]:
+            with self.subTest(value=value):
+                data = {"list": [OrderedDict(value=value)]}
+                with self.assertRaises(ValueError):
+                    drf_renderers.JSONRenderer().render(data)
+                with self.assertRaises(ValueError):
+                    renderers.ORJSONRenderer().render(data)
+
+    def test_indent(self):
+        """Indented output is left to DRF's renderer."""
+        media_type = "application/json; indent=4"
+        self.assertEqual(
+            renderers.ORJSONRenderer().render(DATA, media_type),
+            drf_renderers.JSONRenderer().render(DATA, media_type),
+        )
+
+    def test_fallback(self):
+        """DRF's encoder is used when orjson is not installed."""
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(
+                renderers.ORJSONRenderer().render(DATA),
+                drf_renderers.JSONRenderer().render(DATA),
+            )
+
+    def test_none(self):
+        """No data renders no content."""
+        self.assertEqual(renderers.ORJSONRenderer().render(None), b"")
+
+
+class JSONRendererTestCase(BaseTestCase):
+    """Compare the JSON:API renderer with the stock JSON:API renderer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create players to render."""
+        super().setUpTestData()
+        factories.PlayerFactory.create_batch(size=3)
+        cls.player = factories.PlayerFactory(name="Zoë \u2028 Ćwikła", birth=None)
+
+    def get_content(self, path, params, renderer_class):
+        """Return the content of the response rendered by the renderer class."""
+        with mock.patch.object(views.PlayerView, "fast_read", False):
+            with mock.patch.object(
+                views.PlayerView, "renderer_classes", [renderer_class]
+            ):
+                response = self.get(path, params, asserted_status=None)
+        return response.status_code, response.content
+
+    def test_same_content(self):
+        """The renderer outputs the same bytes as the stock renderer."""
+        requests = [
+            ("/players/", {}),
+            ("/players/", {"page[size]": 2, "page[number]": 2}),
+            ("/players/", {"fields[players]": "name,birth"}),
+            ("/players/", {"filter[unknown]": "error"}),
+            (f"/players/{self.player.pk}/", {}),
+            ("/players/0/", {}),
+        ]
+        for path, params in requests:
+            with self.subTest(path=path, params=params):
+                self.assertEqual(
+                    self.get_content(path, params, renderers.JSONRenderer),
+                    self.get_content(path, params, json_api_renderers.JSONRenderer),
+                )
+
+    def test_document_response(self):
+        """The document of a DocumentResponse is output as is."""
+        document = {"data": [{"type": "players", "id": "1", "attributes": {}}]}
+        response = renderers.DocumentResponse(document)
+        self.assertEqual(
+            renderers.JSONRenderer().render(
+                document, renderer_context={"response": response}
+            ),
+            drf_renderers.JSONRenderer().render(document),
+        )
+
+    def test_default(self):
+        """The renderer is the default renderer."""
+        response = self.get("/players/", asserted_status=status.HTTP_200_OK)
+        self.assertIsInstance(response.accepted_renderer, renderers.JSONRenderer)
+
+
+class RecordsRendererTestCase(SimpleTestCase):
+    """Ensure records are rendered one per line."""
+
+    records = [{"id": 1, "name": 'Zoë, "Z"'}, {"id": 2, "birth": None}]
+
+    def test_ndjson(self):
+        """Each record is rendered as a JSON object on its own line."""
+        self.assertEqual(
+            renderers.NDJSONRenderer().render(self.records),
+            b'{"id":1,"name":"Zo\xc3\xab, \\"Z\\"","birth":null}\n'
+            b'{"id":2,"name":null,"birth":null}\n',
+        )
+
+    def test_csv(self):
+        """Each record is rendered as a CSV line after the header."""
+        self.assertEqual(
+            renderers.CSVRenderer().render(self.records),
+            'id,name,birth\r\n1,"Zoë, ""Z""",\r\n2,,\r\n'.encode(),
+        )
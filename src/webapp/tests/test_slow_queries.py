@@ -0,0 +1,77 @@
+"""Ensure the slow queries are captured with their plans."""
+from django.conf import settings
+from django.test import override_settings
+from rest_framework import status
+
+from common import slow_queries
+from common.test import BaseTestCase
+from users.tests.factories import UserFactory
+
+
+class SlowQueriesTestCase(BaseTestCase):
+    """Ensure the slow queries are captured and served to staff."""
+
+    def setUp(self):
+        """Start with an empty buffer."""
+        super().setUp()
+        slow_queries.captures.clear()
+        self.staff = UserFactory(is_staff=True, is_superuser=True)
+
+    def test_normalize_sql(self):
+        """The values and lists of values are replaced by placeholders."""
+        self.assertEqual(
+            slow_queries.normalize_sql(
+                "SELECT * FROM t\n  WHERE a = 'it''s' AND b IN (%s, %s, %s)"
+                " AND c_2 > 1.5 LIMIT 21"
+            ),
+            "SELECT * FROM t WHERE a = ? AND b IN (...) AND c_2 > ? LIMIT ?",
+        )
+
+    @override_settings(SLOW_QUERY_THRESHOLD=0)
+    def test_capture(self):
+        """The queries of a filtered list are captured with the request and plan."""
+        self.auth(self.staff)
+        params = {
+            "filter[roles__in]": settings.ADMINS_GROUP_NAME,
+            "filter[email]": "someone@example.com",
+            "page[size]": "5",
+        }
+        self.get("/users/", params, asserted_status=status.HTTP_200_OK)
+        captures = [
+            capture
+            for capture in slow_queries.captures
+            if "users_user_groups" in capture["sql"]
+        ]
+        self.assertTrue(captures)
+        self.assertNotIn("someone@example.com", str(list(slow_queries.captures)))
+        for capture in captures:
+            self.assertEqual(capture["view"], "users-list")
+            self.assertEqual(capture["method"], "GET")
+            # only the values of the parameters which don't identify anyone
+            self.assertEqual(
+                capture["params"],
+                {"filter[email]": "?", "filter[roles__in]": "?", "page[size]": "5"},
+            )
+            self.assertEqual(capture["database"], "default")
+            self.assertNotIn("%s", capture["sql"])
+            self.assertIn("users_user_groups", capture["plan"])
+        latest = slow_queries.captures[-1]
+        response = self.get("/slow-queries/", asserted_status=status.HTTP_200_OK)
+        data = response.json()["data"]
+        self.assertEqual(data[0]["type"], "slow-queries")
+        self.assertEqual(data[0]["id"], latest["id"])
+        self.assertEqual(data[0]["attributes"]["sql"], latest["sql"])
+        self.assertEqual(data[0]["attributes"]["plan"], latest["plan"])
+
+    def test_threshold(self):
+        """The queries faster than the threshold are not captured."""
+        self.auth(self.staff)
+        self.get("/users/", asserted_status=status.HTTP_200_OK)
+        self.assertEqual(len(slow_queries.captures), 0)
+
+    def test_forbidden(self):
+        """Only staff can read the slow queries."""
+        self.auth(None)
+        self.get("/slow-queries/", asserted_status=status.HTTP_401_UNAUTHORIZED)
+        self.auth(UserFactory())
+        self.get("/slow-queries/", asserted_status=status.HTTP_403_FORBIDDEN)
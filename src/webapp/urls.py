@@ -10,6 +10,8 @@ from rest_framework.viewsets import ViewSetMixin
 
 import ratings_central.views
 import users.views
+from common.metrics import metrics_view
+from common.slow_queries import SlowQueryView
 from webapp.views import schema_view
 
 # Add viewsets here. The first argument is the name and the URL regex
@@ -20,6 +22,12 @@ routes: List[Tuple[str, ViewSetMixin]] = [
     ("password-reset-confirmations", users.views.PasswordResetConfirmView),
     ("players", ratings_central.views.PlayerView),
     ("clubs", ratings_central.views.ClubView),
+    ("player-ratings", ratings_central.views.PlayerRatingView),
+    ("player-matches", ratings_central.views.PlayerMatchView),
+    ("rankings", ratings_central.views.RankingView),
+    ("statistics", ratings_central.views.StatisticsView),
+    ("dataset-versions", ratings_central.views.DatasetVersionView),
+    ("slow-queries", SlowQueryView),
 ]
 
 v1_router = DefaultRouter()
@@ -29,6 +37,8 @@ for regex, viewset in routes:
 
 
 urlpatterns = [
+    # only reachable from the internal network, see conf/nginx/default
+    path("metrics", metrics_view, name="metrics"),
     path(
         "backend/",
         include(
@@ -47,5 +57,5 @@ urlpatterns = [
                 path("django-admin/", admin.site.urls),
             ]
         ),
-    )
+    ),
 ]